@@ -1,10 +1,19 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import os
 from dotenv import load_dotenv
-from app.models.database import create_tables
+from app.metrics import instrument_engine, metrics_middleware, metrics_response
+from app.models.database import SessionLocal, engine, async_engine
 from app.routers.players import router as players_router
 from app.routers.predictions import router as predictions_router
+from app.routers.jobs import router as jobs_router
+from app.routers.stats import router as stats_router
+from app.routers.dashboard import router as dashboard_router
+from app.routers.scoring import router as scoring_router
+from app.serialization import add_compression
+from app.services.job_service import job_service
+from app.services.ranking_service import ranking_service
 
 # Load environment variables
 load_dotenv()
@@ -22,16 +31,45 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
-# Create database tables on startup
+# Compress larger responses; the browser revalidates cached reads with If-None-Match
+add_compression(app)
+
+# Request latency and per-request SQL statement metrics
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+app.middleware("http")(metrics_middleware)
+
+# Schema changes are applied with `alembic upgrade head` before the app starts, not here
 @app.on_event("startup")
 async def startup_event():
-    create_tables()
+    db = SessionLocal()
+    try:
+        # Backfill the materialized rankings if this database predates them
+        ranking_service.ensure_built(db)
+        
+        # Pick up jobs interrupted by a crash or restart
+        job_service.resume_incomplete_jobs(db)
+    finally:
+        db.close()
+    
+    # Keep picking them up while running, for jobs whose worker dies later
+    app.state.job_watcher = asyncio.create_task(job_service.watch_incomplete_jobs())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    app.state.job_watcher.cancel()
+    await async_engine.dispose()
 
 # Include routers
 app.include_router(players_router, prefix="/api")
 app.include_router(predictions_router, prefix="/api")
+app.include_router(jobs_router, prefix="/api")
+app.include_router(stats_router, prefix="/api")
+app.include_router(dashboard_router, prefix="/api")
+app.include_router(scoring_router, prefix="/api")
 
 @app.get("/")
 async def root():
@@ -41,6 +79,10 @@ async def root():
 async def health_check():
     return {"status": "healthy", "version": "1.0.0"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return metrics_response()
+
 @app.get("/api")
 async def api_root():
     return {"message": "FantasyEdge AI API v1.0.0", "docs": "/docs"}
\ No newline at end of file
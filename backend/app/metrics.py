@@ -0,0 +1,138 @@
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+from fastapi import Request, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, REGISTRY, generate_latest
+)
+from prometheus_client import multiprocess
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Label used for requests that did not match any route, to keep label cardinality bounded
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_LATENCY = Histogram(
+    "fantasyedge_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"]
+)
+
+REQUEST_DB_STATEMENTS = Histogram(
+    "fantasyedge_http_request_db_statements",
+    "SQL statements executed while serving one request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 25, 50, 100, 250, 500, 1000)
+)
+
+REQUEST_DB_SECONDS = Histogram(
+    "fantasyedge_http_request_db_seconds",
+    "Time spent executing SQL while serving one request",
+    ["route"]
+)
+
+DB_STATEMENTS = Counter(
+    "fantasyedge_db_statements_total",
+    "SQL statements executed, by statement type",
+    ["operation"]
+)
+
+DB_STATEMENT_DURATION = Histogram(
+    "fantasyedge_db_statement_duration_seconds",
+    "SQL statement execution time, by statement type",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+CACHE_REQUESTS = Counter(
+    "fantasyedge_cache_requests_total",
+    "Response cache lookups by namespace and result (hit ratio = hit / (hit + miss))",
+    ["namespace", "result"]
+)
+
+JOB_DURATION = Histogram(
+    "fantasyedge_job_duration_seconds",
+    "Background job run time by job type and final status",
+    ["job_type", "status"],
+    buckets=(0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+)
+
+JOBS_RUNNING = Gauge(
+    "fantasyedge_jobs_running",
+    "Background jobs currently running",
+    ["job_type"],
+    multiprocess_mode="livesum"
+)
+
+class RequestStats:
+    """SQL work attributed to the request being served"""
+
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+# Set by the middleware; threadpool calls inherit a copy of the context, so they
+# share the same RequestStats object
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+def instrument_engine(engine: Engine):
+    """Count and time every statement the engine executes"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+
+        DB_STATEMENTS.labels(operation).inc()
+        DB_STATEMENT_DURATION.labels(operation).observe(elapsed)
+
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.seconds += elapsed
+
+async def metrics_middleware(request: Request, call_next):
+    """Record latency and SQL work per route template"""
+    stats = RequestStats()
+    token = _request_stats.set(stats)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        _request_stats.reset(token)
+
+        # The router stores the matched route on the shared scope
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", UNMATCHED_ROUTE)
+
+        REQUEST_LATENCY.labels(request.method, route_path, str(status)).observe(elapsed)
+        REQUEST_DB_STATEMENTS.labels(route_path).observe(stats.statements)
+        REQUEST_DB_SECONDS.labels(route_path).observe(stats.seconds)
+
+def record_cache_lookup(key: str, hit: bool):
+    """Count a response cache lookup against its namespace"""
+    # Keys look like "<prefix>:<namespace>:v<version>:<name>:<params>"
+    parts = key.split(":", 2)
+    namespace = parts[1] if len(parts) > 2 else "unknown"
+    CACHE_REQUESTS.labels(namespace, "hit" if hit else "miss").inc()
+
+def metrics_response() -> Response:
+    """Render all metrics in the Prometheus text format"""
+    registry = REGISTRY
+    # Aggregate across worker processes when running under a multi-process server
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
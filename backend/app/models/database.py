@@ -1,4 +1,6 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, JSON, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, JSON, ForeignKey, Index
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
@@ -13,8 +15,44 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
-engine = create_engine(DATABASE_URL)
+# Connection pool settings, applied to both engines
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() != "false"
+
+# Async driver used for each database backend
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+def _async_database_url(url: str) -> str:
+    """Swap the sync driver in DATABASE_URL for its asyncio counterpart"""
+    url = make_url(url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)).render_as_string(
+        hide_password=False
+    )
+
+def _pool_options(url: str) -> dict:
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+    # SQLite picks its own pool class, which does not take size limits
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE
+        )
+    return options
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_database_url(DATABASE_URL)
+
+# Sync engine for background jobs, batch pipelines and schema management
+engine = create_engine(DATABASE_URL, **_pool_options(DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine for request handlers, so queries do not block the event loop
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_pool_options(ASYNC_DATABASE_URL))
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 class Player(Base):
@@ -22,7 +60,8 @@ class Player(Base):
     
     id = Column(String, primary_key=True)
     nfl_id = Column(String, unique=True, index=True)
-    name = Column(String, index=True)
+    # Never NULL; GET /players pages on (name, id)
+    name = Column(String, nullable=False, index=True)
     position = Column(String, index=True)
     team = Column(String, index=True)
     age = Column(Integer)
@@ -36,12 +75,20 @@ class Player(Base):
     # Relationships
     stats = relationship("PlayerStat", back_populates="player", cascade="all, delete-orphan")
     predictions = relationship("PlayerPrediction", back_populates="player", cascade="all, delete-orphan")
+    features = relationship("PlayerFeature", back_populates="player", cascade="all, delete-orphan")
+    simulations = relationship("PlayerSimulation", back_populates="player", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Keyset pagination order for GET /players
+        Index("ix_players_name_id", "name", "id"),
+        Index("ix_players_position_name_id", "position", "name", "id"),
+    )
 
 class PlayerStat(Base):
     __tablename__ = "player_stats"
     
     id = Column(String, primary_key=True)
-    player_id = Column(String, ForeignKey("players.id"), index=True)
+    player_id = Column(String, ForeignKey("players.id"))
     season = Column(Integer, index=True)
     week = Column(Integer)
     
@@ -71,32 +118,204 @@ class PlayerStat(Base):
     
     # Relationships
     player = relationship("Player", back_populates="stats")
+    
+    __table_args__ = (
+        # One stat line per player per week; also serves per-player history reads
+        Index("uq_player_stats_player_season_week", "player_id", "season", "week", unique=True),
+    )
 
 class PlayerPrediction(Base):
     __tablename__ = "player_predictions"
     
     id = Column(String, primary_key=True)
-    player_id = Column(String, ForeignKey("players.id"), index=True)
+    player_id = Column(String, ForeignKey("players.id"))
     season = Column(Integer, index=True)
     
     predicted_points = Column(Float)
     confidence = Column(Float)
-    reasoning = Column(String)
+    
+    # Coded reasoning factors, e.g. "young:24,strong_team"; rendered to text on request
+    reasoning_codes = Column(String)
+    
+    # Projected season stats; NULL where a stat is not projected for the position
+    projected_passing_yards = Column(Integer)
+    projected_passing_tds = Column(Integer)
+    projected_interceptions = Column(Integer)
+    projected_rushing_yards = Column(Integer)
+    projected_rushing_tds = Column(Integer)
+    projected_receptions = Column(Integer)
+    projected_receiving_yards = Column(Integer)
+    projected_receiving_tds = Column(Integer)
+    projected_targets = Column(Integer)
     
     # Prediction components
-    projected_stats = Column(JSON)
     breakout_score = Column(Float)
     bust_risk = Column(Float)
     
+    # Hash of the inputs the prediction was computed from
+    input_hash = Column(String)
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
     player = relationship("Player", back_populates="predictions")
+    
+    __table_args__ = (
+        # One prediction per player per season
+        Index("uq_player_predictions_player_season", "player_id", "season", unique=True),
+        # Prediction lists and exports, ordered by projected points
+        Index("ix_player_predictions_season_points", "season", predicted_points.desc(), "id"),
+        # Breakout candidates and min_breakout_score / min_confidence filters
+        Index("ix_player_predictions_season_breakout", "season", breakout_score.desc(), "id"),
+        Index("ix_player_predictions_season_confidence", "season", "confidence"),
+    )
+
+# Precomputed read models, rebuilt by RankingService after predictions or rosters change
+class PredictionRanking(Base):
+    __tablename__ = "prediction_rankings"
+    
+    season = Column(Integer, primary_key=True)
+    position = Column(String, primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    tier = Column(Integer)
+    
+    player_id = Column(String, ForeignKey("players.id"))
+    prediction_id = Column(String)
+    player_name = Column(String)
+    team = Column(String)
+    predicted_points = Column(Float)
+    confidence = Column(Float)
+    breakout_score = Column(Float)
+    reasoning_codes = Column(String)
+    
+    built_at = Column(DateTime, default=datetime.utcnow)
+
+class PredictionSummary(Base):
+    __tablename__ = "prediction_summaries"
+    
+    # position is "ALL" for the aggregate over every position
+    season = Column(Integer, primary_key=True)
+    position = Column(String, primary_key=True)
+    
+    total_predictions = Column(Integer)
+    avg_confidence = Column(Float)
+    high_confidence_count = Column(Integer)
+    breakout_candidates = Column(Integer)
+    bust_risks = Column(Integer)
+    
+    # Newest built_at is the prediction snapshot version, checked on every prediction read
+    built_at = Column(DateTime, default=datetime.utcnow, index=True)
 
-# Create all tables
-def create_tables():
-    Base.metadata.create_all(bind=engine)
+class PositionCount(Base):
+    __tablename__ = "position_counts"
+    
+    position = Column(String, primary_key=True)
+    player_count = Column(Integer)
+    
+    # Newest built_at is the roster version behind player ETags
+    built_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class PlayerSimulation(Base):
+    __tablename__ = "player_simulations"
+    
+    player_id = Column(String, ForeignKey("players.id"), primary_key=True)
+    season = Column(Integer, primary_key=True)
+    simulations = Column(Integer)
+    weeks_remaining = Column(Integer)
+    
+    # Weekly fantasy point distribution
+    floor = Column(Float)
+    median = Column(Float)
+    ceiling = Column(Float)
+    boom_probability = Column(Float)
+    bust_probability = Column(Float)
+    
+    # Rest-of-season totals
+    ros_mean = Column(Float)
+    ros_floor = Column(Float)
+    ros_ceiling = Column(Float)
+    
+    simulated_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Relationships
+    player = relationship("Player", back_populates="simulations")
+    
+    __table_args__ = (
+        # Simulation leaderboards, ordered by rest-of-season points
+        Index("ix_player_simulations_season_ros_mean", "season", ros_mean.desc(), "player_id"),
+    )
+
+class PlayerFeature(Base):
+    __tablename__ = "player_features"
+    
+    player_id = Column(String, ForeignKey("players.id"), primary_key=True)
+    season = Column(Integer, primary_key=True)
+    
+    # Player attributes
+    position = Column(String)
+    age = Column(Integer)
+    experience = Column(Integer)
+    
+    # Derived factors
+    team_strength = Column(Float)
+    age_prime = Column(Float)
+    breakout_window = Column(Float)
+    
+    # Historical features
+    avg_fantasy_points = Column(Float)
+    consistency_score = Column(Float)
+    trend_score = Column(Float)
+    ceiling_score = Column(Float)
+    
+    # Inputs changed after this time make the row stale
+    computed_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Relationships
+    player = relationship("Player", back_populates="features")
+
+class StatsLoadWatermark(Base):
+    __tablename__ = "stats_load_watermarks"
+    
+    # Last week of weekly stats loaded per season; reruns only load later weeks
+    season = Column(Integer, primary_key=True)
+    last_week = Column(Integer)
+    rows_loaded = Column(Integer, default=0)
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ScoringProfile(Base):
+    __tablename__ = "scoring_profiles"
+    
+    # Custom league scoring; the built-in profiles live in ScoringService
+    id = Column(String, primary_key=True)
+    name = Column(String)
+    
+    # Points per unit of each PlayerStat stat column; stats left out score zero
+    scoring = Column(JSON)
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class Job(Base):
+    __tablename__ = "jobs"
+    
+    id = Column(String, primary_key=True)
+    job_type = Column(String, index=True)
+    status = Column(String, index=True, default="queued")
+    params = Column(JSON)
+    
+    # Progress and resume point
+    total = Column(Integer, default=0)
+    processed = Column(Integer, default=0)
+    cursor = Column(String)
+    
+    result = Column(JSON)
+    error = Column(String)
+    
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
 
 # Database dependency
 def get_db():
@@ -104,4 +323,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# Async database dependency
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,66 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List
+from app.models.database import get_async_db
+from app.routers.predictions import PlayerPredictionResponse, PredictionSummaryResponse, scored_season
+from app.serialization import etag_matches, json_response, make_etag, not_modified
+from app.services.prediction_service import prediction_record, ranking_records
+from app.services.ranking_service import ranking_service, summary_record, ALL_POSITIONS
+from app.services.scoring_service import STANDARD_PROFILE
+from app.services.snapshot_service import snapshot_service
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+class PositionStatsResponse(BaseModel):
+    position: str
+    count: int
+
+class DashboardResponse(BaseModel):
+    season: int
+    summary: PredictionSummaryResponse
+    position_stats: List[PositionStatsResponse]
+    total_players: int
+    breakout_candidates: List[PlayerPredictionResponse]
+    rankings: Dict[str, List[dict]]
+
+# Empty path, so /api/dashboard is served without a trailing-slash redirect
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    request: Request,
+    season: int = Query(2025, description="Season year"),
+    min_breakout_score: float = Query(0.6, ge=0, le=1, description="Minimum breakout score"),
+    breakout_limit: int = Query(20, ge=0, le=50, description="Number of breakout candidates to return"),
+    rankings_limit: int = Query(10, ge=0, le=50, description="Players ranked per position"),
+    scoring_profile: str = Query(STANDARD_PROFILE, description="Scoring profile ID for predicted points"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Everything the dashboard page shows in one response: summary, position counts, breakouts and rankings"""
+    
+    # Predictions and rosters change independently; either one changes the response
+    snapshot = await snapshot_service.get()
+    etag = make_etag(request, f"{snapshot.version}|{await ranking_service.get_roster_version(db)}")
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    predictions = await scored_season(snapshot, season, scoring_profile)
+    summary = await ranking_service.get_summary(db, season, ALL_POSITIONS)
+    counts = await ranking_service.get_position_counts(db)
+    
+    # Breakouts and rankings are cuts of the same in-memory snapshot; no further queries
+    breakouts = predictions.query(min_breakout_score=min_breakout_score, sort_by='breakout_score', limit=breakout_limit)
+    
+    rankings = {}
+    for position in counts:
+        rows = predictions.query(position=position, limit=rankings_limit) if rankings_limit else []
+        if rows:
+            rankings[position] = ranking_records(rows)
+    
+    return json_response({
+        "season": season,
+        "summary": summary_record(summary),
+        "position_stats": [{"position": position, "count": count} for position, count in counts.items()],
+        "total_players": sum(counts.values()),
+        "breakout_candidates": [prediction_record(row) for row in breakouts],
+        "rankings": rankings
+    }, etag)
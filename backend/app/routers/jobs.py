@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.models.database import get_async_db
+from app.services.job_service import job_service
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+# Pydantic models for API responses
+class JobResponse(BaseModel):
+    id: str
+    job_type: str
+    status: str
+    total: int
+    processed: int
+    progress: float
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Get status and progress of a background job"""
+    job = await job_service.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return JobResponse(
+        id=job.id,
+        job_type=job.job_type,
+        status=job.status,
+        total=job.total or 0,
+        processed=job.processed or 0,
+        progress=round(job.processed / job.total, 3) if job.total else 0.0,
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at.isoformat(),
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None
+    )
@@ -1,13 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.models.database import get_db, Player
-from app.services.player_service import PlayerService, create_sample_players
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional, Tuple
+import base64
+import json
+from app.models.database import get_async_db, Player
+from app.serialization import etag_matches, json_response, make_etag, not_modified
+from app.services.player_service import PlayerService, create_sample_players, player_record
+from app.services.cache_service import cache_service
+from app.services.job_service import job_service
+from app.services.ranking_service import ranking_service
+from app.services.search_service import search_service
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/players", tags=["players"])
 player_service = PlayerService()
 
+# Most IDs accepted by one batch lookup
+BATCH_LIMIT = 100
+
 # Pydantic models for API responses
 class PlayerResponse(BaseModel):
     id: str
@@ -26,68 +37,181 @@ class PlayerResponse(BaseModel):
 
 class PlayersListResponse(BaseModel):
     players: List[PlayerResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     limit: int
+    next_cursor: Optional[str] = None
+
+def _encode_cursor(player: Player) -> str:
+    """Encode the (name, id) sort key of the last row into an opaque cursor"""
+    payload = json.dumps([player.name, player.id]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by _encode_cursor"""
+    try:
+        name, player_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return name, player_id
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def _get_position_counts(db: AsyncSession) -> Dict[str, int]:
+    """Player counts per position, cached until player data changes"""
+    cache_key = await cache_service.build_key("players", "position-counts")
+    cached = await cache_service.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Precomputed whenever the roster changes
+    counts = await ranking_service.get_position_counts(db)
+    await cache_service.set(cache_key, counts)
+    
+    return counts
 
 @router.get("/", response_model=PlayersListResponse)
 async def get_players(
+    request: Request,
     position: Optional[str] = Query(None, description="Filter by position (QB, RB, WR, TE, K, DST)"),
     search: Optional[str] = Query(None, description="Search players by name"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor; switches to keyset pagination"),
+    include_total: bool = Query(True, description="Include the total number of matching players"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get players with optional filtering and pagination"""
     
-    query = db.query(Player)
+    etag = make_etag(request, await ranking_service.get_roster_version(db))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    if search:
+        return json_response(await _search_players_page(db, search, position, page, limit, include_total), etag)
+    
+    query = select(Player)
     
     # Apply filters
     if position:
-        query = query.filter(Player.position == position.upper())
+        query = query.where(Player.position == position.upper())
     
-    if search:
-        query = query.filter(Player.name.ilike(f"%{search}%"))
+    # Get total count from the cached per-position counts
+    total = None
+    if include_total:
+        counts = await _get_position_counts(db)
+        total = counts.get(position.upper(), 0) if position else sum(counts.values())
+    
+    query = query.order_by(Player.name, Player.id)
     
-    # Get total count
-    total = query.count()
+    # Apply pagination; keyset when a cursor is given, offset otherwise
+    if cursor:
+        query = query.where(tuple_(Player.name, Player.id) > tuple_(*_decode_cursor(cursor)))
+        page = None
+    else:
+        query = query.offset((page - 1) * limit)
     
-    # Apply pagination
-    offset = (page - 1) * limit
-    players = query.offset(offset).limit(limit).all()
+    # Fetch one extra row to know whether there is a next page
+    players = list(await db.scalars(query.limit(limit + 1)))
+    next_cursor = _encode_cursor(players[limit - 1]) if len(players) > limit else None
     
-    return PlayersListResponse(
-        players=players,
-        total=total,
-        page=page,
-        limit=limit
-    )
+    return json_response({
+        'players': [player_record(player) for player in players[:limit]],
+        'total': total,
+        'page': page,
+        'limit': limit,
+        'next_cursor': next_cursor
+    }, etag)
+
+async def _search_players_page(
+    db: AsyncSession,
+    search: str,
+    position: Optional[str],
+    page: int,
+    limit: int,
+    include_total: bool
+) -> Dict:
+    """Page through ranked search results; these are ordered by match quality, not name"""
+    player_ids = await search_service.search_ids(db, search, position.upper() if position else None)
+    page_ids = player_ids[(page - 1) * limit:page * limit]
+    
+    players = {
+        player.id: player
+        for player in await db.scalars(select(Player).where(Player.id.in_(page_ids)))
+    }
+    
+    return {
+        'players': [player_record(players[player_id]) for player_id in page_ids if player_id in players],
+        'total': len(player_ids) if include_total else None,
+        'page': page,
+        'limit': limit,
+        'next_cursor': None
+    }
+
+@router.get("/search", response_model=List[PlayerResponse])
+async def search_players(
+    request: Request,
+    q: str = Query(..., min_length=1, description="Name or partial name; tolerates typos"),
+    position: Optional[str] = Query(None, description="Filter by position"),
+    limit: int = Query(10, ge=1, le=50, description="Number of matches to return"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Autocomplete players by name, best match first"""
+    etag = make_etag(request, await ranking_service.get_roster_version(db))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    players = await search_service.search_players(db, q, position.upper() if position else None, limit)
+    return json_response([player_record(player) for player in players], etag)
+
+@router.get("/batch", response_model=List[PlayerResponse])
+async def get_players_batch(
+    request: Request,
+    ids: str = Query(..., description="Comma-separated player IDs"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get several players in one request, in the order requested; unknown IDs are skipped"""
+    player_ids = list(dict.fromkeys(player_id for player_id in ids.split(",") if player_id))
+    if len(player_ids) > BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_LIMIT} IDs per request")
+    
+    etag = make_etag(request, await ranking_service.get_roster_version(db))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    players = await player_service.get_players_by_ids(db, player_ids)
+    return json_response([player_record(player) for player in players], etag)
 
 @router.get("/{player_id}", response_model=PlayerResponse)
-async def get_player(player_id: str, db: Session = Depends(get_db)):
+async def get_player(request: Request, player_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get a specific player by ID"""
+    etag = make_etag(request, await ranking_service.get_roster_version(db))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
     player = await player_service.get_player_by_id(db, player_id)
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
-    return player
+    return json_response(player_record(player), etag)
 
-@router.post("/fetch-current")
-async def fetch_current_players(db: Session = Depends(get_db)):
-    """Fetch current NFL players from external API and save to database"""
+@router.post("/fetch-current", status_code=202)
+async def fetch_current_players(db: AsyncSession = Depends(get_async_db)):
+    """Queue a fetch of current NFL players; poll /jobs/{job_id} for progress"""
     try:
-        players = await player_service.fetch_current_players(db)
+        job = await job_service.submit(db, "fetch_players")
         return {
-            "message": f"Successfully fetched {len(players)} players",
-            "count": len(players)
+            "message": "Queued player fetch",
+            "job_id": job.id,
+            "status": job.status
         }
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching players: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error queuing player fetch: {str(e)}")
 
 @router.post("/create-sample")
-async def create_sample_data(db: Session = Depends(get_db)):
+async def create_sample_data(db: AsyncSession = Depends(get_async_db)):
     """Create sample player data for development"""
     try:
         players = await create_sample_players(db)
+        await db.run_sync(ranking_service.rebuild_position_counts)
+        await cache_service.invalidate("players")
         return {
             "message": f"Created {len(players)} sample players",
             "players": [{"id": p.id, "name": p.name, "position": p.position} for p in players]
@@ -96,16 +220,15 @@ async def create_sample_data(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error creating sample data: {str(e)}")
 
 @router.get("/positions/stats")
-async def get_position_stats(db: Session = Depends(get_db)):
+async def get_position_stats(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get player count by position"""
-    from sqlalchemy import func
+    etag = make_etag(request, await ranking_service.get_roster_version(db))
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
-    stats = db.query(
-        Player.position,
-        func.count(Player.id).label('count')
-    ).group_by(Player.position).all()
+    counts = await _get_position_counts(db)
     
-    return {
-        "position_stats": [{"position": stat.position, "count": stat.count} for stat in stats],
-        "total_players": sum(stat.count for stat in stats)
-    }
\ No newline at end of file
+    return json_response({
+        "position_stats": [{"position": position, "count": count} for position, count in counts.items()],
+        "total_players": sum(counts.values())
+    }, etag)
\ No newline at end of file
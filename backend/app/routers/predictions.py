@@ -1,8 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.models.database import get_db, PlayerPrediction, Player
-from app.services.prediction_service import PredictionService
+import asyncio
+import csv
+import io
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, Dict, List, Optional
+import numpy as np
+from app.models.database import get_async_db, SessionLocal
+from app.serialization import dumps, etag_matches, json_response, make_etag, not_modified
+from app.services.prediction_service import PredictionService, PROJECTED_STATS, prediction_record, ranking_records, render_reasoning
+from app.services.job_service import job_service
+from app.services.ranking_service import ranking_service, summary_record, ALL_POSITIONS
+from app.services.scoring_service import scoring_service, STANDARD_PROFILE
+from app.services.simulation_service import simulation_service
+from app.services.snapshot_service import snapshot_service, PredictionSnapshot, SeasonSnapshot
 from pydantic import BaseModel
 import logging
 
@@ -11,6 +23,23 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/predictions", tags=["predictions"])
 prediction_service = PredictionService()
 
+# Most player IDs accepted by one batch lookup
+BATCH_LIMIT = 100
+
+# Rows encoded per chunk of an export stream
+EXPORT_BATCH_SIZE = 1000
+
+# Column order of CSV exports; projected stats are flattened into their own columns
+EXPORT_CSV_FIELDS = [
+    'rank', 'id', 'player_id', 'player_name', 'player_position', 'player_team', 'season',
+    'predicted_points', 'confidence', 'breakout_score', 'bust_risk', 'reasoning',
+    *PROJECTED_STATS, 'created_at'
+]
+
+# Prediction lists can be ordered by predicted points or any projected stat
+SORT_FIELDS = ['predicted_points', *PROJECTED_STATS]
+SORT_PATTERN = f"^({'|'.join(SORT_FIELDS)})$"
+
 # Pydantic models for API responses
 class ProjectedStatsResponse(BaseModel):
     passing_yards: Optional[int] = None
@@ -33,7 +62,7 @@ class PlayerPredictionResponse(BaseModel):
     season: int
     predicted_points: float
     confidence: float
-    reasoning: str
+    reasoning: Optional[str] = None
     projected_stats: Optional[dict] = None
     breakout_score: float
     bust_risk: float
@@ -42,6 +71,24 @@ class PlayerPredictionResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class PlayerSimulationResponse(BaseModel):
+    player_id: str
+    player_name: str
+    player_position: str
+    player_team: str
+    season: int
+    simulations: int
+    weeks_remaining: int
+    floor: float
+    median: float
+    ceiling: float
+    boom_probability: float
+    bust_probability: float
+    ros_mean: float
+    ros_floor: float
+    ros_ceiling: float
+    simulated_at: str
+
 class PredictionSummaryResponse(BaseModel):
     total_predictions: int
     avg_confidence: float
@@ -49,104 +96,184 @@ class PredictionSummaryResponse(BaseModel):
     breakout_candidates: int
     bust_risks: int
 
+async def scored_season(snapshot: PredictionSnapshot, season: int, scoring_profile: str) -> SeasonSnapshot:
+    """A season of the snapshot with predicted points under a scoring profile; 404 for an unknown profile"""
+    predictions = snapshot.season(season)
+    if scoring_profile == STANDARD_PROFILE:
+        return predictions
+    
+    try:
+        weights = await scoring_service.get_weights(scoring_profile)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    return predictions.scored(scoring_profile, weights)
+
 @router.get("/", response_model=List[PlayerPredictionResponse])
 async def get_predictions(
+    request: Request,
     season: Optional[int] = Query(2025, description="Season year"),
     position: Optional[str] = Query(None, description="Filter by position"),
     min_confidence: Optional[float] = Query(None, ge=0, le=1, description="Minimum confidence threshold"),
     min_breakout_score: Optional[float] = Query(None, ge=0, le=1, description="Minimum breakout score"),
-    limit: int = Query(50, ge=1, le=100, description="Number of predictions to return"),
-    db: Session = Depends(get_db)
+    sort_by: str = Query("predicted_points", pattern=SORT_PATTERN, description="predicted_points or a projected stat"),
+    include_reasoning: bool = Query(False, description="Render the reasoning text"),
+    scoring_profile: str = Query(STANDARD_PROFILE, description="Scoring profile ID for predicted points"),
+    limit: int = Query(50, ge=1, le=100, description="Number of predictions to return")
 ):
     """Get player predictions with filtering options"""
     
-    query = db.query(PlayerPrediction).join(Player).filter(
-        PlayerPrediction.season == season
+    snapshot = await snapshot_service.get()
+    etag = make_etag(request, snapshot.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    predictions = await scored_season(snapshot, season, scoring_profile)
+    rows = predictions.query(
+        position.upper() if position else None, min_confidence, min_breakout_score, sort_by, limit
     )
     
-    # Apply filters
-    if position:
-        query = query.filter(Player.position == position.upper())
-    
-    if min_confidence is not None:
-        query = query.filter(PlayerPrediction.confidence >= min_confidence)
-    
-    if min_breakout_score is not None:
-        query = query.filter(PlayerPrediction.breakout_score >= min_breakout_score)
-    
-    predictions = query.limit(limit).all()
-    
-    # Format response
-    result = []
-    for pred in predictions:
-        result.append(PlayerPredictionResponse(
-            id=pred.id,
-            player_id=pred.player_id,
-            player_name=pred.player.name,
-            player_position=pred.player.position,
-            player_team=pred.player.team,
-            season=pred.season,
-            predicted_points=pred.predicted_points,
-            confidence=pred.confidence,
-            reasoning=pred.reasoning,
-            projected_stats=pred.projected_stats,
-            breakout_score=pred.breakout_score,
-            bust_risk=pred.bust_risk,
-            created_at=pred.created_at.isoformat()
-        ))
-    
-    return result
+    return json_response([prediction_record(row, include_reasoning) for row in rows], etag)
+
+async def _stream_predictions(
+    predictions: SeasonSnapshot,
+    selected: np.ndarray,
+    export_format: str,
+    include_reasoning: bool
+) -> AsyncIterator[bytes]:
+    """Encode the selected snapshot rows one batch at a time"""
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+    
+    for start in range(0, len(selected), EXPORT_BATCH_SIZE):
+        rows = [predictions.record(i) for i in selected[start:start + EXPORT_BATCH_SIZE]]
+        
+        if export_format == "ndjson":
+            lines = [
+                dumps({'rank': rank, **prediction_record(row, include_reasoning)})
+                for rank, row in enumerate(rows, start=start + 1)
+            ]
+            yield b"\n".join(lines) + b"\n"
+            continue
+        
+        for rank, row in enumerate(rows, start=start + 1):
+            record = prediction_record(row, include_reasoning)
+            record['rank'] = rank
+            record.update(record.pop('projected_stats'))
+            writer.writerow(record)
+        
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    
+    # Header only, for an empty export
+    if export_format == "csv" and buffer.tell():
+        yield buffer.getvalue().encode()
+
+@router.get("/export")
+async def export_predictions(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    season: int = Query(2025, description="Season year"),
+    position: Optional[str] = Query(None, description="Filter by position"),
+    min_confidence: Optional[float] = Query(None, ge=0, le=1, description="Minimum confidence threshold"),
+    min_breakout_score: Optional[float] = Query(None, ge=0, le=1, description="Minimum breakout score"),
+    sort_by: str = Query("predicted_points", pattern=SORT_PATTERN, description="predicted_points or a projected stat"),
+    include_reasoning: bool = Query(False, description="Render the reasoning text"),
+    scoring_profile: str = Query(STANDARD_PROFILE, description="Scoring profile ID for predicted points")
+):
+    """Stream every matching prediction, ranked by predicted points or a projected stat"""
+    
+    # The snapshot is immutable, so the stream reads a consistent set of rows without holding a session
+    predictions = await scored_season(await snapshot_service.get(), season, scoring_profile)
+    selected = predictions.select(position.upper() if position else None, min_confidence, min_breakout_score, sort_by)
+    
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    filename = f"predictions_{season}{'_' + position.upper() if position else ''}.{format}"
+    
+    return StreamingResponse(
+        _stream_predictions(predictions, selected, format, include_reasoning),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 @router.get("/player/{player_id}", response_model=PlayerPredictionResponse)
 async def get_player_prediction(
+    request: Request,
     player_id: str, 
     season: int = Query(2025, description="Season year"),
-    db: Session = Depends(get_db)
+    scoring_profile: str = Query(STANDARD_PROFILE, description="Scoring profile ID for predicted points")
 ):
     """Get prediction for a specific player"""
     
-    prediction = db.query(PlayerPrediction).join(Player).filter(
-        PlayerPrediction.player_id == player_id,
-        PlayerPrediction.season == season
-    ).first()
+    snapshot = await snapshot_service.get()
+    etag = make_etag(request, snapshot.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
-    if not prediction:
+    predictions = await scored_season(snapshot, season, scoring_profile)
+    row = predictions.get(player_id)
+    
+    if not row:
         raise HTTPException(status_code=404, detail="Prediction not found")
     
-    return PlayerPredictionResponse(
-        id=prediction.id,
-        player_id=prediction.player_id,
-        player_name=prediction.player.name,
-        player_position=prediction.player.position,
-        player_team=prediction.player.team,
-        season=prediction.season,
-        predicted_points=prediction.predicted_points,
-        confidence=prediction.confidence,
-        reasoning=prediction.reasoning,
-        projected_stats=prediction.projected_stats,
-        breakout_score=prediction.breakout_score,
-        bust_risk=prediction.bust_risk,
-        created_at=prediction.created_at.isoformat()
-    )
+    return json_response(prediction_record(row), etag)
+
+def _generate_prediction_sync(player_id: str, season: int, force: bool) -> Dict:
+    """Run the sync-Session prediction pipeline on its own session and event loop"""
+    db = SessionLocal()
+    try:
+        prediction = asyncio.run(prediction_service.generate_player_prediction(db, player_id, season, force))
+        ranking_service.rebuild(db, season)
+        snapshot_service.invalidate()
+        return {
+            "prediction_id": prediction.id,
+            "predicted_points": prediction.predicted_points,
+            "confidence": prediction.confidence
+        }
+    finally:
+        db.close()
+
+@router.get("/batch", response_model=List[PlayerPredictionResponse])
+async def get_predictions_batch(
+    request: Request,
+    player_ids: str = Query(..., description="Comma-separated player IDs"),
+    season: int = Query(2025, description="Season year"),
+    include_reasoning: bool = Query(False, description="Render the reasoning text"),
+    scoring_profile: str = Query(STANDARD_PROFILE, description="Scoring profile ID for predicted points")
+):
+    """Get predictions for several players in one request; players without one are skipped"""
+    
+    ids = list(dict.fromkeys(player_id for player_id in player_ids.split(",") if player_id))
+    if len(ids) > BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_LIMIT} player IDs per request")
+    
+    snapshot = await snapshot_service.get()
+    etag = make_etag(request, snapshot.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    predictions = await scored_season(snapshot, season, scoring_profile)
+    rows = predictions.get_many(ids)
+    
+    return json_response([prediction_record(row, include_reasoning) for row in rows], etag)
 
 @router.post("/generate/{player_id}")
 async def generate_player_prediction(
     player_id: str,
     season: int = Query(2025, description="Season year"),
-    db: Session = Depends(get_db)
+    force: bool = Query(False, description="Recompute even if the player's inputs are unchanged")
 ):
     """Generate a new prediction for a specific player"""
     
     try:
-        prediction = await prediction_service.generate_player_prediction(
-            db, player_id, season
-        )
+        # Feature refresh and scoring are pandas work on the sync engine; keep them off the event loop
+        prediction = await run_in_threadpool(_generate_prediction_sync, player_id, season, force)
         
         return {
             "message": f"Generated prediction for player {player_id}",
-            "prediction_id": prediction.id,
-            "predicted_points": prediction.predicted_points,
-            "confidence": prediction.confidence
+            **prediction
         }
         
     except ValueError as e:
@@ -155,63 +282,152 @@ async def generate_player_prediction(
         logger.error(f"Error generating prediction: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating prediction: {str(e)}")
 
-@router.post("/generate-all")
+@router.post("/generate-all", status_code=202)
 async def generate_all_predictions(
     season: int = Query(2025, description="Season year"),
-    db: Session = Depends(get_db)
+    force: bool = Query(False, description="Rebuild every prediction instead of only changed players"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Queue prediction regeneration for all players; poll /jobs/{job_id} for progress"""
+    
+    try:
+        job = await job_service.submit(db, "generate_predictions", {"season": season, "force": force})
+        
+        return {
+            "message": f"Queued prediction generation for season {season}",
+            "season": season,
+            "job_id": job.id,
+            "status": job.status
+        }
+        
+    except Exception as e:
+        logger.error(f"Error queuing prediction generation: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error queuing prediction generation: {str(e)}")
+
+@router.post("/train-model", status_code=202)
+async def train_model(db: AsyncSession = Depends(get_async_db)):
+    """Queue training of a new prediction model on PlayerStat history"""
+    
+    try:
+        job = await job_service.submit(db, "train_model")
+        
+        return {
+            "message": "Queued model training",
+            "job_id": job.id,
+            "status": job.status
+        }
+        
+    except Exception as e:
+        logger.error(f"Error queuing model training: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error queuing model training: {str(e)}")
+
+@router.post("/simulate", status_code=202)
+async def simulate_season(
+    season: int = Query(2025, description="Season year"),
+    simulations: Optional[int] = Query(None, ge=100, le=100000, description="Simulated seasons per player"),
+    workers: Optional[int] = Query(None, ge=0, le=32, description="Worker processes; 0 simulates in the job itself"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Generate predictions for all players"""
+    """Queue a Monte Carlo simulation of the rest of the season; poll /jobs/{job_id} for progress"""
     
     try:
-        predictions = await prediction_service.generate_all_predictions(db, season)
+        job = await job_service.submit(db, "simulate_season", {
+            "season": season, "simulations": simulations, "workers": workers
+        })
         
         return {
-            "message": f"Generated predictions for {len(predictions)} players",
+            "message": f"Queued season simulation for {season}",
             "season": season,
-            "predictions_created": len(predictions)
+            "job_id": job.id,
+            "status": job.status
         }
         
     except Exception as e:
-        logger.error(f"Error generating predictions: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error generating predictions: {str(e)}")
+        logger.error(f"Error queuing season simulation: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error queuing season simulation: {str(e)}")
+
+@router.get("/simulations", response_model=List[PlayerSimulationResponse])
+async def get_simulations(
+    request: Request,
+    season: int = Query(2025, description="Season year"),
+    position: Optional[str] = Query(None, description="Filter by position"),
+    limit: int = Query(50, ge=1, le=100, description="Number of players to return"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get simulated floor, ceiling, boom/bust odds and rest-of-season totals"""
+    
+    etag = make_etag(request, await simulation_service.get_version(db, season))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    rows = await simulation_service.get_simulations(db, season, position.upper() if position else None, limit)
+    
+    return json_response([
+        {
+            'player_id': row.PlayerSimulation.player_id,
+            'player_name': row.player_name,
+            'player_position': row.player_position,
+            'player_team': row.player_team,
+            'season': row.PlayerSimulation.season,
+            'simulations': row.PlayerSimulation.simulations,
+            'weeks_remaining': row.PlayerSimulation.weeks_remaining,
+            'floor': row.PlayerSimulation.floor,
+            'median': row.PlayerSimulation.median,
+            'ceiling': row.PlayerSimulation.ceiling,
+            'boom_probability': row.PlayerSimulation.boom_probability,
+            'bust_probability': row.PlayerSimulation.bust_probability,
+            'ros_mean': row.PlayerSimulation.ros_mean,
+            'ros_floor': row.PlayerSimulation.ros_floor,
+            'ros_ceiling': row.PlayerSimulation.ros_ceiling,
+            'simulated_at': row.PlayerSimulation.simulated_at.isoformat()
+        }
+        for row in rows
+    ], etag)
+
+@router.get("/snapshot")
+async def get_snapshot_info():
+    """Get the version of the in-memory prediction snapshot serving reads"""
+    snapshot = await snapshot_service.get()
+    
+    return {
+        "version": snapshot.version,
+        "loaded_at": snapshot.loaded_at.isoformat(),
+        "seasons": {season: data.size for season, data in sorted(snapshot.seasons.items())}
+    }
+
+@router.get("/model")
+async def get_model_info():
+    """Get the version and metrics of the model serving predictions"""
+    metadata = prediction_service.model_service.get_metadata()
+    
+    if not metadata:
+        return {"model": None, "mode": "rule-based"}
+    
+    return {"model": metadata, "mode": "trained"}
 
 @router.get("/breakout-candidates", response_model=List[PlayerPredictionResponse])
 async def get_breakout_candidates(
+    request: Request,
     season: int = Query(2025, description="Season year"),
     min_score: float = Query(0.6, ge=0, le=1, description="Minimum breakout score"),
     limit: int = Query(20, ge=1, le=50, description="Number of candidates to return"),
-    db: Session = Depends(get_db)
+    include_reasoning: bool = Query(False, description="Render the reasoning text"),
+    scoring_profile: str = Query(STANDARD_PROFILE, description="Scoring profile ID for predicted points")
 ):
     """Get players with high breakout potential"""
     
+    snapshot = await snapshot_service.get()
+    etag = make_etag(request, snapshot.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    # Outside the try so an unknown profile stays a 404
+    predictions = await scored_season(snapshot, season, scoring_profile)
+    
     try:
-        candidates = await prediction_service.get_breakout_candidates(
-            db, season, min_score
-        )
-        
-        # Sort by breakout score descending
-        candidates.sort(key=lambda x: x.breakout_score, reverse=True)
-        candidates = candidates[:limit]
-        
-        result = []
-        for pred in candidates:
-            result.append(PlayerPredictionResponse(
-                id=pred.id,
-                player_id=pred.player_id,
-                player_name=pred.player.name,
-                player_position=pred.player.position,
-                player_team=pred.player.team,
-                season=pred.season,
-                predicted_points=pred.predicted_points,
-                confidence=pred.confidence,
-                reasoning=pred.reasoning,
-                projected_stats=pred.projected_stats,
-                breakout_score=pred.breakout_score,
-                bust_risk=pred.bust_risk,
-                created_at=pred.created_at.isoformat()
-            ))
+        candidates = predictions.query(min_breakout_score=min_score, sort_by='breakout_score', limit=limit)
         
-        return result
+        return json_response([prediction_record(row, include_reasoning) for row in candidates], etag)
         
     except Exception as e:
         logger.error(f"Error getting breakout candidates: {str(e)}")
@@ -219,30 +435,24 @@ async def get_breakout_candidates(
 
 @router.get("/summary", response_model=PredictionSummaryResponse)
 async def get_predictions_summary(
+    request: Request,
     season: int = Query(2025, description="Season year"),
-    db: Session = Depends(get_db)
+    position: Optional[str] = Query(None, description="Limit the summary to one position"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get summary statistics for predictions"""
     
     try:
-        from sqlalchemy import func
+        # Summaries are rebuilt with the snapshot version, so it identifies them too
+        snapshot = await snapshot_service.get()
+        etag = make_etag(request, snapshot.version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
         
-        # Get basic stats
-        stats = db.query(
-            func.count(PlayerPrediction.id).label('total'),
-            func.avg(PlayerPrediction.confidence).label('avg_confidence'),
-            func.count().filter(PlayerPrediction.confidence >= 0.8).label('high_confidence'),
-            func.count().filter(PlayerPrediction.breakout_score >= 0.6).label('breakout_candidates'),
-            func.count().filter(PlayerPrediction.bust_risk >= 0.5).label('bust_risks')
-        ).filter(PlayerPrediction.season == season).first()
+        # Precomputed at the end of each prediction run
+        stats = await ranking_service.get_summary(db, season, position.upper() if position else ALL_POSITIONS)
         
-        return PredictionSummaryResponse(
-            total_predictions=stats.total or 0,
-            avg_confidence=round(stats.avg_confidence or 0, 3),
-            high_confidence_count=stats.high_confidence or 0,
-            breakout_candidates=stats.breakout_candidates or 0,
-            bust_risks=stats.bust_risks or 0
-        )
+        return json_response(summary_record(stats), etag)
         
     except Exception as e:
         logger.error(f"Error getting prediction summary: {str(e)}")
@@ -250,34 +460,48 @@ async def get_predictions_summary(
 
 @router.get("/position-rankings/{position}")
 async def get_position_rankings(
+    request: Request,
     position: str,
     season: int = Query(2025, description="Season year"),
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=100, description="Number of players to rank"),
+    include_reasoning: bool = Query(False, description="Render the reasoning text"),
+    scoring_profile: str = Query(STANDARD_PROFILE, description="Scoring profile ID for predicted points"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get players ranked by predicted points for a specific position"""
     
-    predictions = db.query(PlayerPrediction).join(Player).filter(
-        Player.position == position.upper(),
-        PlayerPrediction.season == season
-    ).order_by(PlayerPrediction.predicted_points.desc()).limit(50).all()
+    # Rankings are rebuilt with the snapshot version, so it identifies them too
+    snapshot = await snapshot_service.get()
+    etag = make_etag(request, snapshot.version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
-    if not predictions:
-        raise HTTPException(status_code=404, detail=f"No predictions found for position {position}")
+    if scoring_profile == STANDARD_PROFILE:
+        # Materialized with rank and tier at the end of each prediction run
+        rows = await ranking_service.get_rankings(db, season, position.upper(), limit=limit)
+        result = []
+        for row in rows:
+            reasoning = render_reasoning(row.reasoning_codes, row.position, row.team) if include_reasoning else None
+            result.append({
+                "rank": row.rank,
+                "tier": row.tier,
+                "player_name": row.player_name,
+                "team": row.team,
+                "predicted_points": row.predicted_points,
+                "confidence": row.confidence,
+                "breakout_score": row.breakout_score,
+                "reasoning": reasoning[:100] + "..." if reasoning and len(reasoning) > 100 else reasoning
+            })
+    else:
+        # Other profiles reorder players, so rank the rescored snapshot
+        predictions = await scored_season(snapshot, season, scoring_profile)
+        result = ranking_records(predictions.query(position=position.upper(), limit=limit), include_reasoning)
     
-    result = []
-    for rank, pred in enumerate(predictions, 1):
-        result.append({
-            "rank": rank,
-            "player_name": pred.player.name,
-            "team": pred.player.team,
-            "predicted_points": pred.predicted_points,
-            "confidence": pred.confidence,
-            "breakout_score": pred.breakout_score,
-            "reasoning": pred.reasoning[:100] + "..." if len(pred.reasoning) > 100 else pred.reasoning
-        })
+    if not result:
+        raise HTTPException(status_code=404, detail=f"No predictions found for position {position}")
     
-    return {
+    return json_response({
         "position": position.upper(),
         "season": season,
         "rankings": result
-    }
\ No newline at end of file
+    }, etag)
\ No newline at end of file
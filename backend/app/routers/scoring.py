@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List
+from app.models.database import get_async_db
+from app.services.scoring_service import scoring_service
+from pydantic import BaseModel, Field
+
+router = APIRouter(prefix="/scoring-profiles", tags=["scoring"])
+
+# Pydantic models for API requests and responses
+class ScoringProfileCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    # Points per unit of each PlayerStat stat, e.g. {"receptions": 0.5, "passing_tds": 6}
+    scoring: Dict[str, float]
+
+class ScoringProfileResponse(BaseModel):
+    id: str
+    name: str
+    scoring: Dict[str, float]
+    builtin: bool
+    # Weighted stats predictions don't project; they count in /stats/points but not in rescored predictions
+    unprojected_stats: List[str]
+
+@router.get("/", response_model=List[ScoringProfileResponse])
+async def get_scoring_profiles(db: AsyncSession = Depends(get_async_db)):
+    """Get the built-in and custom scoring profiles"""
+    return await scoring_service.list_profiles(db)
+
+@router.get("/{profile_id}", response_model=ScoringProfileResponse)
+async def get_scoring_profile(profile_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Get one scoring profile"""
+    profile = await scoring_service.get_profile(db, profile_id)
+
+    if not profile:
+        raise HTTPException(status_code=404, detail="Scoring profile not found")
+
+    return profile
+
+@router.post("/", response_model=ScoringProfileResponse, status_code=201)
+async def create_scoring_profile(body: ScoringProfileCreate, db: AsyncSession = Depends(get_async_db)):
+    """Create a custom league scoring profile; pass its id as scoring_profile on prediction reads"""
+    try:
+        return await scoring_service.create_profile(db, body.name, body.scoring)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,94 @@
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import os
+import shutil
+import uuid
+from app.models.database import get_async_db
+from app.services.job_service import job_service
+from app.services.scoring_service import scoring_service, STANDARD_PROFILE
+from app.services.stats_service import stats_service
+from pydantic import BaseModel
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+# Uploaded stats files wait here for the ingest job; must be shared with the worker
+STATS_INBOX_DIR = os.getenv("STATS_INBOX_DIR", os.path.join("artifacts", "stats"))
+
+SUPPORTED_FORMATS = ("csv", "json", "ndjson", "jsonl")
+
+# Pydantic models for API responses
+class WatermarkResponse(BaseModel):
+    season: int
+    last_week: Optional[int]
+    rows_loaded: int
+    updated_at: Optional[str] = None
+
+class SeasonPointsResponse(BaseModel):
+    player_id: str
+    player_name: str
+    position: Optional[str] = None
+    team: Optional[str] = None
+    games: int
+    fantasy_points: float
+    points_per_game: float
+
+@router.post("/ingest", status_code=202)
+async def ingest_stats(
+    file: UploadFile = File(...),
+    force: bool = Query(False, description="Reload weeks at or before the season's watermark"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Queue a load of a weekly box-score file; poll /jobs/{job_id} for progress"""
+    file_format = os.path.splitext(file.filename or "")[1].lstrip(".").lower()
+    if file_format not in SUPPORTED_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Stats files must be one of: {', '.join(SUPPORTED_FORMATS)}")
+
+    os.makedirs(STATS_INBOX_DIR, exist_ok=True)
+    path = os.path.join(STATS_INBOX_DIR, f"{uuid.uuid4()}.{file_format}")
+    with open(path, "wb") as out:
+        # Uploads can be large; copy them off the event loop
+        await run_in_threadpool(shutil.copyfileobj, file.file, out)
+
+    try:
+        job = await job_service.submit(db, "ingest_stats", {"path": path, "format": file_format, "force": force})
+        return {
+            "message": f"Queued stats load of {file.filename}",
+            "job_id": job.id,
+            "status": job.status
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error queuing stats load: {str(e)}")
+
+@router.get("/watermarks", response_model=List[WatermarkResponse])
+async def get_watermarks(db: AsyncSession = Depends(get_async_db)):
+    """Last loaded week per season"""
+    watermarks = await db.run_sync(stats_service.get_watermarks)
+    return [
+        WatermarkResponse(
+            season=watermark.season,
+            last_week=watermark.last_week,
+            rows_loaded=watermark.rows_loaded or 0,
+            updated_at=watermark.updated_at.isoformat() if watermark.updated_at else None
+        )
+        for watermark in watermarks
+    ]
+
+@router.get("/points", response_model=List[SeasonPointsResponse])
+async def get_season_points(
+    season: int = Query(2025, description="Season year"),
+    position: Optional[str] = Query(None, description="Filter by position"),
+    scoring_profile: str = Query(STANDARD_PROFILE, description="Scoring profile ID"),
+    limit: int = Query(50, ge=1, le=500, description="Number of players to return"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Season fantasy points scored from loaded PlayerStat lines under any scoring profile"""
+    try:
+        weights = await scoring_service.get_weights(scoring_profile)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return await db.run_sync(
+        stats_service.get_season_points, season, weights, position.upper() if position else None, limit
+    )
@@ -0,0 +1,55 @@
+import hashlib
+import os
+from typing import Any, Optional
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from starlette.middleware.gzip import GZipMiddleware
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # brotli is a compiled extra; gzip alone still works everywhere
+    BrotliMiddleware = None
+
+# Responses smaller than this are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+def dumps(data: Any) -> bytes:
+    """Encode a response body with orjson"""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+def make_etag(request: Request, version: Optional[str]) -> str:
+    """Weak ETag for a data version and the exact URL it was rendered for"""
+    digest = hashlib.sha1(f"{version}|{request.url.path}?{request.url.query}".encode()).hexdigest()
+    # Weak, since the compression middleware changes the bytes on the wire
+    return f'W/"{digest[:20]}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client already holds this version of the response"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=_cache_headers(etag))
+
+def json_response(data: Any, etag: Optional[str] = None, status_code: int = 200) -> Response:
+    """Serialize straight to bytes, skipping response_model validation"""
+    return Response(
+        content=dumps(data),
+        status_code=status_code,
+        media_type="application/json",
+        headers=_cache_headers(etag) if etag else None
+    )
+
+def add_compression(app: FastAPI):
+    """Brotli for clients that accept it when available, gzip otherwise"""
+    if BrotliMiddleware is not None:
+        app.add_middleware(BrotliMiddleware, minimum_size=COMPRESSION_MIN_SIZE, gzip_fallback=True)
+    else:
+        app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
+
+def _cache_headers(etag: str) -> dict:
+    # no-cache still stores the response but revalidates with If-None-Match on every use
+    return {"ETag": etag, "Cache-Control": "no-cache"}
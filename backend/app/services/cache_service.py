@@ -0,0 +1,180 @@
+import asyncio
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+import redis.asyncio as aioredis
+import logging
+
+from app.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Set to "false" to bypass response caching entirely (e.g. when benchmarking the database path)
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() != "false"
+
+# Prefix for every key this service writes
+KEY_PREFIX = "fantasyedge"
+
+# Seconds to wait before trying Redis again after a failure
+REDIS_RETRY_INTERVAL = 30.0
+
+class LRUCache:
+    """In-process LRU cache with per-entry TTLs"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class CacheService:
+    """Response cache backed by Redis, falling back to an in-process LRU"""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        default_ttl: float = 300.0,
+        max_local_entries: int = 1024,
+        enabled: Optional[bool] = None
+    ):
+        self.enabled = RESPONSE_CACHE_ENABLED if enabled is None else enabled
+        self.redis_url = redis_url or REDIS_URL
+        self.default_ttl = default_ttl
+        self.local = LRUCache(max_local_entries)
+        self.local_versions: Dict[str, int] = {}
+        # asyncio Redis connections are bound to the loop that opened them, and
+        # background jobs run on their own loop, so keep one client per loop
+        self._redis_clients = weakref.WeakKeyDictionary()
+        self._redis_retry_at = 0.0
+
+    def _get_redis(self):
+        """Return a Redis client, or None while Redis is unconfigured or marked down"""
+        if not self.redis_url or time.monotonic() < self._redis_retry_at:
+            return None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        client = self._redis_clients.get(loop)
+        if client is None:
+            client = aioredis.from_url(
+                self.redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5
+            )
+            self._redis_clients[loop] = client
+        return client
+
+    def _mark_redis_down(self, error: Exception):
+        logger.warning(f"Redis unavailable, using in-process cache: {str(error)}")
+        self._redis_clients = weakref.WeakKeyDictionary()
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+
+    async def get_version(self, namespace: str) -> int:
+        """Get the current data version for a namespace"""
+        client = self._get_redis()
+        if client is not None:
+            try:
+                version = await client.get(f"{KEY_PREFIX}:version:{namespace}")
+                return int(version or 0)
+            except Exception as e:
+                self._mark_redis_down(e)
+
+        return self.local_versions.get(namespace, 0)
+
+    async def invalidate(self, *namespaces: str):
+        """Bump namespace versions so existing entries are no longer addressed"""
+        for namespace in namespaces:
+            self.local_versions[namespace] = self.local_versions.get(namespace, 0) + 1
+
+            client = self._get_redis()
+            if client is not None:
+                try:
+                    await client.incr(f"{KEY_PREFIX}:version:{namespace}")
+                except Exception as e:
+                    self._mark_redis_down(e)
+
+        # Local entries may have been written under a Redis version, so drop them all
+        self.local.clear()
+
+    async def build_key(self, namespace: str, name: str, **params) -> str:
+        """Build a versioned cache key covering the endpoint and its filters"""
+        version = await self.get_version(namespace)
+        query = urlencode(sorted((key, value) for key, value in params.items() if value is not None))
+        return f"{KEY_PREFIX}:{namespace}:v{version}:{name}:{query}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value"""
+        if not self.enabled:
+            return None
+
+        value = None
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                value = await client.get(key)
+            except Exception as e:
+                self._mark_redis_down(e)
+                value = self.local.get(key)
+        else:
+            value = self.local.get(key)
+
+        record_cache_lookup(key, value is not None)
+        if value is None:
+            return None
+        return json.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Cache a JSON-serializable value"""
+        if not self.enabled:
+            return
+
+        ttl = ttl or self.default_ttl
+        payload = json.dumps(value, default=str)
+
+        client = self._get_redis()
+        if client is not None:
+            try:
+                await client.set(key, payload, ex=int(ttl))
+                return
+            except Exception as e:
+                self._mark_redis_down(e)
+
+        self.local.set(key, payload, ttl)
+
+cache_service = CacheService()
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import numpy as np
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+from sqlalchemy import and_, exists, insert, or_
+from sqlalchemy.orm import Session
+import logging
+
+from app.models.database import Player, PlayerStat, PlayerFeature
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Baseline fantasy points for players without history
+POSITION_BASELINES = {
+    'QB': 16.5,
+    'RB': 10.8,
+    'WR': 9.2,
+    'TE': 6.8,
+    'K': 7.0,
+    'DST': 7.5
+}
+
+# Peak ages by position
+POSITION_PEAK_AGES = {
+    'QB': 29,
+    'RB': 25,
+    'WR': 27,
+    'TE': 28,
+    'K': 30,
+    'DST': 27
+}
+
+# Typical breakout years by position
+POSITION_BREAKOUT_YEARS = {
+    'QB': [2, 3, 4],
+    'RB': [1, 2],
+    'WR': [2, 3],
+    'TE': [3, 4, 5],
+    'K': [],
+    'DST': []
+}
+
+# Simplified team rankings (in reality, this would be updated annually)
+STRONG_OFFENSES = ['BUF', 'KC', 'SF', 'MIA', 'CIN', 'DAL', 'PHI']
+WEAK_OFFENSES = ['NYJ', 'NE', 'WAS', 'CAR', 'CHI']
+
+# Columns stored per player and season
+FEATURE_COLUMNS = [
+    'position', 'age', 'experience',
+    'team_strength', 'age_prime', 'breakout_window',
+    'avg_fantasy_points', 'consistency_score', 'trend_score', 'ceiling_score'
+]
+
+# Player IDs per IN (...) list
+FEATURE_CHUNK_SIZE = 500
+
+class FeatureService:
+    """Persisted per-player, per-season feature store"""
+    
+    async def get_features(
+        self, 
+        db: Session, 
+        season: int, 
+        player_ids: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Get features indexed by player ID, refreshing stale rows first"""
+        import pandas as pd
+        
+        await self.refresh_features(db, season, player_ids)
+        
+        query = db.query(PlayerFeature.player_id, *[getattr(PlayerFeature, c) for c in FEATURE_COLUMNS]).filter(
+            PlayerFeature.season == season
+        )
+        
+        if player_ids is None:
+            rows = query.all()
+        else:
+            rows = []
+            for chunk in self._chunks(player_ids):
+                rows.extend(query.filter(PlayerFeature.player_id.in_(chunk)).all())
+        
+        features = pd.DataFrame(rows, columns=['player_id'] + FEATURE_COLUMNS).set_index('player_id')
+        
+        if player_ids is not None:
+            features = features.reindex(player_ids)
+        return features
+    
+    async def refresh_features(
+        self, 
+        db: Session, 
+        season: int, 
+        player_ids: Optional[List[str]] = None, 
+        force: bool = False
+    ) -> int:
+        """Recompute features for players whose attributes or earlier-season stats changed since the last refresh"""
+        import pandas as pd
+        
+        # Taken before reading inputs so rows written meanwhile are caught next time
+        computed_at = datetime.utcnow()
+        
+        stale_ids = self._find_stale_player_ids(db, season, player_ids, force)
+        if not stale_ids:
+            return 0
+        
+        players = []
+        stats = []
+        for chunk in self._chunks(stale_ids):
+            players.extend(db.query(
+                Player.id, Player.position, Player.team, Player.age, Player.experience
+            ).filter(Player.id.in_(chunk)).all())
+            # Only seasons before the keyed one, as in model training; a season can't see its own results
+            stats.extend(db.query(
+                PlayerStat.player_id, PlayerStat.fantasy_points
+            ).filter(
+                PlayerStat.player_id.in_(chunk),
+                PlayerStat.season < season
+            ).order_by(PlayerStat.season, PlayerStat.week).all())
+        
+        players_df = pd.DataFrame(players, columns=['id', 'position', 'team', 'age', 'experience'])
+        stats_df = pd.DataFrame(stats, columns=['player_id', 'fantasy_points'])
+        
+        features = self.calculate_features(players_df, stats_df)
+        rows = [
+            {**row, 'player_id': player_id, 'season': season, 'computed_at': computed_at}
+            for player_id, row in zip(players_df['id'], features.to_dict('records'))
+        ]
+        
+        # Replace the stale rows in one transaction
+        for chunk in self._chunks(stale_ids):
+            db.query(PlayerFeature).filter(
+                PlayerFeature.season == season,
+                PlayerFeature.player_id.in_(chunk)
+            ).delete(synchronize_session=False)
+        db.execute(insert(PlayerFeature), rows)
+        db.commit()
+        
+        logger.info(f"Refreshed features for {len(rows)} players for season {season}")
+        return len(rows)
+    
+    def _find_stale_player_ids(
+        self, 
+        db: Session, 
+        season: int, 
+        player_ids: Optional[List[str]], 
+        force: bool
+    ) -> List[str]:
+        """Players with no feature row, or whose player row or earlier-season stat rows are newer than it"""
+        query = db.query(Player.id)
+        
+        if not force:
+            query = query.outerjoin(PlayerFeature, and_(
+                PlayerFeature.player_id == Player.id,
+                PlayerFeature.season == season
+            )).filter(or_(
+                PlayerFeature.player_id.is_(None),
+                Player.updated_at > PlayerFeature.computed_at,
+                exists().where(
+                    PlayerStat.player_id == Player.id,
+                    PlayerStat.season < season,
+                    PlayerStat.created_at > PlayerFeature.computed_at
+                )
+            ))
+        
+        if player_ids is None:
+            return [row.id for row in query.all()]
+        
+        stale_ids = []
+        for chunk in self._chunks(player_ids):
+            stale_ids.extend(row.id for row in query.filter(Player.id.in_(chunk)).all())
+        return stale_ids
+    
+    def _chunks(self, ids: List[str]):
+        for start in range(0, len(ids), FEATURE_CHUNK_SIZE):
+            yield ids[start:start + FEATURE_CHUNK_SIZE]
+    
+    def calculate_features(self, players: pd.DataFrame, stats: pd.DataFrame) -> pd.DataFrame:
+        """Compute features for a frame of players from their stat rows (vectorized)"""
+        import pandas as pd
+        
+        raw_age = players['age'].fillna(0).astype(int).to_numpy()
+        raw_experience = players['experience'].fillna(0).astype(int).to_numpy()
+        position = players['position']
+        
+        features = pd.DataFrame(index=players.index)
+        features['age'] = np.where(raw_age != 0, raw_age, 25)
+        features['experience'] = raw_experience
+        features['position'] = position.to_numpy()
+        
+        # Team factors
+        features['team_strength'] = np.select(
+            [players['team'].isin(STRONG_OFFENSES), players['team'].isin(WEAK_OFFENSES)],
+            [1.15, 0.9],
+            default=1.0
+        )
+        
+        # Age curve factors
+        peak_age = position.map(POSITION_PEAK_AGES).fillna(27).to_numpy()
+        features['age_prime'] = np.where(
+            raw_age == 0,
+            1.0,
+            np.where(
+                raw_age <= peak_age,
+                np.minimum(1.2, 1.0 + (peak_age - raw_age) * 0.02),
+                np.maximum(0.7, 1.0 - (raw_age - peak_age) * 0.04)
+            )
+        )
+        
+        # Experience factors
+        breakout_window = np.ones(len(players))
+        for pos, years in POSITION_BREAKOUT_YEARS.items():
+            if not years:
+                continue
+            in_position = (position == pos).to_numpy() & (raw_experience != 0)
+            breakout_window[in_position & np.isin(raw_experience, years)] = 1.3
+            breakout_window[in_position & (raw_experience == max(years) + 1)] = 1.1
+        features['breakout_window'] = breakout_window
+        
+        # Historical features; zero and missing fantasy points are ignored
+        points = stats[stats['fantasy_points'].fillna(0) != 0]
+        history = points.groupby('player_id')['fantasy_points'].agg(
+            ['mean', 'max', 'first', 'last', 'count']
+        )
+        history['std'] = points.groupby('player_id')['fantasy_points'].std(ddof=0)
+        history = history.reindex(players['id']).astype(float)
+        
+        mean = history['mean'].to_numpy()
+        has_points = ~np.isnan(mean)
+        has_rows = players['id'].isin(stats['player_id']).to_numpy()
+        positive = has_points & (mean > 0)
+        safe_mean = np.where(positive, mean, 1.0)
+        
+        # Players without any stat rows get the positional baseline; players with rows
+        # but no usable points fall back to the neutral defaults
+        features['avg_fantasy_points'] = np.where(
+            has_points,
+            mean,
+            np.where(has_rows, 0.0, position.map(POSITION_BASELINES).fillna(8.0).to_numpy())
+        )
+        features['consistency_score'] = np.where(
+            positive, 1.0 - history['std'].to_numpy() / safe_mean, 0.5
+        )
+        features['trend_score'] = np.where(
+            has_points,
+            np.where(
+                (history['count'].to_numpy() > 1) & (history['last'].to_numpy() > history['first'].to_numpy()),
+                0.6,
+                0.4
+            ),
+            0.5
+        )
+        features['ceiling_score'] = np.where(
+            positive,
+            history['max'].to_numpy() / safe_mean,
+            np.where(has_points, 1.0, 0.5)
+        )
+        
+        return features
+
+feature_service = FeatureService()
@@ -0,0 +1,270 @@
+import asyncio
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from sqlalchemy import or_, and_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import logging
+
+from app.metrics import JOB_DURATION, JOBS_RUNNING
+from app.models.database import SessionLocal, Job, Player
+from app.services.cache_service import cache_service
+from app.services.model_service import model_service
+from app.services.player_service import PlayerService
+from app.services.prediction_service import PredictionService
+from app.services.ranking_service import ranking_service
+from app.services.simulation_service import simulation_service
+from app.services.snapshot_service import snapshot_service
+from app.services.stats_service import stats_service
+
+logger = logging.getLogger(__name__)
+
+# "inprocess" runs jobs on a background thread, "celery" hands them to the worker
+JOB_EXECUTOR = os.getenv("JOB_EXECUTOR", "inprocess")
+
+# Rows processed between progress checkpoints
+JOB_CHUNK_SIZE = 500
+
+# A running job without a checkpoint for this long is assumed to have crashed
+STALE_JOB_SECONDS = 300
+
+# How often each API process looks for crashed jobs to resume, not just at startup
+JOB_RESCAN_SECONDS = float(os.getenv("JOB_RESCAN_SECONDS", STALE_JOB_SECONDS))
+
+class JobService:
+    """Service for queuing and running long-running background jobs"""
+    
+    def __init__(self, executor: Optional[str] = None):
+        self.executor = executor or JOB_EXECUTOR
+        self.player_service = PlayerService()
+        self.prediction_service = PredictionService()
+        self.handlers = {
+            'generate_predictions': self._run_generate_predictions,
+            'fetch_players': self._run_fetch_players,
+            'train_model': self._run_train_model,
+            'ingest_stats': self._run_ingest_stats,
+            'simulate_season': self._run_simulate_season
+        }
+        self._pool = None
+    
+    async def submit(self, db: AsyncSession, job_type: str, params: Optional[Dict] = None) -> Job:
+        """Create a queued job and hand it to the executor"""
+        if job_type not in self.handlers:
+            raise ValueError(f"Unknown job type {job_type}")
+        
+        job = Job(
+            id=str(uuid.uuid4()),
+            job_type=job_type,
+            status="queued",
+            params=params or {},
+            total=0,
+            processed=0
+        )
+        db.add(job)
+        await db.commit()
+        
+        self._dispatch(job.id)
+        return job
+    
+    async def get_job(self, db: AsyncSession, job_id: str) -> Optional[Job]:
+        """Get a job by ID"""
+        return await db.get(Job, job_id)
+    
+    def resume_incomplete_jobs(self, db: Session) -> int:
+        """Re-dispatch queued jobs and running jobs whose worker has gone away"""
+        stale_before = datetime.utcnow() - timedelta(seconds=STALE_JOB_SECONDS)
+        
+        jobs = db.query(Job.id).filter(or_(
+            Job.status == "queued",
+            and_(Job.status == "running", Job.updated_at < stale_before)
+        )).all()
+        
+        for job in jobs:
+            self._dispatch(job.id)
+        
+        if jobs:
+            logger.info(f"Resumed {len(jobs)} incomplete jobs")
+        return len(jobs)
+    
+    async def watch_incomplete_jobs(self, interval: Optional[float] = None):
+        """Resume crashed jobs every interval, so a dead worker's jobs don't wait for a restart"""
+        while True:
+            await asyncio.sleep(JOB_RESCAN_SECONDS if interval is None else interval)
+            try:
+                await asyncio.to_thread(self._resume_incomplete_jobs)
+            except Exception as e:
+                logger.error(f"Error resuming incomplete jobs: {str(e)}")
+    
+    def _resume_incomplete_jobs(self) -> int:
+        db = SessionLocal()
+        try:
+            return self.resume_incomplete_jobs(db)
+        finally:
+            db.close()
+    
+    def _dispatch(self, job_id: str):
+        """Send a job to the configured executor"""
+        if self.executor == "celery":
+            from app.worker import run_job_task
+            run_job_task.delay(job_id)
+            return
+        
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jobs")
+        self._pool.submit(asyncio.run, self.run_job(job_id))
+    
+    async def run_job(self, job_id: str):
+        """Claim and run a job to completion, resuming from its last checkpoint"""
+        db = SessionLocal()
+        try:
+            job = self._claim_job(db, job_id)
+            if not job:
+                return
+            
+            start = time.perf_counter()
+            JOBS_RUNNING.labels(job.job_type).inc()
+            try:
+                result = await self.handlers[job.job_type](db, job)
+                job.status = "completed"
+                job.result = result
+                
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Job {job_id} ({job.job_type}) failed: {str(e)}")
+                job.status = "failed"
+                job.error = str(e)
+                
+            finally:
+                JOBS_RUNNING.labels(job.job_type).dec()
+            
+            # Time for this run only; a resumed job reports each attempt separately
+            JOB_DURATION.labels(job.job_type, job.status).observe(time.perf_counter() - start)
+            job.finished_at = datetime.utcnow()
+            db.commit()
+        finally:
+            db.close()
+    
+    def _claim_job(self, db: Session, job_id: str) -> Optional[Job]:
+        """Atomically mark a job as running so only one executor picks it up"""
+        now = datetime.utcnow()
+        stale_before = now - timedelta(seconds=STALE_JOB_SECONDS)
+        
+        claimed = db.query(Job).filter(
+            Job.id == job_id,
+            or_(
+                Job.status == "queued",
+                and_(Job.status == "running", Job.updated_at < stale_before)
+            )
+        ).update({
+            'status': "running",
+            'started_at': func.coalesce(Job.started_at, now),
+            'updated_at': now
+        }, synchronize_session=False)
+        db.commit()
+        
+        if not claimed:
+            return None
+        return db.query(Job).filter(Job.id == job_id).first()
+    
+    def _checkpoint(self, db: Session, job: Job, **changes):
+        """Persist progress; also serves as the job's heartbeat"""
+        for key, value in changes.items():
+            setattr(job, key, value)
+        job.updated_at = datetime.utcnow()
+        db.commit()
+    
+    async def _run_generate_predictions(self, db: Session, job: Job) -> Dict:
+        """Regenerate changed predictions in chunks of players ordered by ID"""
+        season = job.params.get('season') or self.prediction_service.current_season
+        force = job.params.get('force', False)
+        result = job.result or {'season': season, 'created': 0, 'updated': 0, 'unchanged': 0}
+        
+        if not job.total:
+            self._checkpoint(db, job, total=db.query(func.count(Player.id)).scalar())
+        
+        while True:
+            query = db.query(Player.id).order_by(Player.id)
+            if job.cursor:
+                query = query.filter(Player.id > job.cursor)
+            
+            player_ids = [row.id for row in query.limit(JOB_CHUNK_SIZE)]
+            if not player_ids:
+                break
+            
+            counts = await self.prediction_service.generate_predictions_for_players(
+                db, player_ids, season, force
+            )
+            
+            result = {**result, **{key: result.get(key, 0) + value for key, value in counts.items()}}
+            self._checkpoint(
+                db, job,
+                cursor=player_ids[-1],
+                processed=job.processed + len(player_ids),
+                result=result
+            )
+        
+        ranking_service.rebuild(db, season)
+        snapshot_service.invalidate()
+        return result
+    
+    async def _run_fetch_players(self, db: Session, job: Job) -> Dict:
+        """Fetch rosters and upsert them in chunks"""
+        # Upserts are idempotent, so a resumed job simply re-crawls and re-applies
+        players_data = await self.player_service.fetch_rosters()
+        self._checkpoint(db, job, total=len(players_data), processed=0)
+        
+        result = {'count': len(players_data), 'inserted': 0, 'updated': 0, 'unchanged': 0}
+        for start in range(0, len(players_data), JOB_CHUNK_SIZE):
+            chunk = players_data[start:start + JOB_CHUNK_SIZE]
+            counts = await self.player_service._save_players_to_db(db, chunk)
+            
+            result = {**result, **{key: result.get(key, 0) + value for key, value in counts.items()}}
+            self._checkpoint(db, job, processed=start + len(chunk), result=result)
+        
+        # Player names and teams are embedded in rankings and prediction responses too
+        ranking_service.rebuild_position_counts(db)
+        ranking_service.rebuild(db)
+        snapshot_service.invalidate()
+        await cache_service.invalidate("players")
+        return result
+    
+    async def _run_train_model(self, db: Session, job: Job) -> Dict:
+        """Train and publish a new prediction model"""
+        self._checkpoint(db, job, total=1)
+        metadata = model_service.train(db, self.prediction_service.current_season)
+        self._checkpoint(db, job, processed=1)
+        return metadata
+    
+    async def _run_ingest_stats(self, db: Session, job: Job) -> Dict:
+        """Load an uploaded weekly stats file"""
+        # The watermark only advances on commit, so a resumed job reloads the same weeks
+        self._checkpoint(db, job, total=1)
+        try:
+            result = stats_service.ingest_file(
+                db,
+                job.params['path'],
+                job.params.get('format'),
+                job.params.get('force', False)
+            )
+        finally:
+            # A crash leaves the file for the resumed job; a failed load is not retried
+            if os.path.exists(job.params['path']):
+                os.remove(job.params['path'])
+        self._checkpoint(db, job, processed=1)
+        return result
+    
+    async def _run_simulate_season(self, db: Session, job: Job) -> Dict:
+        """Monte Carlo simulate the rest of the season for every predicted player"""
+        season = job.params.get('season') or self.prediction_service.current_season
+        self._checkpoint(db, job, total=1)
+        result = simulation_service.run(
+            db, season, job.params.get('simulations'), job.params.get('workers')
+        )
+        self._checkpoint(db, job, processed=1)
+        return {'season': season, **result}
+
+job_service = JobService()
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import json
+import os
+import numpy as np
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from sqlalchemy.orm import Session
+import logging
+
+from app.models.database import Player, PlayerStat
+from app.services.feature_service import feature_service
+
+# pandas and scikit-learn are imported where used, keeping them out of API startup
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Where versioned model artifacts live; LATEST names the one being served
+MODEL_DIR = os.getenv("MODEL_DIR", os.path.join("artifacts", "models"))
+
+# Model inputs, in matrix column order
+MODEL_FEATURES = [
+    'age', 'experience',
+    'team_strength', 'age_prime', 'breakout_window',
+    'avg_fantasy_points', 'consistency_score', 'trend_score', 'ceiling_score',
+    'is_qb', 'is_rb', 'is_wr', 'is_te'
+]
+
+# Fewer (player, season) samples than this is not worth a model
+MIN_TRAINING_SAMPLES = 50
+
+# Node arrays of a flattened forest, one .npy file each in the artifact directory
+FOREST_ARRAYS = ('feature', 'threshold', 'left', 'right', 'value', 'roots')
+
+def flatten_forest(model) -> Dict[str, np.ndarray]:
+    """Concatenate the trees of a fitted random forest regressor into flat node arrays"""
+    arrays = {name: [] for name in FOREST_ARRAYS}
+    offset = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        nodes = np.arange(tree.node_count)
+        leaf = tree.children_left < 0
+
+        arrays['feature'].append(np.where(leaf, -1, tree.feature))
+        arrays['threshold'].append(tree.threshold)
+        # Leaves point at themselves, so every tree can be walked the same number of steps
+        arrays['left'].append(np.where(leaf, nodes, tree.children_left) + offset)
+        arrays['right'].append(np.where(leaf, nodes, tree.children_right) + offset)
+        arrays['value'].append(tree.value[:, 0, 0])
+        arrays['roots'].append([offset])
+        offset += tree.node_count
+
+    return {
+        'feature': np.concatenate(arrays['feature']).astype(np.int64),
+        'threshold': np.concatenate(arrays['threshold']).astype(np.float64),
+        'left': np.concatenate(arrays['left']).astype(np.int64),
+        'right': np.concatenate(arrays['right']).astype(np.int64),
+        'value': np.concatenate(arrays['value']).astype(np.float64),
+        'roots': np.concatenate(arrays['roots']).astype(np.int64)
+    }
+
+class ForestModel:
+    """Random forest as flat node arrays; predicts with NumPy alone, so the arrays can stay memory-mapped"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+
+    @classmethod
+    def load(cls, path: str) -> ForestModel:
+        """Map the arrays read-only; every process using the artifact shares the page cache copy"""
+        return cls({name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r') for name in FOREST_ARRAYS})
+
+    def save(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        for name in FOREST_ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), self.arrays[name])
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Mean leaf value over all trees, walking every (row, tree) pair one level per step"""
+        arrays = self.arrays
+        # Trees split on float32 features, as scikit-learn does
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(len(X))[:, None]
+        nodes = np.repeat(np.asarray(arrays['roots'])[None, :], len(X), axis=0)
+
+        while True:
+            feature = arrays['feature'][nodes]
+            internal = feature >= 0
+            if not internal.any():
+                break
+            go_left = X[rows, np.maximum(feature, 0)] <= arrays['threshold'][nodes]
+            nodes = np.where(go_left, arrays['left'][nodes], arrays['right'][nodes])
+
+        return arrays['value'][nodes].mean(axis=1)
+
+class ModelService:
+    """Trains, versions and serves the fantasy points regression model"""
+
+    def __init__(self, model_dir: Optional[str] = None):
+        self.model_dir = model_dir or MODEL_DIR
+        self._model = None
+        self._version = None
+        self._pointer_mtime = None
+
+    @property
+    def version(self) -> Optional[str]:
+        """Version of the model currently served, None when running rule-based"""
+        self.get_model()
+        return self._version
+
+    def get_model(self) -> Optional[ForestModel]:
+        """Lazily load the latest artifact, memory-mapped so worker processes share one copy"""
+        pointer = os.path.join(self.model_dir, "LATEST")
+        try:
+            pointer_mtime = os.stat(pointer).st_mtime
+        except FileNotFoundError:
+            return None
+
+        if pointer_mtime != self._pointer_mtime:
+            with open(pointer) as f:
+                version = f.read().strip()
+
+            try:
+                model = ForestModel.load(self._artifact_path(version))
+            except Exception as e:
+                logger.error(f"Failed to load model {version}, keeping current model: {str(e)}")
+                return self._model
+
+            self._model = model
+            self._version = version
+            self._pointer_mtime = pointer_mtime
+            logger.info(f"Loaded prediction model {version}")
+
+        return self._model
+
+    def get_metadata(self) -> Optional[Dict]:
+        """Training metadata of the latest model; read from its JSON file without loading the model"""
+        try:
+            with open(os.path.join(self.model_dir, "LATEST")) as f:
+                version = f.read().strip()
+        except FileNotFoundError:
+            return None
+
+        with open(self._metadata_path(version)) as f:
+            return json.load(f)
+
+    def build_matrix(self, features: pd.DataFrame) -> np.ndarray:
+        """Turn feature-store rows into the model's input matrix"""
+        import pandas as pd
+
+        matrix = pd.DataFrame({
+            'age': features['age'],
+            'experience': features['experience'],
+            'team_strength': features['team_strength'],
+            'age_prime': features['age_prime'],
+            'breakout_window': features['breakout_window'],
+            'avg_fantasy_points': features['avg_fantasy_points'],
+            'consistency_score': features['consistency_score'],
+            'trend_score': features['trend_score'],
+            'ceiling_score': features['ceiling_score'],
+            'is_qb': features['position'] == 'QB',
+            'is_rb': features['position'] == 'RB',
+            'is_wr': features['position'] == 'WR',
+            'is_te': features['position'] == 'TE'
+        }, columns=MODEL_FEATURES)
+        return matrix.astype(float).to_numpy()
+
+    def predict(self, features: pd.DataFrame) -> Optional[np.ndarray]:
+        """Predict fantasy points for every row in one call, or None without a model"""
+        model = self.get_model()
+        if model is None or features.empty:
+            return None
+        return model.predict(self.build_matrix(features))
+
+    def build_training_set(self, db: Session, current_season: int) -> Tuple[np.ndarray, np.ndarray]:
+        """One sample per (player, season): features from earlier seasons, target that season's average"""
+        import pandas as pd
+
+        players = pd.DataFrame(
+            db.query(Player.id, Player.position, Player.team, Player.age, Player.experience).all(),
+            columns=['id', 'position', 'team', 'age', 'experience']
+        )
+        stats = pd.DataFrame(
+            db.query(
+                PlayerStat.player_id, PlayerStat.season, PlayerStat.fantasy_points
+            ).order_by(PlayerStat.season, PlayerStat.week).all(),
+            columns=['player_id', 'season', 'fantasy_points']
+        )
+
+        matrices = []
+        targets = []
+        scored = stats[stats['fantasy_points'].fillna(0) != 0]
+
+        for season in sorted(stats['season'].dropna().unique())[1:]:
+            target = scored[scored['season'] == season].groupby('player_id')['fantasy_points'].mean()
+            pool = players[players['id'].isin(target.index)].reset_index(drop=True)
+            if pool.empty:
+                continue
+
+            # Roll age and experience back to what they were that season
+            years_back = current_season - season
+            pool['age'] = pool['age'] - years_back
+            pool['experience'] = (pool['experience'] - years_back).clip(lower=0)
+
+            prior = stats[stats['season'] < season][['player_id', 'fantasy_points']]
+            features = feature_service.calculate_features(pool, prior)
+
+            matrices.append(self.build_matrix(features))
+            targets.append(target.reindex(pool['id']).to_numpy())
+
+        if not matrices:
+            return np.empty((0, len(MODEL_FEATURES))), np.empty(0)
+        return np.vstack(matrices), np.concatenate(targets)
+
+    def train(self, db: Session, current_season: int) -> Dict:
+        """Train on PlayerStat history and publish a new versioned artifact"""
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.metrics import mean_absolute_error, r2_score
+        from sklearn.model_selection import train_test_split
+
+        X, y = self.build_training_set(db, current_season)
+        if len(y) < MIN_TRAINING_SAMPLES:
+            raise ValueError(f"Not enough PlayerStat history to train ({len(y)} samples)")
+
+        # Hold out a split for metrics, then refit on everything
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        model = RandomForestRegressor(n_estimators=200, min_samples_leaf=5, random_state=42, n_jobs=-1)
+        model.fit(X_train, y_train)
+        y_pred = model.predict(X_test)
+        model.fit(X, y)
+
+        # Microseconds keep back-to-back training runs from overwriting each other's artifacts
+        trained_at = datetime.utcnow()
+        version = trained_at.strftime("%Y%m%d%H%M%S%f")
+        metadata = {
+            'version': version,
+            'trained_at': trained_at.isoformat(),
+            'features': MODEL_FEATURES,
+            'n_samples': int(len(y)),
+            'mae': round(float(mean_absolute_error(y_test, y_pred)), 3),
+            'r2': round(float(r2_score(y_test, y_pred)), 3)
+        }
+
+        os.makedirs(self.model_dir, exist_ok=True)
+        # Plain .npy node arrays rather than a pickle: unpickling a forest copies its trees into each process
+        ForestModel(flatten_forest(model)).save(self._artifact_path(version))
+        with open(self._metadata_path(version), 'w') as f:
+            json.dump(metadata, f)
+
+        # Swap the pointer atomically so workers never see a half-written name
+        pointer = os.path.join(self.model_dir, "LATEST")
+        with open(f"{pointer}.tmp", 'w') as f:
+            f.write(version)
+        os.replace(f"{pointer}.tmp", pointer)
+
+        logger.info(f"Trained prediction model {version}: MAE {metadata['mae']}, R2 {metadata['r2']}")
+        return metadata
+
+    def _artifact_path(self, version: str) -> str:
+        return os.path.join(self.model_dir, f"prediction_model_{version}")
+
+    def _metadata_path(self, version: str) -> str:
+        return os.path.join(self.model_dir, f"prediction_model_{version}.json")
+
+model_service = ModelService()
@@ -1,47 +1,68 @@
-import requests
+from __future__ import annotations
+
+import asyncio
+import os
 import uuid
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Dict, Optional
+from sqlalchemy import insert, update, or_, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.database import Player, PlayerStat
+from app.services.search_service import search_service
 import logging
 
+# httpx is only needed by the roster fetch job
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
+# ESPN's public API; override to point ingestion at a local stub server
+ESPN_API_URL = os.getenv("ESPN_API_URL", "https://site.api.espn.com/apis/site/v2/sports/football/nfl")
+
+# Status codes worth retrying
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Player attributes written by roster ingestion
+PLAYER_FIELDS = ('nfl_id', 'name', 'position', 'team', 'age', 'experience', 'height', 'weight', 'college')
+
+# Rows per statement for bulk upserts (keeps IN lists under SQLite's variable limit)
+UPSERT_CHUNK_SIZE = 500
+
 class PlayerService:
     """Service for fetching and managing NFL player data"""
     
-    def __init__(self):
-        # We'll use a free API for now - ESPN's public API
-        self.base_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_concurrency: int = 8,
+        request_timeout: float = 10.0,
+        total_timeout: float = 60.0,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.base_url = base_url or ESPN_API_URL
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
+        self.total_timeout = total_timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.transport = transport
     
     async def fetch_current_players(self, db: Session) -> List[Dict]:
         """Fetch current NFL players from ESPN API"""
         try:
-            # Get all NFL teams first
-            teams_response = requests.get(f"{self.base_url}/teams")
-            teams_data = teams_response.json()
-            
-            all_players = []
-            
-            for team in teams_data.get('sports', [{}])[0].get('leagues', [{}])[0].get('teams', []):
-                team_id = team['team']['id']
-                team_abbr = team['team']['abbreviation']
-                
-                # Get roster for each team
-                roster_url = f"{self.base_url}/teams/{team_id}/roster"
-                roster_response = requests.get(roster_url)
-                
-                if roster_response.status_code == 200:
-                    roster_data = roster_response.json()
-                    
-                    for athlete in roster_data.get('athletes', []):
-                        player_data = self._parse_player_data(athlete, team_abbr)
-                        if player_data:
-                            all_players.append(player_data)
+            all_players = await self.fetch_rosters()
             
             # Save to database
-            saved_count = await self._save_players_to_db(db, all_players)
-            logger.info(f"Fetched and saved {saved_count} players")
+            counts = await self._save_players_to_db(db, all_players)
+            logger.info(
+                f"Fetched {len(all_players)} players: {counts['inserted']} inserted, "
+                f"{counts['updated']} updated, {counts['unchanged']} unchanged"
+            )
             
             return all_players
             
@@ -49,6 +70,90 @@ class PlayerService:
             logger.error(f"Error fetching players: {str(e)}")
             raise
     
+    async def fetch_rosters(self) -> List[Dict]:
+        """Fetch and parse all team rosters within the timeout budget"""
+        return await asyncio.wait_for(self._fetch_all_rosters(), timeout=self.total_timeout)
+    
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create a pooled client that reuses connections to the API host"""
+        import httpx
+        
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self.request_timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            ),
+            transport=self.transport
+        )
+    
+    async def _fetch_all_rosters(self) -> List[Dict]:
+        """Fetch all team rosters concurrently"""
+        async with self._create_client() as client:
+            # Get all NFL teams first
+            teams_data = await self._get_json(client, f"{self.base_url}/teams")
+            if teams_data is None:
+                raise ValueError("Could not fetch NFL teams")
+            
+            teams = teams_data.get('sports', [{}])[0].get('leagues', [{}])[0].get('teams', [])
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            rosters = await asyncio.gather(*[
+                self._fetch_team_roster(client, semaphore, team) for team in teams
+            ])
+        
+        return [player for roster in rosters for player in roster]
+    
+    async def _fetch_team_roster(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        team: Dict
+    ) -> List[Dict]:
+        """Fetch and parse the roster for a single team"""
+        team_id = team['team']['id']
+        team_abbr = team['team']['abbreviation']
+        
+        async with semaphore:
+            roster_data = await self._get_json(client, f"{self.base_url}/teams/{team_id}/roster")
+        
+        if roster_data is None:
+            return []
+        
+        players = []
+        for athlete in roster_data.get('athletes', []):
+            player_data = self._parse_player_data(athlete, team_abbr)
+            if player_data:
+                players.append(player_data)
+        
+        return players
+    
+    async def _get_json(self, client: httpx.AsyncClient, url: str) -> Optional[Dict]:
+        """GET a JSON document, retrying transient failures with exponential backoff"""
+        import httpx
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await client.get(url)
+                
+                if response.status_code == 200:
+                    return response.json()
+                
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    logger.warning(f"Request to {url} failed with status {response.status_code}")
+                    return None
+                
+                error = f"status {response.status_code}"
+                
+            except httpx.TransportError as e:
+                error = str(e) or type(e).__name__
+            
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+        
+        logger.warning(f"Giving up on {url} after {self.max_retries + 1} attempts: {error}")
+        return None
+    
     def _parse_player_data(self, athlete_data: Dict, team: str) -> Optional[Dict]:
         """Parse ESPN athlete data into our player format"""
         try:
@@ -63,7 +168,7 @@ class PlayerService:
             
             return {
                 'nfl_id': str(athlete.get('id')),
-                'name': athlete.get('displayName', ''),
+                'name': athlete.get('displayName') or '',
                 'position': position,
                 'team': team,
                 'age': athlete.get('age'),
@@ -76,54 +181,136 @@ class PlayerService:
             logger.error(f"Error parsing player data: {str(e)}")
             return None
     
-    async def _save_players_to_db(self, db: Session, players_data: List[Dict]) -> int:
-        """Save players to database"""
-        saved_count = 0
+    async def _save_players_to_db(self, db: Session, players_data: List[Dict]) -> Dict[str, int]:
+        """Upsert players by nfl_id and report inserted/updated/unchanged counts"""
+        # Last occurrence wins when a player is listed more than once
+        players = list({player['nfl_id']: player for player in players_data}.values())
         
-        for player_data in players_data:
-            try:
-                # Check if player already exists
-                existing_player = db.query(Player).filter(
-                    Player.nfl_id == player_data['nfl_id']
-                ).first()
-                
-                if not existing_player:
-                    # Create new player
-                    player = Player(
-                        id=str(uuid.uuid4()),
-                        **player_data
-                    )
-                    db.add(player)
-                    saved_count += 1
-                else:
-                    # Update existing player
-                    for key, value in player_data.items():
-                        if hasattr(existing_player, key):
-                            setattr(existing_player, key, value)
-                
-            except Exception as e:
-                logger.error(f"Error saving player {player_data.get('name')}: {str(e)}")
-                continue
+        if not players:
+            return {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        
+        if db.get_bind().dialect.name == 'postgresql':
+            counts = self._upsert_players_postgres(db, players)
+        else:
+            counts = self._upsert_players_portable(db, players)
         
         db.commit()
-        return saved_count
+        return counts
     
-    async def get_players_by_position(self, db: Session, position: str) -> List[Player]:
+    def _upsert_players_postgres(self, db: Session, players: List[Dict]) -> Dict[str, int]:
+        """Upsert with INSERT ... ON CONFLICT (nfl_id) DO UPDATE, skipping unchanged rows"""
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        table = Player.__table__
+        now = datetime.utcnow()
+        
+        for start in range(0, len(players), UPSERT_CHUNK_SIZE):
+            chunk = players[start:start + UPSERT_CHUNK_SIZE]
+            
+            stmt = pg_insert(table).values([
+                {
+                    'id': str(uuid.uuid4()),
+                    **{field: player.get(field) for field in PLAYER_FIELDS},
+                    'created_at': now,
+                    'updated_at': now
+                }
+                for player in chunk
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.nfl_id],
+                set_={
+                    **{field: stmt.excluded[field] for field in PLAYER_FIELDS},
+                    'updated_at': now
+                },
+                # Only touch rows whose attributes actually changed
+                where=or_(*[
+                    table.c[field].is_distinct_from(stmt.excluded[field]) for field in PLAYER_FIELDS
+                ])
+            ).returning(literal_column("xmax = 0").label('inserted'))
+            
+            written = db.execute(stmt).all()
+            inserted = sum(1 for row in written if row.inserted)
+            
+            counts['inserted'] += inserted
+            counts['updated'] += len(written) - inserted
+            counts['unchanged'] += len(chunk) - len(written)
+        
+        return counts
+    
+    def _upsert_players_portable(self, db: Session, players: List[Dict]) -> Dict[str, int]:
+        """Upsert by loading known nfl_ids up front, then bulk INSERT and bulk UPDATE"""
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        now = datetime.utcnow()
+        
+        existing = {}
+        nfl_ids = [player['nfl_id'] for player in players]
+        for start in range(0, len(nfl_ids), UPSERT_CHUNK_SIZE):
+            rows = db.query(
+                Player.id, *[getattr(Player, field) for field in PLAYER_FIELDS]
+            ).filter(
+                Player.nfl_id.in_(nfl_ids[start:start + UPSERT_CHUNK_SIZE])
+            ).all()
+            existing.update({row.nfl_id: row for row in rows})
+        
+        new_rows = []
+        updated_rows = []
+        for player in players:
+            values = {field: player.get(field) for field in PLAYER_FIELDS}
+            current = existing.get(player['nfl_id'])
+            
+            if current is None:
+                new_rows.append({'id': str(uuid.uuid4()), **values, 'created_at': now, 'updated_at': now})
+            elif any(getattr(current, field) != value for field, value in values.items()):
+                updated_rows.append({'id': current.id, **values, 'updated_at': now})
+            else:
+                counts['unchanged'] += 1
+        
+        if new_rows:
+            # Keep NULL attributes in every row; dropping them splits the executemany by key set
+            db.execute(insert(Player).execution_options(render_nulls=True), new_rows)
+        if updated_rows:
+            db.execute(update(Player), updated_rows)
+        
+        counts['inserted'] = len(new_rows)
+        counts['updated'] = len(updated_rows)
+        return counts
+    
+    async def get_players_by_position(self, db: AsyncSession, position: str) -> List[Player]:
         """Get players filtered by position"""
-        return db.query(Player).filter(Player.position == position).all()
+        return list(await db.scalars(select(Player).where(Player.position == position)))
     
-    async def search_players(self, db: Session, query: str) -> List[Player]:
-        """Search players by name"""
-        return db.query(Player).filter(
-            Player.name.ilike(f"%{query}%")
-        ).limit(50).all()
+    async def search_players(self, db: AsyncSession, query: str) -> List[Player]:
+        """Search players by name, best match first"""
+        return await search_service.search_players(db, query, limit=50)
     
-    async def get_player_by_id(self, db: Session, player_id: str) -> Optional[Player]:
+    async def get_player_by_id(self, db: AsyncSession, player_id: str) -> Optional[Player]:
         """Get player by ID"""
-        return db.query(Player).filter(Player.id == player_id).first()
+        return await db.get(Player, player_id)
+    
+    async def get_players_by_ids(self, db: AsyncSession, player_ids: List[str]) -> List[Player]:
+        """Get players by ID in one query, in the order requested; unknown IDs are skipped"""
+        players = {
+            player.id: player
+            for player in await db.scalars(select(Player).where(Player.id.in_(player_ids)))
+        }
+        return [players[player_id] for player_id in player_ids if player_id in players]
+
+def player_record(player: Player) -> Dict:
+    """PlayerResponse fields of a player, ready for orjson"""
+    return {
+        'id': player.id,
+        'nfl_id': player.nfl_id,
+        'name': player.name,
+        'position': player.position,
+        'team': player.team,
+        'age': player.age,
+        'experience': player.experience,
+        'height': player.height,
+        'weight': player.weight,
+        'college': player.college
+    }
 
 # Create sample data for development
-async def create_sample_players(db: Session) -> List[Player]:
+async def create_sample_players(db: AsyncSession) -> List[Player]:
     """Create sample players for development/testing"""
     sample_players = [
         {
@@ -172,14 +359,16 @@ async def create_sample_players(db: Session) -> List[Player]:
         }
     ]
     
-    created_players = []
-    for player_data in sample_players:
-        # Check if player already exists
-        existing = db.query(Player).filter(Player.nfl_id == player_data['nfl_id']).first()
-        if not existing:
-            player = Player(id=str(uuid.uuid4()), **player_data)
-            db.add(player)
-            created_players.append(player)
-    
-    db.commit()
-    return created_players
\ No newline at end of file
+    existing_ids = set(await db.scalars(
+        select(Player.nfl_id).where(Player.nfl_id.in_([player['nfl_id'] for player in sample_players]))
+    ))
+    
+    created_players = [
+        Player(id=str(uuid.uuid4()), **player_data)
+        for player_data in sample_players
+        if player_data['nfl_id'] not in existing_ids
+    ]
+    db.add_all(created_players)
+    
+    await db.commit()
+    return created_players
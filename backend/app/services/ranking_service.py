@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import logging
+
+from app.models.database import (
+    Player, PlayerPrediction, PredictionRanking, PredictionSummary, PositionCount
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Players per tier; one tier per round of a 12-team draft
+TIER_SIZE = 12
+
+# Thresholds counted in the prediction summaries
+HIGH_CONFIDENCE_THRESHOLD = 0.8
+BREAKOUT_THRESHOLD = 0.6
+BUST_RISK_THRESHOLD = 0.5
+
+# Summary row covering every position
+ALL_POSITIONS = "ALL"
+
+# Rows per bulk insert statement
+INSERT_CHUNK_SIZE = 1000
+
+def summary_record(summary: Optional[PredictionSummary]) -> Dict:
+    """PredictionSummaryResponse fields of a summary row; zeros before the first prediction run"""
+    return {
+        'total_predictions': summary.total_predictions if summary else 0,
+        'avg_confidence': round(summary.avg_confidence or 0, 3) if summary else 0.0,
+        'high_confidence_count': summary.high_confidence_count if summary else 0,
+        'breakout_candidates': summary.breakout_candidates if summary else 0,
+        'bust_risks': summary.bust_risks if summary else 0
+    }
+
+class RankingService:
+    """Maintains the materialized leaderboard, summary and position count tables"""
+
+    def rebuild(self, db: Session, season: Optional[int] = None) -> Dict[str, int]:
+        """Recompute rankings and summaries for one season, or every season with predictions"""
+        import pandas as pd
+
+        query = db.query(
+            PlayerPrediction.id.label('prediction_id'),
+            PlayerPrediction.player_id,
+            PlayerPrediction.season,
+            PlayerPrediction.predicted_points,
+            PlayerPrediction.confidence,
+            PlayerPrediction.breakout_score,
+            PlayerPrediction.bust_risk,
+            PlayerPrediction.reasoning_codes,
+            Player.name.label('player_name'),
+            Player.position,
+            Player.team
+        ).join(Player, PlayerPrediction.player_id == Player.id)
+        if season is not None:
+            query = query.filter(PlayerPrediction.season == season)
+
+        predictions = pd.DataFrame(query.all(), columns=[
+            'prediction_id', 'player_id', 'season', 'predicted_points', 'confidence',
+            'breakout_score', 'bust_risk', 'reasoning_codes', 'player_name', 'position', 'team'
+        ])
+        predictions['position'] = predictions['position'].fillna('N/A')
+
+        seasons = [season] if season is not None else [int(s) for s in predictions['season'].unique()]
+        now = datetime.utcnow()
+
+        rankings = self._build_rankings(predictions)
+        rankings['built_at'] = now
+        summaries = self._build_summaries(predictions)
+        summaries['built_at'] = now
+
+        # Swap in one transaction so readers see either the old or the new tables;
+        # a full rebuild also drops seasons that no longer have predictions
+        stale_rankings = db.query(PredictionRanking)
+        stale_summaries = db.query(PredictionSummary)
+        if season is not None:
+            stale_rankings = stale_rankings.filter(PredictionRanking.season == season)
+            stale_summaries = stale_summaries.filter(PredictionSummary.season == season)
+        stale_rankings.delete(synchronize_session=False)
+        stale_summaries.delete(synchronize_session=False)
+        self._bulk_insert(db, PredictionRanking, rankings)
+        self._bulk_insert(db, PredictionSummary, summaries)
+        db.commit()
+
+        logger.info(f"Rebuilt rankings for seasons {seasons}: {len(rankings)} ranked predictions")
+        return {'rankings': len(rankings), 'summaries': len(summaries)}
+
+    def rebuild_position_counts(self, db: Session) -> Dict[str, int]:
+        """Recompute the player count per position"""
+        counts = {
+            row.position: row.count
+            for row in db.query(
+                Player.position, func.count(Player.id).label('count')
+            ).group_by(Player.position)
+        }
+
+        db.query(PositionCount).delete(synchronize_session=False)
+        now = datetime.utcnow()
+        if counts:
+            db.execute(insert(PositionCount), [
+                {'position': position, 'player_count': count, 'built_at': now}
+                for position, count in counts.items()
+            ])
+        db.commit()
+        return counts
+
+    def ensure_built(self, db: Session):
+        """Backfill tables that are missing, e.g. after upgrading an existing database"""
+        predicted_seasons = {row.season for row in db.query(PlayerPrediction.season).distinct()}
+        built_seasons = {
+            row.season for row in db.query(PredictionSummary.season).filter(
+                PredictionSummary.position == ALL_POSITIONS
+            )
+        }
+        for season in sorted(predicted_seasons - built_seasons):
+            self.rebuild(db, season)
+
+        if not db.query(PositionCount.position).first() and db.query(Player.id).first():
+            self.rebuild_position_counts(db)
+
+    async def get_rankings(
+        self,
+        db: AsyncSession,
+        season: int,
+        position: str,
+        limit: int = 50
+    ) -> List[PredictionRanking]:
+        """Leaderboard for one position, best rank first"""
+        return list(await db.scalars(
+            select(PredictionRanking).where(
+                PredictionRanking.season == season,
+                PredictionRanking.position == position
+            ).order_by(PredictionRanking.rank).limit(limit)
+        ))
+
+    async def get_summary(
+        self,
+        db: AsyncSession,
+        season: int,
+        position: str = ALL_POSITIONS
+    ) -> Optional[PredictionSummary]:
+        """Summary aggregates for a season, overall or for one position"""
+        return await db.get(PredictionSummary, (season, position))
+
+    async def get_roster_version(self, db: AsyncSession) -> Optional[str]:
+        """Changes whenever the player table is refreshed, since position counts are rebuilt with it"""
+        built_at = await db.scalar(select(func.max(PositionCount.built_at)))
+        return built_at.isoformat() if built_at else None
+
+    async def get_position_counts(self, db: AsyncSession) -> Dict[str, int]:
+        """Player count per position"""
+        rows = await db.execute(select(PositionCount.position, PositionCount.player_count))
+        return {row.position: row.player_count for row in rows}
+
+    def _build_rankings(self, predictions: pd.DataFrame) -> pd.DataFrame:
+        rankings = predictions.sort_values(
+            ['season', 'position', 'predicted_points', 'prediction_id'],
+            ascending=[True, True, False, True]
+        )
+        rankings['rank'] = rankings.groupby(['season', 'position']).cumcount() + 1
+        rankings['tier'] = (rankings['rank'] - 1) // TIER_SIZE + 1
+
+        return rankings[[
+            'season', 'position', 'rank', 'tier', 'player_id', 'prediction_id', 'player_name',
+            'team', 'predicted_points', 'confidence', 'breakout_score', 'reasoning_codes'
+        ]]
+
+    def _build_summaries(self, predictions: pd.DataFrame) -> pd.DataFrame:
+        import pandas as pd
+
+        flagged = predictions.assign(
+            high_confidence=predictions['confidence'] >= HIGH_CONFIDENCE_THRESHOLD,
+            breakout=predictions['breakout_score'] >= BREAKOUT_THRESHOLD,
+            bust=predictions['bust_risk'] >= BUST_RISK_THRESHOLD
+        )
+        overall = flagged.assign(position=ALL_POSITIONS)
+
+        summaries = pd.concat([flagged, overall]).groupby(['season', 'position']).agg(
+            total_predictions=('prediction_id', 'count'),
+            avg_confidence=('confidence', 'mean'),
+            high_confidence_count=('high_confidence', 'sum'),
+            breakout_candidates=('breakout', 'sum'),
+            bust_risks=('bust', 'sum')
+        ).reset_index()
+
+        return summaries
+
+    def _bulk_insert(self, db: Session, model, frame: pd.DataFrame):
+        # to_dict('records') leaves NumPy scalars; astype(object) turns them into Python types
+        records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+        for start in range(0, len(records), INSERT_CHUNK_SIZE):
+            db.execute(insert(model), records[start:start + INSERT_CHUNK_SIZE])
+
+ranking_service = RankingService()
@@ -0,0 +1,131 @@
+import math
+import uuid
+import numpy as np
+from typing import Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+
+from app.models.database import AsyncSessionLocal, ScoringProfile
+from app.services.prediction_service import PROJECTED_STATS
+
+logger = logging.getLogger(__name__)
+
+# Box-score columns of PlayerStat, in table order; every scoring weight vector is over these
+STAT_COLUMNS = [
+    'passing_yards', 'passing_tds', 'interceptions', 'passing_attempts', 'passing_completions',
+    'rushing_yards', 'rushing_tds', 'rushing_attempts',
+    'receptions', 'receiving_yards', 'receiving_tds', 'targets'
+]
+
+# Standard scoring, points per unit of each stat
+STANDARD_SCORING = {
+    'passing_yards': 0.04,
+    'passing_tds': 4.0,
+    'interceptions': -2.0,
+    'rushing_yards': 0.1,
+    'rushing_tds': 6.0,
+    'receiving_yards': 0.1,
+    'receiving_tds': 6.0
+}
+
+# Predictions are made in standard points; other profiles rescore them
+STANDARD_PROFILE = "standard"
+
+# Scoring profiles every league can use by ID: (name, scoring)
+BUILTIN_PROFILES = {
+    STANDARD_PROFILE: ("Standard", STANDARD_SCORING),
+    'half_ppr': ("Half PPR", {**STANDARD_SCORING, 'receptions': 0.5}),
+    'ppr': ("PPR", {**STANDARD_SCORING, 'receptions': 1.0}),
+    'six_point_passing_td': ("6-point passing TD", {**STANDARD_SCORING, 'passing_tds': 6.0})
+}
+
+# Position of each projected stat in STAT_COLUMNS
+PROJECTED_STAT_INDEX = [STAT_COLUMNS.index(stat) for stat in PROJECTED_STATS]
+
+def scoring_weights(scoring: Dict[str, float]) -> np.ndarray:
+    """Weight vector over STAT_COLUMNS for a scoring system"""
+    return np.array([scoring.get(column, 0.0) for column in STAT_COLUMNS])
+
+def unprojected_stats(scoring: Dict[str, float]) -> List[str]:
+    """Weighted stats that predictions don't project, so rescored predictions can't reflect them"""
+    return sorted(stat for stat, points in scoring.items() if points and stat not in PROJECTED_STATS)
+
+def profile_record(profile_id: str, name: str, scoring: Dict[str, float], builtin: bool) -> Dict:
+    """ScoringProfileResponse fields of a profile"""
+    return {
+        'id': profile_id,
+        'name': name,
+        'scoring': scoring,
+        'builtin': builtin,
+        'unprojected_stats': unprojected_stats(scoring)
+    }
+
+class ScoringService:
+    """League scoring profiles as weight vectors over the PlayerStat stat columns"""
+
+    def __init__(self):
+        # Profiles are never edited once created, so weights stay cached for the life of the process
+        self._weights: Dict[str, np.ndarray] = {
+            profile_id: scoring_weights(scoring) for profile_id, (_, scoring) in BUILTIN_PROFILES.items()
+        }
+
+    def score(self, stats: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Fantasy points of stat rows over STAT_COLUMNS; a weight matrix scores one profile per column"""
+        return stats @ weights
+
+    def rescore_predictions(self, predicted_points: np.ndarray, projected: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Scale standard predicted points by how a profile values each projected stat line relative to standard"""
+        # Only projected stats take part; a profile's unprojected_stats are reported when it is read
+        both = np.column_stack([self._weights[STANDARD_PROFILE], weights])[PROJECTED_STAT_INDEX]
+        standard, profile = self.score(projected, both).T
+
+        # Kickers and defenses have no projected stats and keep their points
+        ratio = np.divide(profile, standard, out=np.ones_like(standard), where=standard > 0)
+        return (predicted_points * ratio).round(1)
+
+    async def get_weights(self, profile_id: str) -> np.ndarray:
+        """Weight vector of a built-in or custom profile; ValueError if there is no such profile"""
+        weights = self._weights.get(profile_id)
+        if weights is None:
+            async with AsyncSessionLocal() as db:
+                profile = await db.get(ScoringProfile, profile_id)
+            if profile is None:
+                raise ValueError(f"Scoring profile {profile_id} not found")
+            weights = self._weights[profile_id] = scoring_weights(profile.scoring)
+        return weights
+
+    async def list_profiles(self, db: AsyncSession) -> List[Dict]:
+        """Built-in profiles, then custom ones in creation order"""
+        profiles = [
+            profile_record(profile_id, name, scoring, True) for profile_id, (name, scoring) in BUILTIN_PROFILES.items()
+        ]
+        rows = await db.scalars(select(ScoringProfile).order_by(ScoringProfile.created_at, ScoringProfile.id))
+        profiles.extend(profile_record(row.id, row.name, row.scoring, False) for row in rows)
+        return profiles
+
+    async def get_profile(self, db: AsyncSession, profile_id: str) -> Optional[Dict]:
+        """One built-in or custom profile"""
+        if profile_id in BUILTIN_PROFILES:
+            name, scoring = BUILTIN_PROFILES[profile_id]
+            return profile_record(profile_id, name, scoring, True)
+
+        row = await db.get(ScoringProfile, profile_id)
+        return profile_record(row.id, row.name, row.scoring, False) if row else None
+
+    async def create_profile(self, db: AsyncSession, name: str, scoring: Dict[str, float]) -> Dict:
+        """Store a custom profile; its scoring may only weight PlayerStat stat columns"""
+        unknown = sorted(set(scoring) - set(STAT_COLUMNS))
+        if unknown:
+            raise ValueError(f"Unknown stats in scoring: {', '.join(unknown)}")
+        if not all(math.isfinite(points) for points in scoring.values()):
+            raise ValueError("Scoring points must be finite numbers")
+
+        profile = ScoringProfile(id=str(uuid.uuid4()), name=name, scoring=scoring)
+        db.add(profile)
+        await db.commit()
+
+        logger.info(f"Created scoring profile {profile.id} ({name})")
+        return profile_record(profile.id, profile.name, profile.scoring, False)
+
+scoring_service = ScoringService()
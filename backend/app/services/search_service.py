@@ -0,0 +1,199 @@
+import bisect
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import func, literal, or_, text, case, select
+from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+
+from app.models.database import Player
+from app.services.ranking_service import ranking_service
+
+logger = logging.getLogger(__name__)
+
+# Fraction of query trigrams a name must contain to count as a fuzzy match
+# (pg_trgm's word similarity; 0.4 lets "mcaffery" find "McCaffrey")
+WORD_SIMILARITY_THRESHOLD = 0.4
+
+# Upper bound on ranked matches returned for one query
+MAX_SEARCH_RESULTS = 500
+
+def normalize_name(name: str) -> str:
+    """Lowercase and strip punctuation so "A.J. Brown" matches "aj brown" """
+    return " ".join(re.sub(r"[^a-z0-9 ]", "", (name or "").lower()).split())
+
+def name_trigrams(name: str) -> Set[str]:
+    """Trigrams of each word, padded the same way as pg_trgm"""
+    trigrams = set()
+    for word in name.split():
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+class NameIndex:
+    """In-memory prefix and trigram index over player names"""
+
+    def __init__(self, players: List[Tuple[str, str, str]]):
+        # players: (id, name, position)
+        self.ids = []
+        self.names = []
+        self.positions = []
+        self.normalized = []
+        self.trigrams = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        prefixes = []
+
+        for idx, (player_id, name, position) in enumerate(players):
+            normalized = normalize_name(name)
+            trigrams = name_trigrams(normalized)
+
+            self.ids.append(player_id)
+            self.names.append(name or "")
+            self.positions.append(position)
+            self.normalized.append(normalized)
+            self.trigrams.append(trigrams)
+
+            for trigram in trigrams:
+                self.postings[trigram].append(idx)
+
+            # Full name plus every word, so "hill" finds "Tyreek Hill"
+            prefixes.append((normalized, idx))
+            prefixes.extend((word, idx) for word in normalized.split()[1:])
+
+        prefixes.sort()
+        self.prefix_keys = [key for key, _ in prefixes]
+        self.prefix_ids = [idx for _, idx in prefixes]
+
+    def _prefix_matches(self, query: str) -> Set[int]:
+        start = bisect.bisect_left(self.prefix_keys, query)
+        end = bisect.bisect_right(self.prefix_keys, query + "\uffff")
+        return set(self.prefix_ids[start:end])
+
+    def _score(self, idx: int, query: str, query_trigrams: Set[str]) -> float:
+        """Rank exact > full-name prefix > word prefix > substring > fuzzy"""
+        normalized = self.normalized[idx]
+
+        if normalized == query:
+            return 1.0
+        if normalized.startswith(query):
+            return 0.9
+        if any(word.startswith(query) for word in normalized.split()):
+            return 0.8
+        if query in normalized:
+            return 0.7
+
+        similarity = len(query_trigrams & self.trigrams[idx]) / len(query_trigrams)
+        return 0.6 * similarity if similarity >= WORD_SIMILARITY_THRESHOLD else 0.0
+
+    def search(
+        self,
+        query: str,
+        position: Optional[str] = None,
+        limit: int = MAX_SEARCH_RESULTS
+    ) -> List[str]:
+        """Return matching player IDs, best match first"""
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        query_trigrams = name_trigrams(query)
+        candidates = self._prefix_matches(query)
+        for trigram in query_trigrams:
+            candidates.update(self.postings.get(trigram, ()))
+
+        scored = []
+        for idx in candidates:
+            if position and self.positions[idx] != position:
+                continue
+            score = self._score(idx, query, query_trigrams)
+            if score > 0:
+                scored.append((-score, self.names[idx], idx))
+
+        scored.sort()
+        return [self.ids[idx] for _, _, idx in scored[:limit]]
+
+class SearchService:
+    """Ranked, typo-tolerant player name search"""
+
+    def __init__(self):
+        self._index: Optional[NameIndex] = None
+        self._index_version: Optional[str] = None
+
+    async def search_ids(
+        self,
+        db: AsyncSession,
+        query: str,
+        position: Optional[str] = None,
+        limit: int = MAX_SEARCH_RESULTS
+    ) -> List[str]:
+        """Return player IDs matching the query, best match first"""
+        if db.get_bind().dialect.name == 'postgresql':
+            return await self._search_postgres(db, query, position, limit)
+
+        index = await self._get_index(db)
+        return index.search(query, position, limit)
+
+    async def search_players(
+        self,
+        db: AsyncSession,
+        query: str,
+        position: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Player]:
+        """Return matching players, best match first"""
+        player_ids = await self.search_ids(db, query, position, limit)
+        if not player_ids:
+            return []
+
+        players = {
+            player.id: player
+            for player in await db.scalars(select(Player).where(Player.id.in_(player_ids)))
+        }
+        return [players[player_id] for player_id in player_ids if player_id in players]
+
+    async def _search_postgres(
+        self,
+        db: AsyncSession,
+        query: str,
+        position: Optional[str],
+        limit: int
+    ) -> List[str]:
+        """Prefix and trigram word-similarity search served by the GIN trigram index"""
+        query = query.strip()
+        if not query:
+            return []
+
+        # Applies to this transaction only
+        await db.execute(text(f"SET LOCAL pg_trgm.word_similarity_threshold = {WORD_SIMILARITY_THRESHOLD}"))
+
+        prefix = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        is_prefix = Player.name.ilike(prefix)
+
+        rows_query = select(Player.id).where(or_(
+            is_prefix,
+            literal(query).op("<%")(Player.name)
+        ))
+        if position:
+            rows_query = rows_query.where(Player.position == position)
+
+        rows = await db.scalars(rows_query.order_by(
+            case((func.lower(Player.name) == query.lower(), 0), (is_prefix, 1), else_=2),
+            func.word_similarity(query, Player.name).desc(),
+            Player.name
+        ).limit(limit))
+
+        return list(rows)
+
+    async def _get_index(self, db: AsyncSession) -> NameIndex:
+        """Build the in-memory index, rebuilding it when the roster is refreshed"""
+        version = await ranking_service.get_roster_version(db)
+
+        if self._index is None or self._index_version != version:
+            players = (await db.execute(select(Player.id, Player.name, Player.position))).all()
+            self._index = NameIndex([(p.id, p.name, p.position) for p in players])
+            self._index_version = version
+            logger.info(f"Built in-memory name index over {len(players)} players")
+
+        return self._index
+
+search_service = SearchService()
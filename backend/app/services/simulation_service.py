@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import logging
+
+from app.models.database import Player, PlayerPrediction, PlayerSimulation, PlayerStat, StatsLoadWatermark
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Simulated seasons per player; the process pool is used when SIMULATION_WORKERS > 1
+SIMULATION_COUNT = int(os.getenv("SIMULATION_COUNT", "2000"))
+SIMULATION_WORKERS = int(os.getenv("SIMULATION_WORKERS", "0"))
+
+# Players simulated per chunk; bounds memory at chunk x simulations draws per week
+SIMULATION_CHUNK_SIZE = 500
+
+REGULAR_SEASON_WEEKS = 17
+
+# Seasons of weekly history sampled from
+HISTORY_SEASONS = 3
+
+# Players with fewer games are drawn from a normal around their projection instead
+MIN_HISTORY_GAMES = 4
+FALLBACK_VARIATION = 0.45
+
+# Projection / historical mean is clipped so one odd season cannot dominate
+MAX_PROJECTION_SCALE = 1.5
+MIN_PROJECTION_SCALE = 0.5
+
+# Weekly points counted as a boom or bust week, by position
+BOOM_POINTS = {'QB': 25.0, 'RB': 20.0, 'WR': 20.0, 'TE': 15.0, 'K': 12.0, 'DST': 12.0}
+BUST_POINTS = {'QB': 12.0, 'RB': 6.0, 'WR': 6.0, 'TE': 4.0, 'K': 5.0, 'DST': 3.0}
+DEFAULT_BOOM_POINTS = 18.0
+DEFAULT_BUST_POINTS = 6.0
+
+# Weekly floor and ceiling percentiles, also used for rest-of-season ranges
+FLOOR_PERCENTILE = 10
+CEILING_PERCENTILE = 90
+
+RESULT_COLUMNS = [
+    'floor', 'median', 'ceiling', 'boom_probability', 'bust_probability',
+    'ros_mean', 'ros_floor', 'ros_ceiling'
+]
+
+def simulate_chunk(
+    history: np.ndarray,
+    games: np.ndarray,
+    scale: np.ndarray,
+    fallback_mean: np.ndarray,
+    boom: np.ndarray,
+    bust: np.ndarray,
+    simulations: int,
+    weeks: int,
+    seed: np.random.SeedSequence
+) -> np.ndarray:
+    """Simulate a chunk of players; one row of RESULT_COLUMNS per player"""
+    rng = np.random.default_rng(seed)
+    players = len(games)
+    fallback = np.flatnonzero(games < MIN_HISTORY_GAMES)
+
+    # Scale each player's past games to the current projection once, not per draw
+    scaled = (history * scale[:, None]).astype(np.float32)
+    offsets = (np.arange(players) * history.shape[1])[:, None]
+    game_counts = np.maximum(games, 1).astype(np.float32)[:, None]
+
+    def draw_week() -> np.ndarray:
+        # Bootstrap a past game per player and simulation
+        picks = (rng.random((players, simulations), dtype=np.float32) * game_counts).astype(np.int32)
+        points = scaled.ravel()[offsets + picks]
+
+        if len(fallback):
+            mean = fallback_mean[fallback, None]
+            points[fallback] = np.maximum(rng.normal(mean, mean * FALLBACK_VARIATION, (len(fallback), simulations)), 0)
+        return points
+
+    week = draw_week()
+    floor, median, ceiling = np.percentile(week, [FLOOR_PERCENTILE, 50, CEILING_PERCENTILE], axis=1)
+    booms = (week >= boom[:, None]).sum(axis=1)
+    busts = (week < bust[:, None]).sum(axis=1)
+
+    totals = week if weeks else np.zeros((players, simulations), dtype=np.float32)
+    for _ in range(weeks - 1):
+        week = draw_week()
+        totals += week
+        booms += (week >= boom[:, None]).sum(axis=1)
+        busts += (week < bust[:, None]).sum(axis=1)
+
+    drawn = simulations * max(weeks, 1)
+    ros_floor, ros_ceiling = np.percentile(totals, [FLOOR_PERCENTILE, CEILING_PERCENTILE], axis=1)
+
+    return np.column_stack([
+        floor, median, ceiling, booms / drawn, busts / drawn,
+        totals.mean(axis=1), ros_floor, ros_ceiling
+    ])
+
+class SimulationService:
+    """Monte Carlo season simulations from each player's weekly PlayerStat history"""
+
+    def run(
+        self,
+        db: Session,
+        season: int,
+        simulations: Optional[int] = None,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Simulate every player with a prediction and replace the season's results"""
+        simulations = simulations or SIMULATION_COUNT
+        workers = SIMULATION_WORKERS if workers is None else workers
+        weeks = self.weeks_remaining(db, season)
+
+        results = self.simulate(self._load_inputs(db, season), simulations, weeks, workers, seed)
+        now = datetime.utcnow()
+
+        db.query(PlayerSimulation).filter(PlayerSimulation.season == season).delete(synchronize_session=False)
+        records = [
+            {
+                'player_id': player_id,
+                'season': season,
+                'simulations': simulations,
+                'weeks_remaining': weeks,
+                **{column: round(float(value), 4) for column, value in zip(RESULT_COLUMNS, values)},
+                'simulated_at': now
+            }
+            for player_id, values in zip(results.index, results.to_numpy())
+        ]
+        for start in range(0, len(records), SIMULATION_CHUNK_SIZE):
+            db.execute(insert(PlayerSimulation), records[start:start + SIMULATION_CHUNK_SIZE])
+        db.commit()
+
+        logger.info(f"Simulated {len(records)} players x {simulations} seasons of {weeks} weeks for {season}")
+        return {'players': len(records), 'simulations': simulations, 'weeks_remaining': weeks}
+
+    def simulate(
+        self,
+        inputs: pd.DataFrame,
+        simulations: int,
+        weeks: int,
+        workers: int = 0,
+        seed: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Simulate players from _load_inputs, in chunks and optionally across processes"""
+        import pandas as pd
+
+        if inputs.empty:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+
+        chunks = [
+            inputs.iloc[start:start + SIMULATION_CHUNK_SIZE]
+            for start in range(0, len(inputs), SIMULATION_CHUNK_SIZE)
+        ]
+        # One seed per chunk, so results do not depend on the worker count
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        arguments = [self._chunk_arguments(chunk, simulations, weeks, chunk_seed) for chunk, chunk_seed in zip(chunks, seeds)]
+
+        if workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                results = list(pool.map(simulate_chunk, *zip(*arguments)))
+        else:
+            results = [simulate_chunk(*chunk_arguments) for chunk_arguments in arguments]
+
+        return pd.DataFrame(np.vstack(results), index=inputs.index, columns=RESULT_COLUMNS)
+
+    def weeks_remaining(self, db: Session, season: int) -> int:
+        """Regular-season weeks after the last week with loaded stats"""
+        watermark = db.get(StatsLoadWatermark, season)
+        if watermark is not None and watermark.last_week is not None:
+            last_week = watermark.last_week
+        else:
+            last_week = db.query(func.max(PlayerStat.week)).filter(PlayerStat.season == season).scalar() or 0
+        return max(REGULAR_SEASON_WEEKS - last_week, 0)
+
+    async def get_simulations(
+        self,
+        db: AsyncSession,
+        season: int,
+        position: Optional[str] = None,
+        limit: int = 50
+    ) -> List:
+        """Simulation results joined with player names, highest rest-of-season mean first"""
+        query = select(
+            PlayerSimulation,
+            Player.name.label('player_name'),
+            Player.position.label('player_position'),
+            Player.team.label('player_team')
+        ).join(Player, PlayerSimulation.player_id == Player.id).where(PlayerSimulation.season == season)
+
+        if position:
+            query = query.where(Player.position == position)
+
+        return list(await db.execute(query.order_by(
+            PlayerSimulation.ros_mean.desc(), PlayerSimulation.player_id
+        ).limit(limit)))
+
+    async def get_version(self, db: AsyncSession, season: int) -> Optional[str]:
+        """When the season was last simulated"""
+        simulated_at = await db.scalar(
+            select(func.max(PlayerSimulation.simulated_at)).where(PlayerSimulation.season == season)
+        )
+        return simulated_at.isoformat() if simulated_at else None
+
+    def _load_inputs(self, db: Session, season: int) -> pd.DataFrame:
+        """Projection, position and padded weekly points history per predicted player"""
+        import pandas as pd
+
+        players = pd.DataFrame(db.query(
+            PlayerPrediction.player_id, PlayerPrediction.predicted_points, Player.position
+        ).join(Player, PlayerPrediction.player_id == Player.id).filter(
+            PlayerPrediction.season == season
+        ).order_by(PlayerPrediction.player_id).all(), columns=['player_id', 'predicted_points', 'position'])
+        players = players.set_index('player_id')
+
+        history = pd.DataFrame(db.query(PlayerStat.player_id, PlayerStat.fantasy_points).join(
+            PlayerPrediction,
+            (PlayerPrediction.player_id == PlayerStat.player_id) & (PlayerPrediction.season == season)
+        ).filter(
+            PlayerStat.season.between(season - HISTORY_SEASONS + 1, season)
+        ).all(), columns=['player_id', 'fantasy_points'])
+
+        # Zero-point weeks are treated as games not played, as in the feature store
+        history = history[history['fantasy_points'].fillna(0) != 0]
+        players['games'] = history.groupby('player_id').size().reindex(players.index).fillna(0).astype(int)
+        players['history_mean'] = history.groupby('player_id')['fantasy_points'].mean().reindex(players.index)
+
+        # Padded player x game matrix; only the first `games` entries of a row are ever drawn
+        slot = history.groupby('player_id').cumcount().to_numpy()
+        row = players.index.get_indexer(history['player_id'])
+        matrix = np.zeros((len(players), max(int(players['games'].max() or 0), 1)), dtype=np.float32)
+        matrix[row, slot] = history['fantasy_points'].to_numpy()
+        players['history'] = list(matrix)
+
+        return players
+
+    def _chunk_arguments(self, chunk: pd.DataFrame, simulations: int, weeks: int, seed) -> tuple:
+        projection = chunk['predicted_points'].fillna(0).to_numpy(dtype=np.float32)
+        scale = np.clip(
+            projection / chunk['history_mean'].to_numpy(dtype=np.float32),
+            MIN_PROJECTION_SCALE, MAX_PROJECTION_SCALE
+        )
+        return (
+            np.vstack(chunk['history'].to_numpy()),
+            chunk['games'].to_numpy(),
+            np.nan_to_num(scale, nan=1.0),
+            projection,
+            chunk['position'].map(BOOM_POINTS).fillna(DEFAULT_BOOM_POINTS).to_numpy(),
+            chunk['position'].map(BUST_POINTS).fillna(DEFAULT_BUST_POINTS).to_numpy(),
+            simulations,
+            weeks,
+            seed
+        )
+
+simulation_service = SimulationService()
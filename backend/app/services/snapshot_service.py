@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import numpy as np
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import func, select
+import logging
+
+from app.models.database import AsyncSessionLocal, Player, PlayerPrediction, PredictionSummary
+from app.services.prediction_service import PROJECTED_STATS
+from app.services.scoring_service import scoring_service
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks for a newer snapshot version
+SNAPSHOT_CHECK_SECONDS = float(os.getenv("SNAPSHOT_CHECK_SECONDS", "1.0"))
+
+# Rescored copies kept per season; the least recently used profile is dropped first
+SCORED_CACHE_SIZE = int(os.getenv("SCORED_CACHE_SIZE", "16"))
+
+INTEGER_COLUMNS = [f'projected_{stat}' for stat in PROJECTED_STATS]
+NUMERIC_COLUMNS = ['predicted_points', 'confidence', 'breakout_score', 'bust_risk', *INTEGER_COLUMNS]
+OBJECT_COLUMNS = [
+    'id', 'player_id', 'player_name', 'player_position', 'player_team', 'reasoning_codes', 'created_at'
+]
+
+class PredictionRecord:
+    """One prediction row; same attribute names as the router's projected query rows"""
+    __slots__ = ('season', *OBJECT_COLUMNS, *NUMERIC_COLUMNS)
+
+class SeasonSnapshot:
+    """Column arrays for one season, pre-sorted by predicted points descending then id"""
+
+    def __init__(self, season: int, columns: Dict[str, np.ndarray]):
+        self.season = season
+        self.columns = columns
+        self.size = len(columns['id'])
+
+        # Rank of each id, the tie-breaker for every sort order
+        self.id_rank = np.argsort(np.argsort(self.columns['id']))
+        self.index_by_player = {player_id: i for i, player_id in enumerate(self.columns['player_id'])}
+        self._scored: Dict[str, SeasonSnapshot] = {}
+
+    @classmethod
+    def from_rows(cls, season: int, rows: List) -> SeasonSnapshot:
+        columns = {}
+        for column in OBJECT_COLUMNS:
+            values = np.empty(len(rows), dtype=object)
+            values[:] = [getattr(row, column) for row in rows]
+            columns[column] = values
+        for column in NUMERIC_COLUMNS:
+            # NULL becomes NaN so filters and sorts stay vectorized
+            columns[column] = np.array([getattr(row, column) for row in rows], dtype=np.float64)
+        return cls(season, columns)
+
+    def scored(self, profile_id: str, weights: np.ndarray) -> SeasonSnapshot:
+        """This season with predicted points under a scoring profile, re-sorted; built once per profile"""
+        scored = self._scored.pop(profile_id, None)
+        if scored is None:
+            projected = np.nan_to_num(np.column_stack([self.columns[column] for column in INTEGER_COLUMNS]))
+            points = scoring_service.rescore_predictions(self.columns['predicted_points'], projected, weights)
+            order = np.lexsort((self.id_rank, np.where(np.isnan(points), np.inf, -points)))
+            scored = SeasonSnapshot(self.season, {
+                column: (points if column == 'predicted_points' else values)[order]
+                for column, values in self.columns.items()
+            })
+            if len(self._scored) >= SCORED_CACHE_SIZE:
+                del self._scored[next(iter(self._scored))]
+        # Reinserted so dict order stays least recently used first
+        self._scored[profile_id] = scored
+        return scored
+
+    def query(
+        self,
+        position: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        min_breakout_score: Optional[float] = None,
+        sort_by: str = 'predicted_points',
+        limit: Optional[int] = None
+    ) -> List[PredictionRecord]:
+        """Filter, order best first (NULLs last, then by id) and take the top N"""
+        selected = self.select(position, min_confidence, min_breakout_score, sort_by)
+        return [self.record(i) for i in selected[:limit]]
+
+    def select(
+        self,
+        position: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        min_breakout_score: Optional[float] = None,
+        sort_by: str = 'predicted_points'
+    ) -> np.ndarray:
+        """Row positions of query() results, for callers that build records a batch at a time"""
+        mask = np.ones(self.size, dtype=bool)
+        if position:
+            mask &= self.columns['player_position'] == position
+        if min_confidence is not None:
+            mask &= self.columns['confidence'] >= min_confidence
+        if min_breakout_score is not None:
+            mask &= self.columns['breakout_score'] >= min_breakout_score
+
+        selected = np.flatnonzero(mask)
+        if sort_by != 'predicted_points':
+            # Projected stats are named without their column prefix, as in the API
+            column = sort_by if sort_by in self.columns else f'projected_{sort_by}'
+            values = self.columns[column][selected]
+            selected = selected[np.lexsort((
+                self.id_rank[selected],
+                np.where(np.isnan(values), np.inf, -values)
+            ))]
+        return selected
+
+    def get(self, player_id: str) -> Optional[PredictionRecord]:
+        """Prediction for one player"""
+        i = self.index_by_player.get(player_id)
+        return self.record(i) if i is not None else None
+
+    def get_many(self, player_ids: List[str]) -> List[PredictionRecord]:
+        """Predictions for several players, in the order given; players without one are skipped"""
+        return [
+            self.record(self.index_by_player[player_id])
+            for player_id in player_ids if player_id in self.index_by_player
+        ]
+
+    def record(self, i: int) -> PredictionRecord:
+        record = PredictionRecord()
+        record.season = self.season
+        for column in OBJECT_COLUMNS:
+            setattr(record, column, self.columns[column][i])
+        for column in NUMERIC_COLUMNS:
+            value = self.columns[column][i]
+            setattr(record, column, None if np.isnan(value) else value.item())
+        # Projected stats are stored as float so NULL can be NaN
+        for column in INTEGER_COLUMNS:
+            value = getattr(record, column)
+            if value is not None:
+                setattr(record, column, int(value))
+        return record
+
+class PredictionSnapshot:
+    """Immutable set of season snapshots; replaced as a whole on reload"""
+
+    def __init__(self, version: Optional[str], seasons: Dict[int, SeasonSnapshot]):
+        self.version = version
+        self.seasons = seasons
+        self.loaded_at = datetime.utcnow()
+
+    def season(self, season: int) -> SeasonSnapshot:
+        return self.seasons.get(season) or SeasonSnapshot.from_rows(season, [])
+
+class SnapshotService:
+    """Serves prediction reads from an in-memory columnar snapshot of the predictions table"""
+
+    def __init__(self, check_seconds: Optional[float] = None):
+        self.check_seconds = SNAPSHOT_CHECK_SECONDS if check_seconds is None else check_seconds
+        self._snapshot: Optional[PredictionSnapshot] = None
+        self._checked_at = 0.0
+        # One version check or reload at a time per process
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> PredictionSnapshot:
+        """Current snapshot, reloaded first if the source version has moved on"""
+        if self._snapshot is not None and (self._lock.locked() or not self._check_due()):
+            # Keep serving the current snapshot while another request checks for a newer one
+            return self._snapshot
+
+        async with self._lock:
+            # Re-check after waiting; the request holding the lock may have just loaded it
+            if self._snapshot is None or self._check_due():
+                self._checked_at = time.monotonic()
+                version = await self._source_version()
+                if self._snapshot is None or version != self._snapshot.version:
+                    await self.reload(version)
+        return self._snapshot
+
+    async def reload(self, version: Optional[str] = None) -> PredictionSnapshot:
+        """Build a new snapshot and swap it in; readers never see a partial one"""
+        async with AsyncSessionLocal() as db:
+            if version is None:
+                version = await self._source_version(db)
+            rows = (await db.execute(self._rows_query())).all()
+
+        by_season: Dict[int, List] = {}
+        for row in rows:
+            by_season.setdefault(row.season, []).append(row)
+
+        snapshot = PredictionSnapshot(version, {
+            season: SeasonSnapshot.from_rows(season, season_rows) for season, season_rows in by_season.items()
+        })
+        self._snapshot = snapshot
+
+        logger.info(f"Loaded prediction snapshot {version}: {len(rows)} predictions")
+        return snapshot
+
+    def invalidate(self):
+        """Check the source version on the next read"""
+        self._checked_at = 0.0
+
+    def _check_due(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.check_seconds
+
+    async def _source_version(self, db=None) -> Optional[str]:
+        # Rankings are rebuilt after every prediction run and roster refresh
+        query = select(func.max(PredictionSummary.built_at))
+        if db is None:
+            async with AsyncSessionLocal() as db:
+                built_at = await db.scalar(query)
+        else:
+            built_at = await db.scalar(query)
+        return built_at.isoformat() if built_at else None
+
+    def _rows_query(self):
+        return select(
+            PlayerPrediction.id,
+            PlayerPrediction.player_id,
+            Player.name.label('player_name'),
+            Player.position.label('player_position'),
+            Player.team.label('player_team'),
+            PlayerPrediction.season,
+            PlayerPrediction.reasoning_codes,
+            PlayerPrediction.created_at,
+            *[getattr(PlayerPrediction, column) for column in NUMERIC_COLUMNS]
+        ).join(Player, PlayerPrediction.player_id == Player.id).order_by(
+            PlayerPrediction.season, PlayerPrediction.predicted_points.desc(), PlayerPrediction.id
+        )
+
+snapshot_service = SnapshotService()
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import csv
+import io
+import os
+import uuid
+import numpy as np
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, IO, List, Optional, Tuple, Union
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session
+import logging
+
+from app.models.database import Player, PlayerStat, PositionCount, StatsLoadWatermark
+from app.services.scoring_service import BUILTIN_PROFILES, STANDARD_PROFILE, STAT_COLUMNS, scoring_service, scoring_weights
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns every stats file must have; players are matched on their ESPN id
+KEY_COLUMNS = ['nfl_id', 'season', 'week']
+
+# Rows per executemany batch and per IN list
+LOAD_CHUNK_SIZE = 5000
+
+# Columns written to player_stats, in COPY order
+LOAD_COLUMNS = ['id', 'player_id', 'season', 'week', *STAT_COLUMNS, 'fantasy_points', 'fantasy_points_ppr', 'created_at']
+
+# Stored fantasy point columns and the profile each is scored with
+STORED_SCORING = {'fantasy_points': STANDARD_PROFILE, 'fantasy_points_ppr': 'ppr'}
+
+class StatsService:
+    """Parses weekly box-score files and bulk loads them into PlayerStat"""
+
+    def __init__(self):
+        # season -> ((watermark updated_at, roster version), player columns, stat totals); loads are the only stats writer
+        self._totals: Dict[int, Tuple] = {}
+
+    def parse(self, source: Union[str, bytes, IO], file_format: Optional[str] = None) -> pd.DataFrame:
+        """Read a CSV, JSON array or NDJSON stats file into a normalized frame"""
+        import pandas as pd
+
+        if file_format is None and isinstance(source, str):
+            file_format = os.path.splitext(source)[1].lstrip('.').lower()
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+
+        if file_format == 'csv':
+            frame = pd.read_csv(source, dtype={'nfl_id': str})
+        elif file_format == 'json':
+            frame = pd.read_json(source, orient='records', dtype={'nfl_id': str})
+        elif file_format in ('ndjson', 'jsonl'):
+            frame = pd.read_json(source, lines=True, dtype={'nfl_id': str})
+        else:
+            raise ValueError(f"Unsupported stats file format: {file_format}")
+
+        frame.columns = [str(column).strip().lower() for column in frame.columns]
+        missing = [column for column in KEY_COLUMNS if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Stats file is missing required columns: {', '.join(missing)}")
+
+        # Absent or blank stats count as zero in a box score
+        for column in STAT_COLUMNS:
+            if column not in frame.columns:
+                frame[column] = 0
+        frame[STAT_COLUMNS] = frame[STAT_COLUMNS].apply(pd.to_numeric, errors='coerce').fillna(0).astype(int)
+
+        frame = frame.dropna(subset=KEY_COLUMNS)
+        frame['nfl_id'] = frame['nfl_id'].astype(str).str.strip()
+        frame['season'] = frame['season'].astype(int)
+        frame['week'] = frame['week'].astype(int)
+
+        return frame[KEY_COLUMNS + STAT_COLUMNS].reset_index(drop=True)
+
+    def score(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Add standard and PPR fantasy points with one matrix product"""
+        weights = np.column_stack([
+            scoring_weights(BUILTIN_PROFILES[profile_id][1]) for profile_id in STORED_SCORING.values()
+        ])
+        points = scoring_service.score(frame[STAT_COLUMNS].to_numpy(dtype=float), weights).round(2)
+        return frame.assign(**{column: points[:, i] for i, column in enumerate(STORED_SCORING)})
+
+    def ingest_file(
+        self,
+        db: Session,
+        source: Union[str, bytes, IO],
+        file_format: Optional[str] = None,
+        force: bool = False
+    ) -> Dict[str, int]:
+        """Parse and load a stats file"""
+        return self.load(db, self.parse(source, file_format), force)
+
+    def load(self, db: Session, frame: pd.DataFrame, force: bool = False) -> Dict[str, int]:
+        """Load parsed stats, skipping weeks already loaded unless force is set"""
+        counts = {'rows': len(frame), 'duplicates': 0, 'already_loaded': 0, 'unmatched': 0, 'inserted': 0, 'updated': 0}
+
+        # Last occurrence wins when a stat line is listed more than once
+        deduped = frame.drop_duplicates(subset=KEY_COLUMNS, keep='last')
+        counts['duplicates'] = len(frame) - len(deduped)
+
+        watermarks = {row.season: row for row in db.query(StatsLoadWatermark)}
+        if not force and watermarks:
+            last_week = deduped['season'].map(
+                {season: row.last_week for season, row in watermarks.items()}
+            ).fillna(0)
+            fresh = deduped[deduped['week'] > last_week]
+            counts['already_loaded'] = len(deduped) - len(fresh)
+            deduped = fresh
+
+        player_ids = self._player_ids_by_nfl_id(db, deduped['nfl_id'].unique().tolist())
+        matched = deduped.assign(player_id=deduped['nfl_id'].map(player_ids)).dropna(subset=['player_id'])
+        counts['unmatched'] = len(deduped) - len(matched)
+
+        if matched.empty:
+            return counts
+
+        scored = self.score(matched)
+        now = datetime.utcnow()
+        scored = scored.assign(id=[str(uuid.uuid4()) for _ in range(len(scored))], created_at=now)
+
+        if db.get_bind().dialect.name == 'postgresql':
+            written = self._load_postgres(db, scored[LOAD_COLUMNS])
+        else:
+            written = self._load_portable(db, scored[LOAD_COLUMNS])
+        counts.update(written)
+
+        self._advance_watermarks(db, watermarks, scored, now)
+        db.commit()
+
+        logger.info(
+            f"Loaded stats: {counts['inserted']} inserted, {counts['updated']} updated, "
+            f"{counts['already_loaded']} already loaded, {counts['unmatched']} unmatched players"
+        )
+        return counts
+
+    def get_watermarks(self, db: Session) -> List[StatsLoadWatermark]:
+        """How far each season has been loaded"""
+        return db.query(StatsLoadWatermark).order_by(StatsLoadWatermark.season).all()
+
+    def get_season_points(
+        self,
+        db: Session,
+        season: int,
+        weights: np.ndarray,
+        position: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Dict]:
+        """Season fantasy points per player under a scoring weight vector, best first"""
+        players, totals = self._season_totals(db, season)
+        points = scoring_service.score(totals, weights)
+
+        # Stable, so players tied on points keep the totals' player id order
+        order = np.argsort(-points, kind='stable')
+        if position:
+            order = order[players['position'][order] == position]
+
+        return [
+            {
+                'player_id': players['id'][i],
+                'player_name': players['name'][i],
+                'position': players['position'][i],
+                'team': players['team'][i],
+                'games': int(players['games'][i]),
+                'fantasy_points': round(float(points[i]), 2),
+                'points_per_game': round(float(points[i]) / players['games'][i], 2)
+            }
+            for i in order[:limit]
+        ]
+
+    def _season_totals(self, db: Session, season: int) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Per-player stat totals for a season, cached until the season's next load"""
+        watermark = db.get(StatsLoadWatermark, season)
+        # Player names, positions and teams are cached too, so a roster refresh (the roster version
+        # RankingService.get_roster_version reports) also invalidates the totals
+        version = (
+            watermark.updated_at if watermark else None,
+            db.scalar(select(func.max(PositionCount.built_at)))
+        )
+
+        cached = self._totals.get(season)
+        if cached is None or cached[0] != version:
+            # Scoring is linear, so scoring season totals gives the same points as summing scored weeks
+            rows = db.query(
+                Player.id, Player.name, Player.position, Player.team,
+                func.count(PlayerStat.id).label('games'),
+                *[func.coalesce(func.sum(getattr(PlayerStat, column)), 0) for column in STAT_COLUMNS]
+            ).join(Player, PlayerStat.player_id == Player.id).filter(
+                PlayerStat.season == season
+            ).group_by(Player.id, Player.name, Player.position, Player.team).order_by(Player.id).all()
+
+            players = {}
+            for j, column in enumerate(['id', 'name', 'position', 'team', 'games']):
+                players[column] = np.empty(len(rows), dtype=object)
+                players[column][:] = [row[j] for row in rows]
+            totals = np.array([row[5:] for row in rows], dtype=float).reshape(len(rows), len(STAT_COLUMNS))
+            cached = self._totals[season] = (version, players, totals)
+
+        return cached[1], cached[2]
+
+    def _player_ids_by_nfl_id(self, db: Session, nfl_ids: List[str]) -> Dict[str, str]:
+        player_ids = {}
+        for start in range(0, len(nfl_ids), LOAD_CHUNK_SIZE):
+            rows = db.query(Player.nfl_id, Player.id).filter(
+                Player.nfl_id.in_(nfl_ids[start:start + LOAD_CHUNK_SIZE])
+            )
+            player_ids.update({row.nfl_id: row.id for row in rows})
+        return player_ids
+
+    def _load_postgres(self, db: Session, rows: pd.DataFrame) -> Dict[str, int]:
+        """COPY into a temp table, then merge with INSERT ... ON CONFLICT"""
+        buffer = io.StringIO()
+        rows.to_csv(buffer, index=False, header=False, quoting=csv.QUOTE_MINIMAL)
+        buffer.seek(0)
+
+        columns = ", ".join(LOAD_COLUMNS)
+        connection = db.connection()
+        connection.exec_driver_sql(
+            "CREATE TEMP TABLE player_stats_load (LIKE player_stats INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        with connection.connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY player_stats_load ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+        # Re-sent weeks replace the stored line; created_at moves so features see the change
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in LOAD_COLUMNS[4:])
+        written = connection.exec_driver_sql(
+            f"INSERT INTO player_stats ({columns}) SELECT {columns} FROM player_stats_load "
+            f"ON CONFLICT (player_id, season, week) DO UPDATE SET {updates} "
+            f"RETURNING (xmax = 0) AS inserted"
+        ).all()
+
+        inserted = sum(1 for row in written if row.inserted)
+        return {'inserted': inserted, 'updated': len(written) - inserted}
+
+    def _load_portable(self, db: Session, rows: pd.DataFrame) -> Dict[str, int]:
+        """Look up existing (player_id, season, week) keys, then batched INSERT and UPDATE"""
+        import pandas as pd
+
+        existing = {}
+        player_ids = rows['player_id'].unique().tolist()
+        seasons = rows['season'].unique().tolist()
+        for start in range(0, len(player_ids), LOAD_CHUNK_SIZE):
+            found = db.query(
+                PlayerStat.id, PlayerStat.player_id, PlayerStat.season, PlayerStat.week
+            ).filter(
+                PlayerStat.player_id.in_(player_ids[start:start + LOAD_CHUNK_SIZE]),
+                PlayerStat.season.in_(seasons)
+            )
+            existing.update({(row.player_id, row.season, row.week): row.id for row in found})
+
+        keys = list(zip(rows['player_id'], rows['season'], rows['week']))
+        existing_ids = pd.Series([existing.get(key) for key in keys], index=rows.index)
+
+        records = rows.assign(id=existing_ids.fillna(rows['id'])).astype(object).to_dict('records')
+        is_update = existing_ids.notna().to_numpy()
+        new_rows = [record for record, flag in zip(records, is_update) if not flag]
+        updated_rows = [record for record, flag in zip(records, is_update) if flag]
+
+        for start in range(0, len(new_rows), LOAD_CHUNK_SIZE):
+            db.execute(insert(PlayerStat), new_rows[start:start + LOAD_CHUNK_SIZE])
+        for start in range(0, len(updated_rows), LOAD_CHUNK_SIZE):
+            db.execute(update(PlayerStat), updated_rows[start:start + LOAD_CHUNK_SIZE])
+
+        return {'inserted': len(new_rows), 'updated': len(updated_rows)}
+
+    def _advance_watermarks(
+        self,
+        db: Session,
+        watermarks: Dict[int, StatsLoadWatermark],
+        rows: pd.DataFrame,
+        now: datetime
+    ):
+        loaded = rows.groupby('season').agg(last_week=('week', 'max'), rows_loaded=('week', 'size'))
+
+        for season, row in loaded.iterrows():
+            watermark = watermarks.get(season)
+            if watermark is None:
+                db.add(StatsLoadWatermark(
+                    season=int(season),
+                    last_week=int(row.last_week),
+                    rows_loaded=int(row.rows_loaded),
+                    updated_at=now
+                ))
+            else:
+                watermark.last_week = max(watermark.last_week or 0, int(row.last_week))
+                watermark.rows_loaded = (watermark.rows_loaded or 0) + int(row.rows_loaded)
+                watermark.updated_at = now
+
+stats_service = StatsService()
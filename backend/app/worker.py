@@ -0,0 +1,23 @@
+import asyncio
+import os
+from celery import Celery
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL") or os.getenv("REDIS_URL", "redis://localhost:6379")
+
+celery_app = Celery("fantasyedge", broker=CELERY_BROKER_URL)
+celery_app.conf.update(
+    # Redeliver jobs whose worker dies mid-run; run_job resumes from the last checkpoint
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_prefetch_multiplier=1
+)
+
+@celery_app.task(name="jobs.run")
+def run_job_task(job_id: str):
+    """Run a queued job"""
+    from app.services.job_service import job_service
+    asyncio.run(job_service.run_job(job_id))
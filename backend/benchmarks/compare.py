@@ -0,0 +1,61 @@
+"""Compare two benchmark result files.
+
+Usage (from backend/):
+
+    python -m benchmarks.compare baseline.json results.json --threshold 10
+"""
+import argparse
+import json
+import sys
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--metric", default="p50_ms", help="Latency metric to compare")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Percent slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    baseline = load(args.baseline)
+    candidate = load(args.candidate)
+    print(f"baseline  {baseline['meta'].get('git_commit')}  {baseline['meta'].get('database')}  "
+          f"{baseline['meta'].get('players')} players")
+    print(f"candidate {candidate['meta'].get('git_commit')}  {candidate['meta'].get('database')}  "
+          f"{candidate['meta'].get('players')} players")
+    print()
+
+    regressions = []
+    names = list(baseline['results']) + [n for n in candidate['results'] if n not in baseline['results']]
+    for name in names:
+        before = baseline['results'].get(name)
+        after = candidate['results'].get(name)
+        if not before or not after:
+            print(f"{name:<48} {'only in ' + ('baseline' if before else 'candidate')}")
+            continue
+
+        old, new = before[args.metric], after[args.metric]
+        change = (new - old) / old * 100 if old else 0.0
+        query_change = after['queries_per_call'] - before['queries_per_call']
+
+        flag = ""
+        if change > args.threshold or query_change > 0:
+            flag = "  REGRESSION"
+            regressions.append(name)
+
+        print(
+            f"{name:<48} {old:>9.2f} -> {new:>9.2f} ms  {change:>+7.1f}%  "
+            f"queries {before['queries_per_call']:>6} -> {after['queries_per_call']:<6}{flag}"
+        )
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold}%")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Offline stand-in for ESPN's teams/roster API, for the benchmarks and tests."""
+import asyncio
+from typing import Dict, List, Optional
+
+import httpx
+
+def espn_stub(
+    roster: List[Dict],
+    faults: Optional[Dict[str, List[int]]] = None,
+    delay: float = 0.0
+) -> httpx.MockTransport:
+    """httpx transport serving the roster in ESPN's teams/roster format
+
+    faults maps a team abbreviation to the status codes its roster request
+    answers with, one per attempt, before it succeeds; delay holds back
+    every roster response by that many seconds.
+    """
+    teams = sorted({player['team'] for player in roster})
+    athletes = {team: [] for team in teams}
+    for player in roster:
+        athletes[player['team']].append({
+            'id': player['nfl_id'],
+            'displayName': player['name'],
+            'position': {'abbreviation': player['position']},
+            'age': player['age'],
+            'experience': {'years': player['experience']},
+            'displayHeight': player['height'],
+            'weight': player['weight']
+        })
+
+    teams_payload = {'sports': [{'leagues': [{'teams': [
+        {'team': {'id': str(i), 'abbreviation': team}} for i, team in enumerate(teams)
+    ]}]}]}
+    pending = {team: list(statuses) for team, statuses in (faults or {}).items()}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        parts = request.url.path.rstrip('/').split('/')
+        if parts[-1] == 'teams':
+            return httpx.Response(200, json=teams_payload)
+
+        team = teams[int(parts[-2])]
+        if delay:
+            await asyncio.sleep(delay)
+        if pending.get(team):
+            return httpx.Response(pending[team].pop(0))
+        return httpx.Response(200, json={'athletes': athletes[team]})
+
+    return httpx.MockTransport(handler)
@@ -0,0 +1,176 @@
+"""Check that the queries behind the read endpoints are served by indexes.
+
+Seeds a synthetic league, calls each read endpoint while recording the SQL it
+runs, then EXPLAINs every recorded SELECT. Exits non-zero if any plan reads a
+whole table, other than the few reads in INTENTIONAL_FULL_READS that want
+every row. On PostgreSQL sequential scans are disabled for the check, so a
+Seq Scan in the plan means no usable index exists at all.
+
+tests/test_query_plans.py runs the same check against the test database;
+this script is for checking a larger league or another database.
+
+Usage (from backend/):
+
+    python -m benchmarks.explain --database-url postgresql://localhost/fantasyedge_bench
+"""
+import argparse
+import asyncio
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark.db"
+
+# Endpoints whose queries are checked
+ENDPOINTS = [
+    "/api/predictions/?limit=50",
+    "/api/predictions/?position=WR&limit=50",
+    "/api/predictions/?min_confidence=0.8&limit=50",
+    "/api/predictions/?min_breakout_score=0.6&limit=50",
+    "/api/predictions/player/{player_id}",
+    "/api/predictions/breakout-candidates?limit=20",
+    "/api/predictions/summary",
+    "/api/predictions/position-rankings/WR",
+    "/api/predictions/export?position=QB",
+    "/api/predictions/simulations?limit=50",
+    "/api/predictions/simulations?position=RB&limit=50",
+    "/api/predictions/simulations?limit=50",
+    "/api/predictions/simulations?position=RB&limit=50",
+    "/api/players/?limit=50",
+    "/api/players/?position=RB&limit=50",
+    "/api/players/{player_id}",
+    "/api/players/search?q=mcaffery",
+    "/api/players/batch?ids={player_id}",
+    "/api/dashboard",
+    "/api/stats/points?season=2022&scoring_profile=ppr",
+]
+
+# Reads that want every row of their table, by name; matched against the whitespace-collapsed SQL
+INTENTIONAL_FULL_READS = {
+    # Every prediction, loaded into the in-memory snapshot that serves prediction reads
+    "prediction snapshot load": re.compile(r"FROM player_predictions JOIN players .* ORDER BY player_predictions\.season, "),
+    # Every player's name, loaded into the in-memory search index
+    "player search index load": re.compile(r"^SELECT players\.id, players\.name, players\.position FROM players$"),
+    # One row per position
+    "position counts": re.compile(r"^SELECT position_counts\.position, position_counts\.player_count FROM position_counts$"),
+}
+
+# SQLite: "SCAN t", "SCAN t USING INDEX i" or "SCAN t USING COVERING INDEX i"
+SQLITE_SCAN = re.compile(r"^SCAN (\w+)( USING (?:COVERING )?INDEX \w+)?$")
+POSTGRES_FULL_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+def capture_queries(engine, client, paths: List[str]) -> List[Tuple[str, str, object]]:
+    """Call each endpoint and record the SELECT statements it runs"""
+    from sqlalchemy import event
+
+    captured = []
+    current = {}
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((current['path'], statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        for path in paths:
+            current['path'] = path
+            client.get(path).raise_for_status()
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    return captured
+
+def intentional_full_read(statement: str) -> Optional[str]:
+    """Name of the INTENTIONAL_FULL_READS entry a statement is, if any"""
+    statement = " ".join(statement.split())
+    return next((name for name, pattern in INTENTIONAL_FULL_READS.items() if pattern.search(statement)), None)
+
+def full_scans(dialect: str, statement: str, plan: List[str]) -> List[str]:
+    """Tables a plan reads in full; walking an index in order under a LIMIT stops early and does not count"""
+    if dialect != "sqlite":
+        return [m.group(1) for line in plan for m in [POSTGRES_FULL_SCAN.search(line)] if m]
+
+    limited = "LIMIT" in statement.upper().split()
+    return [m.group(1) for line in plan for m in [SQLITE_SCAN.match(line)] if m and not (m.group(2) and limited)]
+
+async def explain_all(async_engine, queries) -> List[Dict]:
+    """EXPLAIN each query on the driver it originally ran on"""
+    dialect = async_engine.dialect.name
+    results = []
+
+    async with async_engine.connect() as conn:
+        if dialect == "postgresql":
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+
+        for path, statement, parameters in queries:
+            prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+            rows = (await conn.exec_driver_sql(prefix + statement, parameters)).all()
+
+            plan = [row[-1] if dialect == "sqlite" else row[0] for row in rows]
+            results.append({
+                'path': path,
+                'statement': statement,
+                'plan': plan,
+                'full_scans': full_scans(dialect, statement, plan),
+                'intentional': intentional_full_read(statement)
+            })
+
+    return results
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=2000, help="Synthetic players to generate")
+    parser.add_argument("--seasons", type=int, default=3, help="Seasons of weekly stats per player")
+    parser.add_argument("--database-url", default=os.getenv("BENCHMARK_DATABASE_URL", DEFAULT_DATABASE_URL),
+                        help="Database to (re)create; its contents are dropped")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan, not just failures")
+    args = parser.parse_args(argv)
+
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.models.database import SessionLocal, async_engine, PlayerPrediction
+    from app.services.prediction_service import PredictionService
+    from app.services.ranking_service import ranking_service
+    from app.services.simulation_service import simulation_service
+    from app.services.simulation_service import simulation_service
+    from benchmarks.synthetic import build_league
+
+    db = SessionLocal()
+    build_league(db, args.players, args.seasons)
+    asyncio.run(PredictionService().generate_all_predictions(db))
+    ranking_service.rebuild(db)
+    ranking_service.rebuild_position_counts(db)
+    simulation_service.run(db, PredictionService().current_season, simulations=200)
+    simulation_service.run(db, PredictionService().current_season, simulations=200)
+    player_id = db.query(PlayerPrediction.player_id).limit(1).scalar()
+    db.close()
+
+    paths = [path.format(player_id=player_id) for path in ENDPOINTS]
+    with TestClient(app) as client:
+        queries = capture_queries(async_engine.sync_engine, client, paths)
+
+    results = asyncio.run(explain_all(async_engine, queries))
+
+    failures = [result for result in results if result['full_scans'] and not result['intentional']]
+    for result in results:
+        if args.verbose or result in failures:
+            if not result['full_scans']:
+                status = "ok"
+            elif result['intentional']:
+                status = f"full read ({result['intentional']})"
+            else:
+                status = "FULL SCAN on " + ", ".join(result['full_scans'])
+            print(f"{result['path']}: {status}")
+            print("  " + " ".join(result['statement'].split()))
+            for line in result['plan']:
+                print(f"    {line}")
+
+    print(f"{len(results)} queries checked on {async_engine.dialect.name}, {len(failures)} with unexpected full table scans")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
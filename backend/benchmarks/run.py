@@ -0,0 +1,254 @@
+"""Benchmark the prediction, ingestion and read paths against a synthetic league.
+
+Usage (from backend/):
+
+    python -m benchmarks.run --players 2000 --seasons 3 --output results.json
+    python -m benchmarks.compare baseline.json results.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark.db"
+
+class QueryCounter:
+    """Counts SQL statements executed on a set of engines"""
+
+    def __init__(self, engines):
+        from sqlalchemy import event
+
+        self.count = 0
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+class Runner:
+    """Times callables and collects latency percentiles, throughput and query counts"""
+
+    def __init__(self, engines, iterations: int, warmup: int):
+        self.queries = QueryCounter(engines)
+        self.iterations = iterations
+        self.warmup = warmup
+        self.results: Dict[str, Dict] = {}
+
+    def measure(
+        self,
+        name: str,
+        fn: Callable[[], object],
+        rows: Optional[int] = None,
+        setup: Optional[Callable[[], object]] = None,
+        iterations: Optional[int] = None
+    ) -> Dict:
+        iterations = iterations or self.iterations
+
+        for _ in range(self.warmup):
+            if setup:
+                setup()
+            fn()
+
+        timings = []
+        queries = []
+        for _ in range(iterations):
+            if setup:
+                setup()
+            before = self.queries.count
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+            queries.append(self.queries.count - before)
+
+        timings = np.array(timings)
+        result = {
+            'iterations': iterations,
+            'p50_ms': round(float(np.percentile(timings, 50)), 3),
+            'p95_ms': round(float(np.percentile(timings, 95)), 3),
+            'p99_ms': round(float(np.percentile(timings, 99)), 3),
+            'mean_ms': round(float(timings.mean()), 3),
+            'queries_per_call': round(float(np.mean(queries)), 1)
+        }
+        if rows:
+            result['rows'] = rows
+            result['rows_per_sec'] = round(rows / (result['p50_ms'] / 1000), 1)
+
+        self.results[name] = result
+        print(
+            f"{name:<48} p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms  "
+            f"queries {result['queries_per_call']:>6}"
+            + (f"  {result['rows_per_sec']:>10.0f} rows/s" if rows else "")
+        )
+        return result
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=2000, help="Synthetic players to generate")
+    parser.add_argument("--seasons", type=int, default=3, help="Seasons of weekly stats per player")
+    parser.add_argument("--weeks", type=int, default=17, help="Weeks per season")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic league")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed iterations per endpoint")
+    parser.add_argument("--pipeline-iterations", type=int, default=3, help="Timed iterations per pipeline run")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warmup iterations")
+    parser.add_argument("--database-url", default=os.getenv("BENCHMARK_DATABASE_URL", DEFAULT_DATABASE_URL),
+                        help="Database to (re)create; its contents are dropped")
+    parser.add_argument("--cache", action="store_true", help="Leave response caching on")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # The app reads its configuration at import time
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["RESPONSE_CACHE_ENABLED"] = "true" if args.cache else "false"
+    os.environ.setdefault("JOB_EXECUTOR", "inprocess")
+
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.models.database import SessionLocal, engine, async_engine, PlayerPrediction
+    from app.services.player_service import PlayerService
+    from app.services.prediction_service import PredictionService
+    from app.services.ranking_service import ranking_service
+    from app.services.simulation_service import simulation_service, SIMULATION_COUNT
+    from benchmarks.synthetic import build_league
+    from benchmarks.espn_stub import espn_stub
+
+    db = SessionLocal()
+    print(f"Building league: {args.players} players x {args.seasons} seasons on {engine.dialect.name}")
+    league = build_league(db, args.players, args.seasons, args.weeks, seed=args.seed)
+    roster = league.pop('roster')
+
+    runner = Runner([engine, async_engine.sync_engine], args.iterations, args.warmup)
+    prediction_service = PredictionService()
+
+    def clear_predictions():
+        db.query(PlayerPrediction).delete()
+        db.commit()
+
+    # Prediction pipeline: full rebuild, then the no-change incremental pass
+    runner.measure(
+        "predictions.generate_all.cold",
+        lambda: asyncio.run(prediction_service.generate_all_predictions(db)),
+        rows=args.players, setup=clear_predictions, iterations=args.pipeline_iterations
+    )
+    runner.measure(
+        "predictions.generate_all.force",
+        lambda: asyncio.run(prediction_service.generate_all_predictions(db, force=True)),
+        rows=args.players, iterations=args.pipeline_iterations
+    )
+    runner.measure(
+        "predictions.generate_all.unchanged",
+        lambda: asyncio.run(prediction_service.generate_all_predictions(db)),
+        rows=args.players, iterations=args.pipeline_iterations
+    )
+
+    # Roster ingestion: upserts with nothing changed and with 10% of teams changed
+    player_service = PlayerService(transport=espn_stub(roster))
+    changed = [
+        {**player, 'team': 'FA'} if i % 10 == 0 else player for i, player in enumerate(roster)
+    ]
+    runner.measure(
+        "players.upsert.unchanged",
+        lambda: asyncio.run(player_service._save_players_to_db(db, roster)),
+        rows=len(roster), iterations=args.pipeline_iterations
+    )
+    runner.measure(
+        "players.upsert.10pct_changed",
+        lambda: asyncio.run(player_service._save_players_to_db(db, changed)),
+        rows=len(roster), iterations=args.pipeline_iterations,
+        setup=lambda: asyncio.run(player_service._save_players_to_db(db, roster))
+    )
+    runner.measure(
+        "players.fetch_current.stubbed",
+        lambda: asyncio.run(player_service.fetch_current_players(db)),
+        rows=len(roster), iterations=args.pipeline_iterations
+    )
+
+    # Leave predictions and their rankings in place for the read endpoints
+    asyncio.run(prediction_service.generate_all_predictions(db, force=True))
+    runner.measure(
+        "rankings.rebuild",
+        lambda: ranking_service.rebuild(db),
+        rows=args.players, iterations=args.pipeline_iterations
+    )
+    ranking_service.rebuild_position_counts(db)
+
+    # Full-league Monte Carlo run at the default simulation count
+    runner.measure(
+        "simulation.run",
+        lambda: simulation_service.run(db, prediction_service.current_season, SIMULATION_COUNT, workers=0, seed=args.seed),
+        rows=args.players, iterations=args.pipeline_iterations
+    )
+
+    # A page worth of predicted players for the batch lookups
+    batch_ids = ",".join(row.player_id for row in db.query(PlayerPrediction.player_id).limit(20))
+    db.close()
+
+    # One client for the whole run so the async engine's pool stays on one event loop
+    client = TestClient(app)
+    client.__enter__()
+    endpoints = {
+        "api.predictions.list": "/api/predictions/?limit=100",
+        "api.predictions.list_ppr": "/api/predictions/?limit=100&scoring_profile=ppr",
+        "api.predictions.breakout_candidates": "/api/predictions/breakout-candidates?limit=20",
+        "api.predictions.position_rankings": "/api/predictions/position-rankings/WR?limit=50",
+        "api.predictions.position_rankings_half_ppr": "/api/predictions/position-rankings/WR?scoring_profile=half_ppr",
+        "api.predictions.summary": "/api/predictions/summary",
+        "api.predictions.simulations": "/api/predictions/simulations?limit=50",
+        "api.players.list": "/api/players/?limit=100",
+        "api.players.list_search": "/api/players/?search=allen&limit=50",
+        "api.players.search_typo": "/api/players/search?q=mcaffery",
+        "api.players.position_stats": "/api/players/positions/stats",
+        "api.players.batch": f"/api/players/batch?ids={batch_ids}",
+        "api.predictions.batch": f"/api/predictions/batch?player_ids={batch_ids}",
+        "api.dashboard": "/api/dashboard",
+        "api.stats.points_ppr": "/api/stats/points?season=2022&scoring_profile=ppr&limit=100"
+    }
+
+    def request(path):
+        response = client.get(path)
+        response.raise_for_status()
+
+    for name, path in endpoints.items():
+        runner.measure(name, lambda path=path: request(path))
+
+    client.__exit__(None, None, None)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat(),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'database': engine.dialect.name,
+            'response_cache': args.cache,
+            'seed': args.seed,
+            **league
+        },
+        'results': runner.results
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+
+    return report
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Measure API cold start: import time of app.main and time until /health answers.
+
+Each sample is a fresh interpreter, as for a new pod or a --reload restart.
+Exits non-zero if importing the app pulls in a batch-only dependency, or if
+the median import time exceeds --max-import-ms.
+
+Usage (from backend/):
+
+    python -m benchmarks.startup --samples 10 --output startup.json
+    python -m benchmarks.compare before.json startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+import numpy as np
+
+from benchmarks.run import git_commit
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark_startup.db"
+
+# Only training and batch jobs need these; the API process should not load them
+BATCH_ONLY_MODULES = ["pandas", "sklearn", "scipy", "joblib", "httpx", "celery"]
+
+# Runs in each child process; prints one JSON line of timings
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+loaded = [name for name in {modules!r} if name in sys.modules]
+
+from sqlalchemy import event
+from fastapi.testclient import TestClient
+from app.models.database import engine
+
+statements = []
+event.listen(engine, "before_cursor_execute", lambda *args: statements.append(1))
+ready_start = time.perf_counter()
+with TestClient(app.main.app) as client:
+    client.get("/health").raise_for_status()
+    ready = time.perf_counter()
+
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "startup_ms": (ready - ready_start) * 1000,
+    "ready_ms": (imported - start + ready - ready_start) * 1000,
+    "startup_queries": len(statements),
+    "loaded_at_import": loaded
+}}))
+"""
+
+def summarize(timings) -> dict:
+    timings = np.array(timings)
+    return {
+        'iterations': len(timings),
+        'p50_ms': round(float(np.percentile(timings, 50)), 3),
+        'p95_ms': round(float(np.percentile(timings, 95)), 3),
+        'p99_ms': round(float(np.percentile(timings, 99)), 3),
+        'mean_ms': round(float(timings.mean()), 3)
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=10, help="Fresh processes to time")
+    parser.add_argument("--database-url", default=os.getenv("BENCHMARK_DATABASE_URL", DEFAULT_DATABASE_URL),
+                        help="Database migrated to head and used for startup")
+    parser.add_argument("--max-import-ms", type=float, help="Fail if the median import time is above this")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    env = {
+        **os.environ,
+        "DATABASE_URL": args.database_url,
+        "RESPONSE_CACHE_ENABLED": "false",
+        "JOB_EXECUTOR": "inprocess"
+    }
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], env=env, check=True, capture_output=True)
+
+    child = CHILD.format(modules=BATCH_ONLY_MODULES)
+    samples = []
+    for _ in range(args.samples):
+        output = subprocess.run(
+            [sys.executable, "-c", child], env=env, check=True, capture_output=True, text=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    queries = float(np.mean([sample['startup_queries'] for sample in samples]))
+    results = {
+        'startup.import_app': {**summarize([s['import_ms'] for s in samples]), 'queries_per_call': 0.0},
+        'startup.lifespan': {**summarize([s['startup_ms'] for s in samples]), 'queries_per_call': round(queries, 1)},
+        'startup.ready': {**summarize([s['ready_ms'] for s in samples]), 'queries_per_call': round(queries, 1)}
+    }
+    for name, result in results.items():
+        print(f"{name:<48} p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms  "
+              f"queries {result['queries_per_call']:>6}")
+
+    loaded = sorted({name for sample in samples for name in sample['loaded_at_import']})
+    failures = []
+    if loaded:
+        failures.append(f"importing app.main loaded batch-only modules: {', '.join(loaded)}")
+    if args.max_import_ms is not None and results['startup.import_app']['p50_ms'] > args.max_import_ms:
+        failures.append(
+            f"median import time {results['startup.import_app']['p50_ms']:.0f} ms exceeds {args.max_import_ms:.0f} ms"
+        )
+
+    if args.output:
+        report = {
+            'meta': {
+                'timestamp': datetime.utcnow().isoformat(),
+                'git_commit': git_commit(),
+                'python': platform.python_version(),
+                'database': args.database_url.split(":", 1)[0],
+                'samples': args.samples,
+                'loaded_at_import': loaded
+            },
+            'results': results
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    for failure in failures:
+        print(failure)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
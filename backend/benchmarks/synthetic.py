@@ -0,0 +1,133 @@
+import uuid
+import numpy as np
+from typing import Dict, List
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.database import Base, Player, PlayerStat
+
+TEAMS = [
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB',
+    'HOU', 'IND', 'JAX', 'KC', 'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+    'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS'
+]
+
+FIRST_NAMES = [
+    'Josh', 'Christian', 'Tyreek', 'Travis', 'Justin', 'Patrick', 'Lamar', 'Jalen', 'Derrick',
+    'Davante', 'Stefon', 'Cooper', 'Austin', 'Saquon', 'Nick', 'Mark', 'George', 'Kyle',
+    'Amon-Ra', 'CeeDee', "Ja'Marr", 'A.J.', 'DeVonta', 'Breece', 'Bijan', 'Jahmyr', 'Puka'
+]
+
+LAST_NAMES = [
+    'Allen', 'McCaffrey', 'Hill', 'Kelce', 'Jefferson', 'Mahomes', 'Jackson', 'Hurts', 'Henry',
+    'Adams', 'Diggs', 'Kupp', 'Ekeler', 'Barkley', 'Chubb', 'Andrews', 'Kittle', 'Pitts',
+    'St. Brown', 'Lamb', 'Chase', 'Brown', 'Smith', 'Hall', 'Robinson', 'Gibbs', 'Nacua'
+]
+
+# Share of the player pool per position
+POSITION_WEIGHTS = {'QB': 0.12, 'RB': 0.22, 'WR': 0.32, 'TE': 0.16, 'K': 0.09, 'DST': 0.09}
+
+# Mean weekly stat lines per position
+POSITION_STAT_MEANS = {
+    'QB': {'passing_yards': 240, 'passing_tds': 1.6, 'interceptions': 0.8, 'rushing_yards': 18, 'rushing_tds': 0.15},
+    'RB': {'rushing_yards': 60, 'rushing_tds': 0.45, 'receptions': 2.5, 'receiving_yards': 20, 'receiving_tds': 0.1},
+    'WR': {'receptions': 4.2, 'receiving_yards': 55, 'receiving_tds': 0.35, 'targets': 6.5},
+    'TE': {'receptions': 3.2, 'receiving_yards': 35, 'receiving_tds': 0.25, 'targets': 4.8},
+    'K': {},
+    'DST': {}
+}
+
+STAT_COLUMNS = [
+    'passing_yards', 'passing_tds', 'interceptions', 'passing_attempts', 'passing_completions',
+    'rushing_yards', 'rushing_tds', 'rushing_attempts',
+    'receptions', 'receiving_yards', 'receiving_tds', 'targets'
+]
+
+def generate_players(count: int, rng: np.random.Generator) -> List[Dict]:
+    """Synthetic roster rows in the shape PlayerService._parse_player_data produces"""
+    positions = rng.choice(list(POSITION_WEIGHTS), size=count, p=list(POSITION_WEIGHTS.values()))
+    first = rng.choice(FIRST_NAMES, size=count)
+    last = rng.choice(LAST_NAMES, size=count)
+    ages = rng.integers(21, 37, size=count)
+
+    return [
+        {
+            'nfl_id': str(100000 + i),
+            'name': f"{first[i]} {last[i]}",
+            'position': str(positions[i]),
+            'team': TEAMS[i % len(TEAMS)],
+            'age': int(ages[i]),
+            'experience': int(max(0, ages[i] - 22 + rng.integers(-1, 2))),
+            'height': f"6-{int(rng.integers(0, 6))}",
+            'weight': int(rng.integers(180, 260)),
+            'college': None
+        }
+        for i in range(count)
+    ]
+
+def generate_stats(
+    players: List[Dict],
+    player_ids: List[str],
+    seasons: List[int],
+    weeks: int,
+    rng: np.random.Generator
+) -> List[Dict]:
+    """Weekly PlayerStat rows drawn around each position's mean stat line"""
+    rows = []
+    for player, player_id in zip(players, player_ids):
+        means = POSITION_STAT_MEANS[player['position']]
+        # Per-player talent multiplier so players differ from each other
+        talent = rng.lognormal(0, 0.35)
+
+        for season in seasons:
+            for week in range(1, weeks + 1):
+                line = {column: 0 for column in STAT_COLUMNS}
+                for column, mean in means.items():
+                    line[column] = int(rng.poisson(mean * talent))
+
+                points = (
+                    line['passing_yards'] * 0.04 + line['passing_tds'] * 4 - line['interceptions'] * 2 +
+                    line['rushing_yards'] * 0.1 + line['rushing_tds'] * 6 +
+                    line['receiving_yards'] * 0.1 + line['receiving_tds'] * 6
+                )
+                if not means:
+                    points = float(rng.normal(8 * talent, 3))
+
+                rows.append({
+                    'id': str(uuid.uuid4()),
+                    'player_id': player_id,
+                    'season': season,
+                    'week': week,
+                    **line,
+                    'fantasy_points': round(points, 2),
+                    'fantasy_points_ppr': round(points + line['receptions'], 2)
+                })
+    return rows
+
+def build_league(
+    db: Session,
+    players: int = 2000,
+    seasons: int = 3,
+    weeks: int = 17,
+    first_season: int = 2022,
+    seed: int = 42
+) -> Dict:
+    """Recreate the schema and load a synthetic league"""
+    rng = np.random.default_rng(seed)
+    engine = db.get_bind()
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    player_rows = generate_players(players, rng)
+    player_ids = [str(uuid.uuid4()) for _ in player_rows]
+    db.execute(insert(Player), [{'id': pid, **row} for pid, row in zip(player_ids, player_rows)])
+
+    stat_rows = generate_stats(
+        player_rows, player_ids, list(range(first_season, first_season + seasons)), weeks, rng
+    )
+    for start in range(0, len(stat_rows), 10000):
+        db.execute(insert(PlayerStat), stat_rows[start:start + 10000])
+
+    db.commit()
+    return {'players': len(player_rows), 'stats': len(stat_rows), 'roster': player_rows}
@@ -0,0 +1,180 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 01:24:06.444561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.create_table('jobs',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('job_type', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('params', sa.JSON(), nullable=True),
+    sa.Column('total', sa.Integer(), nullable=True),
+    sa.Column('processed', sa.Integer(), nullable=True),
+    sa.Column('cursor', sa.String(), nullable=True),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_jobs_job_type', 'jobs', ['job_type'], unique=False)
+    op.create_index('ix_jobs_status', 'jobs', ['status'], unique=False)
+
+    op.create_table('players',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('nfl_id', sa.String(), nullable=True),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('position', sa.String(), nullable=True),
+    sa.Column('team', sa.String(), nullable=True),
+    sa.Column('age', sa.Integer(), nullable=True),
+    sa.Column('experience', sa.Integer(), nullable=True),
+    sa.Column('height', sa.String(), nullable=True),
+    sa.Column('weight', sa.Integer(), nullable=True),
+    sa.Column('college', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_players_name', 'players', ['name'], unique=False)
+    op.create_index('ix_players_name_id', 'players', ['name', 'id'], unique=False)
+    op.create_index('ix_players_nfl_id', 'players', ['nfl_id'], unique=True)
+    op.create_index('ix_players_position', 'players', ['position'], unique=False)
+    op.create_index('ix_players_team', 'players', ['team'], unique=False)
+
+    op.create_table('position_counts',
+    sa.Column('position', sa.String(), nullable=False),
+    sa.Column('player_count', sa.Integer(), nullable=True),
+    sa.Column('built_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('position')
+    )
+    op.create_table('prediction_summaries',
+    sa.Column('season', sa.Integer(), nullable=False),
+    sa.Column('position', sa.String(), nullable=False),
+    sa.Column('total_predictions', sa.Integer(), nullable=True),
+    sa.Column('avg_confidence', sa.Float(), nullable=True),
+    sa.Column('high_confidence_count', sa.Integer(), nullable=True),
+    sa.Column('breakout_candidates', sa.Integer(), nullable=True),
+    sa.Column('bust_risks', sa.Integer(), nullable=True),
+    sa.Column('built_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('season', 'position')
+    )
+    op.create_table('player_features',
+    sa.Column('player_id', sa.String(), nullable=False),
+    sa.Column('season', sa.Integer(), nullable=False),
+    sa.Column('position', sa.String(), nullable=True),
+    sa.Column('age', sa.Integer(), nullable=True),
+    sa.Column('experience', sa.Integer(), nullable=True),
+    sa.Column('team_strength', sa.Float(), nullable=True),
+    sa.Column('age_prime', sa.Float(), nullable=True),
+    sa.Column('breakout_window', sa.Float(), nullable=True),
+    sa.Column('avg_fantasy_points', sa.Float(), nullable=True),
+    sa.Column('consistency_score', sa.Float(), nullable=True),
+    sa.Column('trend_score', sa.Float(), nullable=True),
+    sa.Column('ceiling_score', sa.Float(), nullable=True),
+    sa.Column('computed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['player_id'], ['players.id'], ),
+    sa.PrimaryKeyConstraint('player_id', 'season')
+    )
+    op.create_table('player_predictions',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('player_id', sa.String(), nullable=True),
+    sa.Column('season', sa.Integer(), nullable=True),
+    sa.Column('predicted_points', sa.Float(), nullable=True),
+    sa.Column('confidence', sa.Float(), nullable=True),
+    sa.Column('reasoning', sa.String(), nullable=True),
+    sa.Column('projected_stats', sa.JSON(), nullable=True),
+    sa.Column('breakout_score', sa.Float(), nullable=True),
+    sa.Column('bust_risk', sa.Float(), nullable=True),
+    sa.Column('input_hash', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['player_id'], ['players.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_player_predictions_player_id', 'player_predictions', ['player_id'], unique=False)
+    op.create_index('ix_player_predictions_season', 'player_predictions', ['season'], unique=False)
+
+    op.create_table('player_stats',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('player_id', sa.String(), nullable=True),
+    sa.Column('season', sa.Integer(), nullable=True),
+    sa.Column('week', sa.Integer(), nullable=True),
+    sa.Column('passing_yards', sa.Integer(), nullable=True),
+    sa.Column('passing_tds', sa.Integer(), nullable=True),
+    sa.Column('interceptions', sa.Integer(), nullable=True),
+    sa.Column('passing_attempts', sa.Integer(), nullable=True),
+    sa.Column('passing_completions', sa.Integer(), nullable=True),
+    sa.Column('rushing_yards', sa.Integer(), nullable=True),
+    sa.Column('rushing_tds', sa.Integer(), nullable=True),
+    sa.Column('rushing_attempts', sa.Integer(), nullable=True),
+    sa.Column('receptions', sa.Integer(), nullable=True),
+    sa.Column('receiving_yards', sa.Integer(), nullable=True),
+    sa.Column('receiving_tds', sa.Integer(), nullable=True),
+    sa.Column('targets', sa.Integer(), nullable=True),
+    sa.Column('fantasy_points', sa.Float(), nullable=True),
+    sa.Column('fantasy_points_ppr', sa.Float(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['player_id'], ['players.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_player_stats_player_id', 'player_stats', ['player_id'], unique=False)
+    op.create_index('ix_player_stats_season', 'player_stats', ['season'], unique=False)
+
+    op.create_table('prediction_rankings',
+    sa.Column('season', sa.Integer(), nullable=False),
+    sa.Column('position', sa.String(), nullable=False),
+    sa.Column('rank', sa.Integer(), nullable=False),
+    sa.Column('tier', sa.Integer(), nullable=True),
+    sa.Column('player_id', sa.String(), nullable=True),
+    sa.Column('prediction_id', sa.String(), nullable=True),
+    sa.Column('player_name', sa.String(), nullable=True),
+    sa.Column('team', sa.String(), nullable=True),
+    sa.Column('predicted_points', sa.Float(), nullable=True),
+    sa.Column('confidence', sa.Float(), nullable=True),
+    sa.Column('breakout_score', sa.Float(), nullable=True),
+    sa.Column('reasoning', sa.String(), nullable=True),
+    sa.Column('built_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['player_id'], ['players.id'], ),
+    sa.PrimaryKeyConstraint('season', 'position', 'rank')
+    )
+
+def downgrade() -> None:
+    op.drop_table('prediction_rankings')
+    op.drop_index('ix_player_stats_season', table_name='player_stats')
+    op.drop_index('ix_player_stats_player_id', table_name='player_stats')
+
+    op.drop_table('player_stats')
+    op.drop_index('ix_player_predictions_season', table_name='player_predictions')
+    op.drop_index('ix_player_predictions_player_id', table_name='player_predictions')
+
+    op.drop_table('player_predictions')
+    op.drop_table('player_features')
+    op.drop_table('prediction_summaries')
+    op.drop_table('position_counts')
+    op.drop_index('ix_players_team', table_name='players')
+    op.drop_index('ix_players_position', table_name='players')
+    op.drop_index('ix_players_nfl_id', table_name='players')
+    op.drop_index('ix_players_name_id', table_name='players')
+    op.drop_index('ix_players_name', table_name='players')
+
+    op.drop_table('players')
+    op.drop_index('ix_jobs_status', table_name='jobs')
+    op.drop_index('ix_jobs_job_type', table_name='jobs')
+
+    op.drop_table('jobs')
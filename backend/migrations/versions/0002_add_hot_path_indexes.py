@@ -0,0 +1,55 @@
+"""Add composite and unique indexes for hot query paths
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 01:24:20.418466
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def _delete_duplicates(table: str, key: str, newest: str) -> None:
+    """Keep only the newest row per key so the unique index can be built"""
+    op.execute(f"""
+        DELETE FROM {table} WHERE id NOT IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY {newest} DESC, id DESC) AS rn
+                FROM {table}
+            ) ranked
+            WHERE rn = 1
+        )
+    """)
+
+def upgrade() -> None:
+    _delete_duplicates('player_predictions', 'player_id, season', 'updated_at')
+    _delete_duplicates('player_stats', 'player_id, season, week', 'created_at')
+
+    op.create_index('uq_player_predictions_player_season', 'player_predictions', ['player_id', 'season'], unique=True)
+    op.create_index('ix_player_predictions_season_points', 'player_predictions', ['season', sa.text('predicted_points DESC'), 'id'], unique=False)
+    op.create_index('ix_player_predictions_season_breakout', 'player_predictions', ['season', sa.text('breakout_score DESC'), 'id'], unique=False)
+    op.create_index('ix_player_predictions_season_confidence', 'player_predictions', ['season', 'confidence'], unique=False)
+    op.create_index('uq_player_stats_player_season_week', 'player_stats', ['player_id', 'season', 'week'], unique=True)
+    op.create_index('ix_players_position_name_id', 'players', ['position', 'name', 'id'], unique=False)
+
+    # Covered by the leading column of the unique indexes above
+    op.drop_index('ix_player_predictions_player_id', table_name='player_predictions')
+    op.drop_index('ix_player_stats_player_id', table_name='player_stats')
+
+def downgrade() -> None:
+    op.create_index('ix_player_stats_player_id', 'player_stats', ['player_id'], unique=False)
+    op.create_index('ix_player_predictions_player_id', 'player_predictions', ['player_id'], unique=False)
+
+    op.drop_index('ix_players_position_name_id', table_name='players')
+    op.drop_index('uq_player_stats_player_season_week', table_name='player_stats')
+    op.drop_index('ix_player_predictions_season_confidence', table_name='player_predictions')
+    op.drop_index('ix_player_predictions_season_breakout', table_name='player_predictions')
+    op.drop_index('ix_player_predictions_season_points', table_name='player_predictions')
+    op.drop_index('uq_player_predictions_player_season', table_name='player_predictions')
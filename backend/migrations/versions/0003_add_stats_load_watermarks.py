@@ -0,0 +1,29 @@
+"""Add stats load watermarks
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 01:27:40.667025
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.create_table('stats_load_watermarks',
+    sa.Column('season', sa.Integer(), nullable=False),
+    sa.Column('last_week', sa.Integer(), nullable=True),
+    sa.Column('rows_loaded', sa.Integer(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('season')
+    )
+
+def downgrade() -> None:
+    op.drop_table('stats_load_watermarks')
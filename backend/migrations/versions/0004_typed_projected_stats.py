@@ -0,0 +1,106 @@
+"""Store projected stats in typed columns and reasoning as codes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 01:29:48.208314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROJECTED_STATS = [
+    'passing_yards', 'passing_tds', 'interceptions',
+    'rushing_yards', 'rushing_tds',
+    'receptions', 'receiving_yards', 'receiving_tds', 'targets'
+]
+
+predictions = sa.table(
+    'player_predictions',
+    sa.column('id', sa.String),
+    sa.column('reasoning', sa.String),
+    sa.column('reasoning_codes', sa.String),
+    sa.column('projected_stats', sa.JSON),
+    *[sa.column(f'projected_{stat}', sa.Integer) for stat in PROJECTED_STATS]
+)
+
+def _clear_read_models() -> None:
+    """Rankings embed reasoning; startup rebuilds them once the summaries are gone"""
+    op.execute("DELETE FROM prediction_rankings")
+    op.execute("DELETE FROM prediction_summaries")
+
+def upgrade() -> None:
+    with op.batch_alter_table('player_predictions') as batch_op:
+        batch_op.add_column(sa.Column('reasoning_codes', sa.String(), nullable=True))
+        for stat in PROJECTED_STATS:
+            batch_op.add_column(sa.Column(f'projected_{stat}', sa.Integer(), nullable=True))
+
+    # Free-text reasoning cannot be coded; it is regenerated on the next prediction run
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(predictions.c.id, predictions.c.projected_stats).where(predictions.c.projected_stats.isnot(None))
+    ).all()
+    updates = [
+        {'_id': row.id, **{f'projected_{stat}': row.projected_stats.get(stat) for stat in PROJECTED_STATS}}
+        for row in rows
+    ]
+    if updates:
+        connection.execute(
+            predictions.update().where(predictions.c.id == sa.bindparam('_id')),
+            updates
+        )
+
+    with op.batch_alter_table('player_predictions') as batch_op:
+        batch_op.drop_column('projected_stats')
+        batch_op.drop_column('reasoning')
+
+    with op.batch_alter_table('prediction_rankings') as batch_op:
+        batch_op.add_column(sa.Column('reasoning_codes', sa.String(), nullable=True))
+        batch_op.drop_column('reasoning')
+
+    _clear_read_models()
+
+def downgrade() -> None:
+    with op.batch_alter_table('prediction_rankings') as batch_op:
+        batch_op.add_column(sa.Column('reasoning', sa.String(), nullable=True))
+        batch_op.drop_column('reasoning_codes')
+
+    with op.batch_alter_table('player_predictions') as batch_op:
+        batch_op.add_column(sa.Column('reasoning', sa.String(), nullable=True))
+        batch_op.add_column(sa.Column('projected_stats', sa.JSON(), nullable=True))
+
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(predictions)).all()
+    updates = [
+        {
+            '_id': row.id,
+            'reasoning': row.reasoning_codes or "",
+            'projected_stats': {
+                stat: getattr(row, f'projected_{stat}') for stat in PROJECTED_STATS
+                if getattr(row, f'projected_{stat}') is not None
+            }
+        }
+        for row in rows
+    ]
+    if updates:
+        connection.execute(
+            predictions.update().where(predictions.c.id == sa.bindparam('_id')).values(
+                reasoning=sa.bindparam('reasoning'),
+                projected_stats=sa.bindparam('projected_stats')
+            ),
+            updates
+        )
+
+    with op.batch_alter_table('player_predictions') as batch_op:
+        for stat in reversed(PROJECTED_STATS):
+            batch_op.drop_column(f'projected_{stat}')
+        batch_op.drop_column('reasoning_codes')
+
+    _clear_read_models()
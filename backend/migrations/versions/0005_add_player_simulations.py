@@ -0,0 +1,41 @@
+"""Add player simulations
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 01:33:35.639507
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.create_table('player_simulations',
+    sa.Column('player_id', sa.String(), nullable=False),
+    sa.Column('season', sa.Integer(), nullable=False),
+    sa.Column('simulations', sa.Integer(), nullable=True),
+    sa.Column('weeks_remaining', sa.Integer(), nullable=True),
+    sa.Column('floor', sa.Float(), nullable=True),
+    sa.Column('median', sa.Float(), nullable=True),
+    sa.Column('ceiling', sa.Float(), nullable=True),
+    sa.Column('boom_probability', sa.Float(), nullable=True),
+    sa.Column('bust_probability', sa.Float(), nullable=True),
+    sa.Column('ros_mean', sa.Float(), nullable=True),
+    sa.Column('ros_floor', sa.Float(), nullable=True),
+    sa.Column('ros_ceiling', sa.Float(), nullable=True),
+    sa.Column('simulated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['player_id'], ['players.id'], ),
+    sa.PrimaryKeyConstraint('player_id', 'season')
+    )
+    op.create_index('ix_player_simulations_season_ros_mean', 'player_simulations', ['season', sa.text('ros_mean DESC'), 'player_id'], unique=False)
+
+def downgrade() -> None:
+    op.drop_index('ix_player_simulations_season_ros_mean', table_name='player_simulations')
+    op.drop_table('player_simulations')
@@ -0,0 +1,24 @@
+"""Index prediction summaries by build time
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 01:36:52.184307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # max(built_at) is the prediction snapshot version, read on every prediction request
+    op.create_index('ix_prediction_summaries_built_at', 'prediction_summaries', ['built_at'], unique=False)
+
+def downgrade() -> None:
+    op.drop_index('ix_prediction_summaries_built_at', table_name='prediction_summaries')
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""Index position counts by build time
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 01:40:58.731264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # max(built_at) is the roster version, read on every player request
+    op.create_index('ix_position_counts_built_at', 'position_counts', ['built_at'], unique=False)
+
+def downgrade() -> None:
+    op.drop_index('ix_position_counts_built_at', table_name='position_counts')
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""Add players name trigram index
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 01:47:21.305118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Name search on other databases uses the in-process index instead
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # IF NOT EXISTS: databases that ran the old startup hook already have both
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_players_name_trgm "
+        "ON players USING gin (name gin_trgm_ops)"
+    )
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_players_name_trgm")
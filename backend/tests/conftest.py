@@ -0,0 +1,95 @@
+"""Shared fixtures: a seeded synthetic league, the API client and a SQL statement recorder.
+
+Run from backend/ with `python -m pytest`. Tests use a scratch SQLite database
+unless TEST_DATABASE_URL points elsewhere; whatever it points at is dropped
+and recreated.
+"""
+import asyncio
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import List
+
+import pytest
+
+# The app reads its settings at import time, so configure it before anything imports it
+SCRATCH_DIR = tempfile.mkdtemp(prefix="fantasyedge-tests-")
+os.environ["DATABASE_URL"] = os.getenv("TEST_DATABASE_URL", f"sqlite:///{os.path.join(SCRATCH_DIR, 'test.db')}")
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["JOB_EXECUTOR"] = "inprocess"
+os.environ["MODEL_DIR"] = os.path.join(SCRATCH_DIR, "models")
+os.environ["STATS_INBOX_DIR"] = os.path.join(SCRATCH_DIR, "stats")
+# Check the snapshot version on every read, so each request runs the same statements
+os.environ["SNAPSHOT_CHECK_SECONDS"] = "0"
+
+# Synthetic league size; enough players per position for the largest pages
+LEAGUE_PLAYERS = 300
+LEAGUE_SEASONS = 2
+
+class StatementRecorder:
+    """SQL statements run on the sync and async engines while recording"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def matching(self, prefix: str) -> List[str]:
+        return [statement for statement in self.statements if statement.lstrip().upper().startswith(prefix)]
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+@pytest.fixture(scope="session")
+def league():
+    """Players, weekly stats, predictions, rankings and simulations for the current season"""
+    from app.models.database import SessionLocal, PlayerPrediction
+    from app.services.prediction_service import PredictionService
+    from app.services.ranking_service import ranking_service
+    from app.services.simulation_service import simulation_service
+    from benchmarks.synthetic import build_league
+
+    db = SessionLocal()
+    try:
+        build_league(db, LEAGUE_PLAYERS, LEAGUE_SEASONS)
+        prediction_service = PredictionService()
+        asyncio.run(prediction_service.generate_all_predictions(db))
+        ranking_service.rebuild(db)
+        ranking_service.rebuild_position_counts(db)
+        simulation_service.run(db, prediction_service.current_season, simulations=200, workers=0)
+
+        predicted = [row.player_id for row in db.query(PlayerPrediction.player_id).order_by(PlayerPrediction.player_id)]
+        return {'season': prediction_service.current_season, 'predicted_player_ids': predicted}
+    finally:
+        db.close()
+
+@pytest.fixture(scope="session")
+def client(league):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture
+def record_statements():
+    """Context manager that records the SQL statements run inside it"""
+    from sqlalchemy import event
+    from app.models.database import engine, async_engine
+
+    @contextmanager
+    def record():
+        recorder = StatementRecorder()
+        engines = [engine, async_engine.sync_engine]
+        for target in engines:
+            event.listen(target, "before_cursor_execute", recorder._on_execute)
+        try:
+            yield recorder
+        finally:
+            for target in engines:
+                event.remove(target, "before_cursor_execute", recorder._on_execute)
+
+    return record
@@ -0,0 +1,82 @@
+"""Bulk writes stay a handful of statements however many rows they carry"""
+import asyncio
+
+import pytest
+
+# A season with no data in the seeded league, written and removed by each test
+SCRATCH_SEASON = 2031
+
+@pytest.fixture
+def db(league):
+    from app.models.database import SessionLocal
+
+    db = SessionLocal()
+    yield db
+    db.close()
+
+@pytest.fixture
+def scratch_season(db):
+    from app.models.database import PlayerFeature, PlayerPrediction
+
+    yield SCRATCH_SEASON
+    db.rollback()
+    db.query(PlayerPrediction).filter(PlayerPrediction.season == SCRATCH_SEASON).delete()
+    db.query(PlayerFeature).filter(PlayerFeature.season == SCRATCH_SEASON).delete()
+    db.commit()
+
+def test_prediction_run_inserts_and_updates_in_one_batch(db, scratch_season, record_statements, league):
+    from app.services.prediction_service import PredictionService
+
+    prediction_service = PredictionService()
+
+    # Positions project different stats, so rows carry NULLs in different columns
+    with record_statements() as cold:
+        created = asyncio.run(prediction_service.generate_all_predictions(db, scratch_season))
+    with record_statements() as forced:
+        updated = asyncio.run(prediction_service.generate_all_predictions(db, scratch_season, force=True))
+
+    assert created['created'] > 100
+    assert len(cold.matching("INSERT INTO PLAYER_PREDICTIONS")) == 1
+    assert updated['updated'] == created['created']
+    assert len(forced.matching("UPDATE PLAYER_PREDICTIONS")) == 1
+
+@pytest.fixture
+def sparse_roster(db):
+    """Players with age, weight and college missing at random, as ESPN rosters often are"""
+    from app.models.database import Player
+
+    roster = [
+        {
+            'nfl_id': f'sparse-{i}',
+            'name': f'Sparse Player {i}',
+            'position': 'WR',
+            'team': 'FA',
+            'age': None if i % 2 else 25,
+            'experience': 3,
+            'height': '6-1',
+            'weight': None if i % 3 else 200,
+            'college': None if i % 5 else 'State'
+        }
+        for i in range(400)
+    ]
+    yield roster
+    db.rollback()
+    db.query(Player).filter(Player.nfl_id.like('sparse-%')).delete(synchronize_session=False)
+    db.commit()
+
+def test_roster_upsert_inserts_and_updates_in_one_batch(db, sparse_roster, record_statements):
+    from app.services.player_service import PlayerService
+
+    player_service = PlayerService()
+    with record_statements() as inserted:
+        created = asyncio.run(player_service._save_players_to_db(db, sparse_roster))
+
+    traded = [{**player, 'team': 'KC'} for player in sparse_roster]
+    with record_statements() as updated:
+        changed = asyncio.run(player_service._save_players_to_db(db, traded))
+
+    assert created['inserted'] == len(sparse_roster)
+    assert changed['updated'] == len(sparse_roster)
+    assert len(inserted.matching("INSERT INTO PLAYERS")) == 1
+    # PostgreSQL updates through the same INSERT ... ON CONFLICT, other databases with a bulk UPDATE
+    assert len(updated.matching("INSERT INTO PLAYERS")) + len(updated.matching("UPDATE PLAYERS")) == 1
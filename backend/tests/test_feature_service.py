@@ -0,0 +1,33 @@
+"""Per-season features are built only from earlier seasons."""
+import asyncio
+
+import pytest
+
+from app.models.database import SessionLocal, Player, PlayerStat
+from app.services.feature_service import feature_service, POSITION_BASELINES
+
+@pytest.fixture
+def db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def test_features_use_only_seasons_before_the_keyed_season(league, db):
+    first_season = db.query(PlayerStat.season).order_by(PlayerStat.season).first().season
+    player_id = db.query(PlayerStat.player_id).filter(
+        PlayerStat.season == first_season, PlayerStat.fantasy_points > 0
+    ).first().player_id
+
+    def avg_points(season):
+        features = asyncio.run(feature_service.get_features(db, season, [player_id]))
+        return features.loc[player_id, 'avg_fantasy_points']
+
+    points = [row.fantasy_points for row in db.query(PlayerStat.fantasy_points).filter(
+        PlayerStat.player_id == player_id, PlayerStat.season == first_season, PlayerStat.fantasy_points != 0
+    )]
+
+    # The first season has no history, so it gets the positional baseline; the next one sees only the first
+    assert avg_points(first_season) == POSITION_BASELINES[db.get(Player, player_id).position]
+    assert avg_points(first_season + 1) == pytest.approx(sum(points) / len(points))
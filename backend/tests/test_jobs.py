@@ -0,0 +1,61 @@
+"""Background job recovery and cleanup."""
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.database import SessionLocal, Job
+from app.services.job_service import job_service, STALE_JOB_SECONDS
+
+@pytest.fixture
+def db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def wait_for_job(db, job_id: str, timeout: float = 10) -> Job:
+    """Poll until the in-process executor finishes a job"""
+    deadline = time.monotonic() + timeout
+    while True:
+        db.expire_all()
+        job = db.get(Job, job_id)
+        if job.status in ("completed", "failed") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+def test_failed_ingest_removes_its_file(client, db):
+    response = client.post(
+        "/api/stats/ingest",
+        files={"file": ("week1.csv", b"nfl_id,passing_yards\n1,250\n", "text/csv")}
+    )
+    assert response.status_code == 202
+
+    job = wait_for_job(db, response.json()['job_id'])
+    assert job.status == "failed"
+    assert "missing required columns" in job.error
+    assert not os.path.exists(job.params['path'])
+
+def test_rescan_resumes_jobs_of_a_dead_worker(client, db, tmp_path):
+    # A worker died mid-load, long enough ago that its job is stale
+    path = tmp_path / "week1.csv"
+    path.write_text("nfl_id,passing_yards\n1,250\n")
+    job = Job(
+        id=str(uuid.uuid4()), job_type="ingest_stats", status="running",
+        params={"path": str(path), "format": "csv"}, total=1, processed=0,
+        updated_at=datetime.utcnow() - timedelta(seconds=STALE_JOB_SECONDS + 1)
+    )
+    db.add(job)
+    db.commit()
+
+    async def one_rescan():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(job_service.watch_incomplete_jobs(interval=0), timeout=0.5)
+    asyncio.run(one_rescan())
+
+    assert wait_for_job(db, job.id).status == "failed"
+    assert not path.exists()
@@ -0,0 +1,38 @@
+"""Trained forests are served from memory-mapped node arrays"""
+import numpy as np
+
+def test_forest_arrays_predict_like_scikit_learn(tmp_path):
+    from sklearn.ensemble import RandomForestRegressor
+    from app.services.model_service import ForestModel, flatten_forest
+
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(400, 6))
+    y = X[:, 0] * 3 + np.sin(X[:, 1]) + rng.normal(scale=0.1, size=400)
+    forest = RandomForestRegressor(n_estimators=25, min_samples_leaf=3, random_state=0).fit(X, y)
+
+    ForestModel(flatten_forest(forest)).save(str(tmp_path))
+    loaded = ForestModel.load(str(tmp_path))
+
+    assert all(isinstance(array, np.memmap) for array in loaded.arrays.values())
+    np.testing.assert_allclose(loaded.predict(X), forest.predict(X), rtol=1e-9)
+
+def test_trained_model_is_served_memory_mapped(tmp_path, league):
+    from app.models.database import SessionLocal
+    from app.services.model_service import ModelService
+
+    db = SessionLocal()
+    try:
+        metadata = ModelService(str(tmp_path)).train(db, league['season'])
+        # Retraining straight away publishes a new version rather than overwriting this one
+        retrained = ModelService(str(tmp_path)).train(db, league['season'])
+    finally:
+        db.close()
+
+    # A fresh service, as in another worker process
+    service = ModelService(str(tmp_path))
+    model = service.get_model()
+
+    assert retrained['version'] != metadata['version']
+    assert service.version == retrained['version']
+    assert isinstance(model.arrays['threshold'], np.memmap)
+    assert model.predict(np.zeros((3, len(metadata['features'])))).shape == (3,)
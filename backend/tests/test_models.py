@@ -0,0 +1,19 @@
+"""ORM relationships between players and their derived rows."""
+import uuid
+
+from app.models.database import SessionLocal, Player, PlayerSimulation
+
+def test_deleting_a_player_deletes_its_simulations(league):
+    db = SessionLocal()
+    try:
+        player = Player(id=str(uuid.uuid4()), name="Cut Player", position="WR")
+        player.simulations.append(PlayerSimulation(season=league['season'], simulations=1, ros_mean=0.0))
+        db.add(player)
+        db.commit()
+
+        db.delete(player)
+        db.commit()
+
+        assert db.get(PlayerSimulation, (player.id, league['season'])) is None
+    finally:
+        db.close()
@@ -0,0 +1,41 @@
+"""Concurrent roster fetches against a stubbed ESPN API."""
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.services.player_service import PlayerService
+from benchmarks.espn_stub import espn_stub
+from benchmarks.synthetic import generate_players
+
+@pytest.fixture(scope="module")
+def roster():
+    return generate_players(96, np.random.default_rng(7))
+
+def fetch(roster, **options):
+    service = PlayerService(transport=espn_stub(roster, **options), max_retries=2, backoff=0)
+    return asyncio.run(service.fetch_rosters())
+
+def nfl_ids(players):
+    return sorted(player['nfl_id'] for player in players)
+
+def test_fetches_every_team(roster):
+    assert nfl_ids(fetch(roster)) == nfl_ids(roster)
+
+def test_failed_team_is_skipped_and_the_rest_kept(roster):
+    # 404 is not retried; 503 on every attempt exhausts the retries
+    players = fetch(roster, faults={'BUF': [404], 'DAL': [503, 503, 503]})
+
+    expected = [player for player in roster if player['team'] not in ('BUF', 'DAL')]
+    assert nfl_ids(players) == nfl_ids(expected)
+
+def test_transient_failures_are_retried(roster):
+    players = fetch(roster, faults={'BUF': [503, 429], 'DAL': [502]})
+
+    assert nfl_ids(players) == nfl_ids(roster)
+
+def test_slow_api_exhausts_the_timeout_budget(roster):
+    service = PlayerService(transport=espn_stub(roster, delay=0.5), total_timeout=0.1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(service.fetch_rosters())
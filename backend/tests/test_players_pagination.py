@@ -0,0 +1,46 @@
+"""Keyset pagination of GET /players returns every player exactly once"""
+import uuid
+
+import pytest
+
+@pytest.fixture
+def awkward_names(league):
+    """Players whose sort keys tie or sort first: blank and duplicated names"""
+    from app.models.database import SessionLocal, Player
+
+    db = SessionLocal()
+    names = [''] * 6 + ['Same Name'] * 5 + ['Aaron', 'zed']
+    db.add_all([
+        Player(id=str(uuid.uuid4()), nfl_id=f'awkward-{i}', name=name, position='WR', team='FA')
+        for i, name in enumerate(names)
+    ])
+    db.commit()
+    yield
+    db.query(Player).filter(Player.nfl_id.like('awkward-%')).delete(synchronize_session=False)
+    db.commit()
+    db.close()
+
+def _walk(client, query: str):
+    ids = []
+    response = client.get(f"/api/players/?{query}").json()
+    while True:
+        ids.extend(player['id'] for player in response['players'])
+        if not response['next_cursor']:
+            return ids
+        response = client.get(f"/api/players/?{query}&cursor={response['next_cursor']}").json()
+
+@pytest.mark.parametrize("position", [None, "WR"])
+def test_keyset_walk_returns_every_player_once(client, awkward_names, position):
+    from app.models.database import SessionLocal, Player
+
+    db = SessionLocal()
+    query = db.query(Player.id)
+    if position:
+        query = query.filter(Player.position == position)
+    expected = {row.id for row in query}
+    db.close()
+
+    ids = _walk(client, f"limit=4&include_total=false{'&position=' + position if position else ''}")
+
+    assert len(ids) == len(set(ids))
+    assert set(ids) == expected
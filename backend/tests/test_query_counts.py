@@ -0,0 +1,48 @@
+"""Read endpoints run the same number of SQL statements whatever the page size"""
+import pytest
+
+# (path template, smallest page, largest page the endpoint accepts)
+PAGED_ENDPOINTS = [
+    ("/api/predictions/?limit={limit}", 1, 100),
+    ("/api/predictions/?position=WR&sort_by=receptions&limit={limit}", 1, 50),
+    ("/api/predictions/breakout-candidates?min_score=0&limit={limit}", 1, 50),
+    ("/api/predictions/position-rankings/WR?limit={limit}", 1, 50),
+    ("/api/dashboard?min_breakout_score=0&breakout_limit={limit}&rankings_limit={limit}", 1, 50),
+]
+
+@pytest.fixture(autouse=True)
+def warm_snapshot(client):
+    """Load the prediction snapshot first; a cold load adds its own statements to whichever call comes first"""
+    client.get("/api/predictions/snapshot").raise_for_status()
+
+def _statements_for(client, record_statements, path):
+    with record_statements() as recorded:
+        response = client.get(path)
+    assert response.status_code == 200, response.text
+    return recorded.count, response.json()
+
+@pytest.mark.parametrize("template, small, large", PAGED_ENDPOINTS)
+def test_statement_count_independent_of_limit(client, record_statements, template, small, large):
+    small_count, small_body = _statements_for(client, record_statements, template.format(limit=small))
+    large_count, large_body = _statements_for(client, record_statements, template.format(limit=large))
+
+    assert small_body != large_body
+    assert small_count == large_count
+
+def test_predictions_batch_statement_count_independent_of_size(client, record_statements, league):
+    ids = league['predicted_player_ids']
+    one_count, one = _statements_for(client, record_statements, f"/api/predictions/batch?player_ids={ids[0]}")
+    many_count, many = _statements_for(
+        client, record_statements, f"/api/predictions/batch?player_ids={','.join(ids[:100])}"
+    )
+
+    assert (len(one), len(many)) == (1, 100)
+    assert one_count == many_count
+
+def test_players_batch_statement_count_independent_of_size(client, record_statements, league):
+    ids = league['predicted_player_ids']
+    one_count, one = _statements_for(client, record_statements, f"/api/players/batch?ids={ids[0]}")
+    many_count, many = _statements_for(client, record_statements, f"/api/players/batch?ids={','.join(ids[:100])}")
+
+    assert (len(one), len(many)) == (1, 100)
+    assert one_count == many_count
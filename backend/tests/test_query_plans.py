@@ -0,0 +1,93 @@
+"""EXPLAIN the SQL behind the read endpoints against the seeded test database.
+
+Only the reads named in benchmarks.explain.INTENTIONAL_FULL_READS may read a
+whole table; the other hot reads must be served by the index named here.
+"""
+import pytest
+
+from app.models.database import async_engine
+from app.services.stats_service import stats_service
+from benchmarks.explain import ENDPOINTS, capture_queries, explain_all
+
+# Marks a read served by its table's primary key, whose index name depends on the database
+PRIMARY_KEY = None
+
+# Reads that must use a given index: (endpoint, SQL fragment, table, index)
+INDEXED_READS = {
+    "snapshot version": (
+        "/api/predictions/?limit=50", "max(prediction_summaries.built_at)", "prediction_summaries",
+        "ix_prediction_summaries_built_at"
+    ),
+    "prediction summary": (
+        "/api/predictions/summary", "FROM prediction_summaries WHERE", "prediction_summaries", PRIMARY_KEY
+    ),
+    "position rankings": (
+        "/api/predictions/position-rankings/WR", "FROM prediction_rankings WHERE", "prediction_rankings", PRIMARY_KEY
+    ),
+    "roster version": (
+        "/api/players/?limit=50", "max(position_counts.built_at)", "position_counts", "ix_position_counts_built_at"
+    ),
+    "simulation version": (
+        "/api/predictions/simulations?limit=50", "max(player_simulations.simulated_at)", "player_simulations",
+        "ix_player_simulations_season_ros_mean"
+    ),
+    "simulations": (
+        "/api/predictions/simulations?limit=50", "FROM player_simulations JOIN", "player_simulations",
+        "ix_player_simulations_season_ros_mean"
+    ),
+    "players first page": (
+        "/api/players/?limit=50", "FROM players ORDER BY players.name, players.id", "players", "ix_players_name_id"
+    ),
+    "players next page": (
+        "/api/players/?limit=50&cursor={cursor}", "FROM players WHERE (players.name, players.id) >", "players",
+        "ix_players_name_id"
+    ),
+    "players by position": (
+        "/api/players/?position=RB&limit=50", "FROM players WHERE players.position =", "players",
+        "ix_players_position_name_id"
+    ),
+    "stats points": (
+        "/api/stats/points?season=2022&scoring_profile=ppr", "count(player_stats.id)", "player_stats",
+        "ix_player_stats_season"
+    ),
+}
+
+def index_name(table: str, index: str) -> str:
+    if index is not PRIMARY_KEY:
+        return index
+    return f"sqlite_autoindex_{table}_1" if async_engine.dialect.name == "sqlite" else f"{table}_pkey"
+
+@pytest.fixture(scope="module")
+def query_plans(league, client):
+    """EXPLAIN output for every SELECT the checked endpoints run"""
+    player_id = league['predicted_player_ids'][0]
+    cursor = client.get("/api/players/?limit=50&include_total=false").json()['next_cursor']
+
+    paths = [path.format(player_id=player_id) for path in ENDPOINTS]
+    paths += [path.format(cursor=cursor) for path, *_ in INDEXED_READS.values()]
+
+    # Season totals are cached per process; start cold so their query is captured
+    stats_service._totals.clear()
+    queries = capture_queries(async_engine.sync_engine, client, paths)
+    # On the app's event loop, where the async engine's pooled connections live
+    return client.portal.call(explain_all, async_engine, queries)
+
+def test_only_intentional_reads_scan_whole_tables(query_plans):
+    unexpected = [
+        f"{result['path']}: {' '.join(result['statement'].split())} -> {result['plan']}"
+        for result in query_plans if result['full_scans'] and not result['intentional']
+    ]
+
+    assert not unexpected, "\n".join(unexpected)
+
+@pytest.mark.parametrize("name", INDEXED_READS)
+def test_read_uses_index(query_plans, name):
+    path, fragment, table, index = INDEXED_READS[name]
+    plans = [
+        result['plan'] for result in query_plans
+        if result['path'].split("?")[0] == path.split("?")[0] and fragment in " ".join(result['statement'].split())
+    ]
+
+    assert plans, f"{name}: no statement containing {fragment!r} on {path}"
+    for plan in plans:
+        assert index_name(table, index) in " ".join(plan), f"{name}: {plan}"
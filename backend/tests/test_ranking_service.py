@@ -0,0 +1,32 @@
+"""Materialized rankings and summaries."""
+import pytest
+
+from app.models.database import SessionLocal, PredictionRanking, PredictionSummary
+from app.services.ranking_service import ranking_service, ALL_POSITIONS
+
+# A season no prediction belongs to
+STALE_SEASON = 1999
+
+@pytest.fixture
+def db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def test_full_rebuild_drops_seasons_without_predictions(league, db):
+    ranking = db.query(PredictionRanking).filter(PredictionRanking.season == league['season']).first()
+    db.add(PredictionRanking(
+        season=STALE_SEASON, position=ranking.position, rank=1, tier=1,
+        player_id=ranking.player_id, prediction_id=ranking.prediction_id,
+        player_name=ranking.player_name, predicted_points=ranking.predicted_points
+    ))
+    db.add(PredictionSummary(season=STALE_SEASON, position=ALL_POSITIONS, total_predictions=1))
+    db.commit()
+
+    ranking_service.rebuild(db)
+
+    assert not db.query(PredictionRanking).filter(PredictionRanking.season == STALE_SEASON).count()
+    assert not db.query(PredictionSummary).filter(PredictionSummary.season == STALE_SEASON).count()
+    assert db.get(PredictionSummary, (league['season'], ALL_POSITIONS)).total_predictions > 0
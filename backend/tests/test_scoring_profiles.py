@@ -0,0 +1,19 @@
+"""Scoring profiles report the weights rescored predictions ignore."""
+
+def test_profile_lists_its_unprojected_stats(client):
+    created = client.post("/api/scoring-profiles/", json={
+        "name": "Volume league",
+        "scoring": {"passing_yards": 0.04, "passing_completions": 0.25, "rushing_attempts": 0.1, "passing_attempts": 0}
+    })
+    assert created.status_code == 201
+    assert created.json()['unprojected_stats'] == ["passing_completions", "rushing_attempts"]
+
+    fetched = client.get(f"/api/scoring-profiles/{created.json()['id']}").json()
+    assert fetched['unprojected_stats'] == ["passing_completions", "rushing_attempts"]
+
+def test_builtin_profiles_only_weight_projected_stats(client):
+    profiles = client.get("/api/scoring-profiles/").json()
+
+    assert {profile['id']: profile['unprojected_stats'] for profile in profiles if profile['builtin']} == {
+        "standard": [], "half_ppr": [], "ppr": [], "six_point_passing_td": []
+    }
@@ -0,0 +1,58 @@
+"""Ranked, typo-tolerant player name search."""
+import pytest
+
+from app.models.database import SessionLocal, Player
+from app.services.ranking_service import ranking_service
+from app.services.search_service import NameIndex
+
+NAMES = [
+    "Christian McCaffrey", "Josh Allen", "A.J. Brown", "Keenan Allen", "Allen Robinson",
+    "Callen Smith", "Jalen Hurts", "Dalen Jones", "Tyreek Hill"
+]
+
+@pytest.fixture
+def index():
+    return NameIndex([(name, name, "WR") for name in NAMES])
+
+@pytest.fixture
+def db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def test_matches_rank_prefix_then_word_then_substring(index):
+    assert index.search("allen") == ["Allen Robinson", "Josh Allen", "Keenan Allen", "Callen Smith"]
+    assert index.search("josh allen")[0] == "Josh Allen"
+
+@pytest.mark.parametrize("query, expected", [
+    ("mcaffery", "Christian McCaffrey"),
+    ("jsh alen", "Josh Allen"),
+    ("aj brown", "A.J. Brown")
+])
+def test_typos_and_punctuation_find_the_player(index, query, expected):
+    assert index.search(query)[0] == expected
+
+def test_prefix_match_outranks_trigram_match(index):
+    # "Dalen Jones" shares most of the query's trigrams and sorts first by name
+    assert index.search("jalen")[:2] == ["Jalen Hurts", "Dalen Jones"]
+
+def test_index_rebuilds_on_roster_refresh(client, db):
+    player = db.query(Player).order_by(Player.id).first()
+    name = player.name
+    # Synthetic names repeat, so the player need not be the first exact match
+    assert player.id in [row['id'] for row in client.get("/api/players/search", params={"q": name, "limit": 50}).json()]
+
+    # A roster refresh renames the player, then rebuilds the position counts
+    player.name = "Zzyzx Quarterback"
+    db.commit()
+    ranking_service.rebuild_position_counts(db)
+    try:
+        found = client.get("/api/players/search", params={"q": "zzyzx"}).json()
+    finally:
+        player.name = name
+        db.commit()
+        ranking_service.rebuild_position_counts(db)
+
+    assert [row['id'] for row in found] == [player.id]
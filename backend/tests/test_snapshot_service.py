@@ -0,0 +1,25 @@
+"""Prediction snapshot loading under concurrent requests."""
+import asyncio
+
+from app.services.snapshot_service import SnapshotService
+
+def test_concurrent_first_reads_load_the_snapshot_once(league, client, monkeypatch):
+    service = SnapshotService(check_seconds=60)
+    reload = service.reload
+    loaded = []
+
+    async def counting_reload(version=None):
+        loaded.append(version)
+        return await reload(version)
+
+    monkeypatch.setattr(service, "reload", counting_reload)
+
+    async def first_reads():
+        return await asyncio.gather(*[service.get() for _ in range(5)])
+
+    # On the app's event loop, where the async engine's pooled connections live
+    snapshots = client.portal.call(first_reads)
+
+    assert len(loaded) == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert snapshots[0].season(league['season']).size == len(league['predicted_player_ids'])
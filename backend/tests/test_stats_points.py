@@ -0,0 +1,42 @@
+"""Season points scored from loaded weekly stats."""
+import pytest
+
+from app.models.database import SessionLocal, Player
+from app.services.ranking_service import ranking_service
+
+POINTS_PATH = "/api/stats/points?season=2022&scoring_profile=ppr&limit=500"
+
+@pytest.fixture
+def db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+def test_roster_refresh_updates_cached_player_columns(league, client, db):
+    before = client.get(POINTS_PATH).json()
+    player = db.get(Player, before[0]['player_id'])
+    name, team = player.name, player.team
+
+    # A roster refresh renames and trades a player, then rebuilds the position counts
+    player.name, player.team = f"{name} Jr.", "FA"
+    db.commit()
+    ranking_service.rebuild_position_counts(db)
+    try:
+        after = client.get(POINTS_PATH).json()
+    finally:
+        player.name, player.team = name, team
+        db.commit()
+        ranking_service.rebuild_position_counts(db)
+
+    assert (after[0]['player_name'], after[0]['team']) == (f"{name} Jr.", "FA")
+    assert [row['fantasy_points'] for row in after] == [row['fantasy_points'] for row in before]
+
+def test_tied_players_are_ordered_by_id(league, client):
+    rows = client.get(POINTS_PATH).json()
+    # Kickers and defenses have no scored stat lines, so they all tie at zero
+    scoreless = [row['player_id'] for row in rows if row['fantasy_points'] == 0]
+
+    assert len(scoreless) > 1
+    assert scoreless == sorted(scoreless)
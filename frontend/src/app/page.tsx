@@ -4,11 +4,12 @@ import DashboardLayout from '@/components/layout/DashboardLayout';
 import DashboardStats from '@/components/dashboard/DashboardStats';
 import PlayersList from '@/components/players/PlayersList';
 import BreakoutCandidates from '@/components/predictions/BreakoutCandidates';
-import { usePredictionSummary } from '@/lib/hooks/usePredictions';
+import { useDashboard } from '@/lib/hooks/useDashboard';
 
 export default function HomePage() {
-  const { summary } = usePredictionSummary();
-  const hasPredictions = summary && summary.total_predictions > 0;
+  // One request feeds the stats cards, charts and breakout candidates
+  const { dashboard, loading, error } = useDashboard();
+  const hasPredictions = dashboard && dashboard.summary.total_predictions > 0;
 
   return (
     <DashboardLayout>
@@ -44,10 +45,12 @@ export default function HomePage() {
         </div>
 
         {/* Dashboard Stats */}
-        <DashboardStats />
+        <DashboardStats dashboard={dashboard} loading={loading} error={error} />
 
         {/* Breakout Candidates Section (only show if predictions exist) */}
-        {hasPredictions && <BreakoutCandidates />}
+        {hasPredictions && (
+          <BreakoutCandidates candidates={dashboard.breakout_candidates} loading={loading} error={error} />
+        )}
 
         {/* Players Section */}
         <PlayersList />
@@ -6,7 +6,7 @@ import PlayerDetailHeader from '@/components/players/PlayerDetailHeader';
 import PlayerPredictionAnalysis from '@/components/players/PlayerPredictionAnalysis';
 import PlayerProjectedStats from '@/components/players/PlayerProjectedStats';
 import PlayerInsights from '@/components/players/PlayerInsights';
-import { usePlayers } from '@/lib/hooks/usePlayers';
+import { usePlayer } from '@/lib/hooks/usePlayers';
 import { usePlayerPrediction } from '@/lib/hooks/usePredictions';
 import { ArrowLeft, Loader2 } from 'lucide-react';
 import Link from 'next/link';
@@ -15,12 +15,11 @@ export default function PlayerDetailPage() {
   const params = useParams();
   const playerId = params?.id as string;
   
-  const { data: playersData, loading: playersLoading } = usePlayers();
+  // The player and their prediction load in parallel
+  const { player, loading: playerLoading } = usePlayer(playerId);
   const { prediction, loading: predictionLoading } = usePlayerPrediction(playerId);
-  
-  const player = playersData?.players.find(p => p.id === playerId);
 
-  if (playersLoading || predictionLoading) {
+  if (playerLoading || predictionLoading) {
     return (
       <DashboardLayout>
         <div className="flex items-center justify-center min-h-96">
@@ -1,12 +1,19 @@
 import React from 'react';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts';
-import { usePositionStats } from '@/lib/hooks/usePlayers';
-import { usePredictionSummary, generateAllPredictions } from '@/lib/hooks/usePredictions';
+import { Dashboard } from '@/lib/hooks/useDashboard';
+import { generateAllPredictions } from '@/lib/hooks/usePredictions';
 import { Users, TrendingUp, Target, Activity, Zap, AlertTriangle } from 'lucide-react';
 
-export default function DashboardStats() {
-  const { stats, loading: playersLoading, error: playersError } = usePositionStats();
-  const { summary, loading: predictionsLoading, error: predictionsError } = usePredictionSummary();
+interface DashboardStatsProps {
+  dashboard: Dashboard | null;
+  loading: boolean;
+  error: string | null;
+}
+
+export default function DashboardStats({ dashboard, loading, error }: DashboardStatsProps) {
+  // Position counts and the prediction summary both come from the dashboard response
+  const stats = dashboard;
+  const summary = dashboard?.summary;
   const [isGenerating, setIsGenerating] = React.useState(false);
 
   const handleGeneratePredictions = async () => {
@@ -22,7 +29,7 @@ export default function DashboardStats() {
     }
   };
 
-  if (playersLoading || predictionsLoading) {
+  if (loading) {
     return (
       <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8">
         {[...Array(6)].map((_, i) => (
@@ -35,10 +42,10 @@ export default function DashboardStats() {
     );
   }
 
-  if (playersError) {
+  if (error) {
     return (
       <div className="bg-red-50 border border-red-200 rounded-lg p-4 mb-8">
-        <p className="text-red-600">Error loading stats: {playersError}</p>
+        <p className="text-red-600">Error loading stats: {error}</p>
       </div>
     );
   }
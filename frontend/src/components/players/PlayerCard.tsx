@@ -1,11 +1,13 @@
 import React from 'react';
 import Link from 'next/link';
 import { Player } from '@/lib/hooks/usePlayers';
-import { usePlayerPrediction } from '@/lib/hooks/usePredictions';
+import { PlayerPrediction } from '@/lib/hooks/usePredictions';
 import { User, MapPin, Calendar, GraduationCap, TrendingUp, Activity, Zap, AlertTriangle, ArrowRight } from 'lucide-react';
 
 interface PlayerCardProps {
   player: Player;
+  prediction: PlayerPrediction | null;
+  predictionLoading: boolean;
 }
 
 const positionColors = {
@@ -17,8 +19,7 @@ const positionColors = {
   DST: 'bg-gray-100 text-gray-800 border-gray-200',
 };
 
-export default function PlayerCard({ player }: PlayerCardProps) {
-  const { prediction, loading: predictionLoading } = usePlayerPrediction(player.id);
+export default function PlayerCard({ player, prediction, predictionLoading }: PlayerCardProps) {
   const positionColor = positionColors[player.position as keyof typeof positionColors] || positionColors.DST;
 
   const getBreakoutColor = (score: number) => {
@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
 import { usePlayers, createSamplePlayers } from '@/lib/hooks/usePlayers';
+import { usePredictionsBatch } from '@/lib/hooks/usePredictions';
 import PlayerCard from './PlayerCard';
 import { Search, Filter, Plus, RefreshCw } from 'lucide-react';
 
@@ -14,6 +15,11 @@ export default function PlayersList() {
     limit: 20
   });
 
+  // One batch request for the page's predictions instead of one per card
+  const { predictions, loading: predictionsLoading } = usePredictionsBatch(
+    data?.players.map(player => player.id) ?? []
+  );
+
   const handleCreateSample = async () => {
     try {
       setIsCreating(true);
@@ -148,13 +154,18 @@ export default function PlayersList() {
       {data && data.players.length > 0 && (
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6">
           {data.players.map((player) => (
-            <PlayerCard key={player.id} player={player} />
+            <PlayerCard
+              key={player.id}
+              player={player}
+              prediction={predictions[player.id] ?? null}
+              predictionLoading={predictionsLoading}
+            />
           ))}
         </div>
       )}
 
       {/* Pagination Info */}
-      {data && data.total > data.limit && (
+      {data && data.total !== null && data.total > data.limit && (
         <div className="flex justify-center">
           <p className="text-gray-600">
             Showing {data.players.length} of {data.total} players
@@ -1,10 +1,15 @@
 import React from 'react';
-import { useBreakoutCandidates } from '@/lib/hooks/usePredictions';
+import { PlayerPrediction } from '@/lib/hooks/usePredictions';
 import PredictionCard from './PredictionCard';
 import { TrendingUp, Zap, Target } from 'lucide-react';
 
-export default function BreakoutCandidates() {
-  const { candidates, loading, error } = useBreakoutCandidates();
+interface BreakoutCandidatesProps {
+  candidates: PlayerPrediction[];
+  loading: boolean;
+  error: string | null;
+}
+
+export default function BreakoutCandidates({ candidates, loading, error }: BreakoutCandidatesProps) {
 
   if (loading) {
     return (
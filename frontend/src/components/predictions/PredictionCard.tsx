@@ -98,12 +98,14 @@ export default function PredictionCard({ prediction }: PredictionCardProps) {
       )}
 
       {/* Reasoning */}
-      <div className="mb-4 p-3 bg-gray-50 rounded-lg">
-        <div className="text-xs text-gray-500 mb-1">AI Analysis</div>
-        <p className="text-sm text-gray-700 leading-relaxed">
-          {prediction.reasoning}
-        </p>
-      </div>
+      {prediction.reasoning && (
+        <div className="mb-4 p-3 bg-gray-50 rounded-lg">
+          <div className="text-xs text-gray-500 mb-1">AI Analysis</div>
+          <p className="text-sm text-gray-700 leading-relaxed">
+            {prediction.reasoning}
+          </p>
+        </div>
+      )}
 
       {/* Projected Stats */}
       {prediction.projected_stats && (
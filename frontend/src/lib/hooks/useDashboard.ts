@@ -0,0 +1,42 @@
+import { useState, useEffect } from 'react';
+import axios from 'axios';
+import { PositionStats } from './usePlayers';
+import { PlayerPrediction, PositionRanking, PredictionSummary } from './usePredictions';
+
+const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+
+export interface Dashboard {
+  season: number;
+  summary: PredictionSummary;
+  position_stats: PositionStats[];
+  total_players: number;
+  breakout_candidates: PlayerPrediction[];
+  // Top players per position, keyed by position
+  rankings: Record<string, PositionRanking[]>;
+}
+
+// Summary, position counts, breakout candidates and rankings in a single request
+export function useDashboard(season: number = 2025) {
+  const [dashboard, setDashboard] = useState<Dashboard | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    const fetchDashboard = async () => {
+      try {
+        setLoading(true);
+        const response = await axios.get(`${API_URL}/api/dashboard?season=${season}`);
+        setDashboard(response.data);
+        setError(null);
+      } catch (err) {
+        setError(err instanceof Error ? err.message : 'Failed to fetch dashboard');
+      } finally {
+        setLoading(false);
+      }
+    };
+
+    fetchDashboard();
+  }, [season]);
+
+  return { dashboard, loading, error };
+}
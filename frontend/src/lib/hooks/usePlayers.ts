@@ -18,9 +18,10 @@ export interface Player {
 
 export interface PlayersResponse {
   players: Player[];
-  total: number;
-  page: number;
+  total: number | null;
+  page: number | null;
   limit: number;
+  next_cursor: string | null;
 }
 
 export interface PositionStats {
@@ -33,6 +34,7 @@ export function usePlayers(options?: {
   search?: string;
   page?: number;
   limit?: number;
+  cursor?: string;
 }) {
   const [data, setData] = useState<PlayersResponse | null>(null);
   const [loading, setLoading] = useState(true);
@@ -48,8 +50,10 @@ export function usePlayers(options?: {
         if (options?.search) params.append('search', options.search);
         if (options?.page) params.append('page', options.page.toString());
         if (options?.limit) params.append('limit', options.limit.toString());
+        if (options?.cursor) params.append('cursor', options.cursor);
 
-        const response = await axios.get(`${API_URL}/api/players?${params}`);
+        // Trailing slash matches the route, saving a redirect round trip
+        const response = await axios.get(`${API_URL}/api/players/?${params}`);
         setData(response.data);
         setError(null);
       } catch (err) {
@@ -60,11 +64,76 @@ export function usePlayers(options?: {
     };
 
     fetchPlayers();
-  }, [options?.position, options?.search, options?.page, options?.limit]);
+  }, [options?.position, options?.search, options?.page, options?.limit, options?.cursor]);
 
   return { data, loading, error, refetch: () => setLoading(true) };
 }
 
+export function usePlayer(playerId: string) {
+  const [player, setPlayer] = useState<Player | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<string | null>(null);
+
+  useEffect(() => {
+    if (!playerId) return;
+
+    const fetchPlayer = async () => {
+      try {
+        setLoading(true);
+        const response = await axios.get(`${API_URL}/api/players/${playerId}`);
+        setPlayer(response.data);
+        setError(null);
+      } catch (err) {
+        if (axios.isAxiosError(err) && err.response?.status === 404) {
+          setPlayer(null);
+          setError(null);
+        } else {
+          setError(err instanceof Error ? err.message : 'Failed to fetch player');
+        }
+      } finally {
+        setLoading(false);
+      }
+    };
+
+    fetchPlayer();
+  }, [playerId]);
+
+  return { player, loading, error };
+}
+
+// Several players in one request, in the order given
+export function usePlayersBatch(playerIds: string[]) {
+  const [players, setPlayers] = useState<Player[]>([]);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<string | null>(null);
+  const ids = playerIds.join(',');
+
+  useEffect(() => {
+    if (!ids) {
+      setPlayers([]);
+      setLoading(false);
+      return;
+    }
+
+    const fetchPlayers = async () => {
+      try {
+        setLoading(true);
+        const response = await axios.get(`${API_URL}/api/players/batch?ids=${encodeURIComponent(ids)}`);
+        setPlayers(response.data);
+        setError(null);
+      } catch (err) {
+        setError(err instanceof Error ? err.message : 'Failed to fetch players');
+      } finally {
+        setLoading(false);
+      }
+    };
+
+    fetchPlayers();
+  }, [ids]);
+
+  return { players, loading, error };
+}
+
 export function usePositionStats() {
   const [stats, setStats] = useState<{
     position_stats: PositionStats[];
@@ -12,8 +12,9 @@ export interface PlayerPrediction {
   season: number;
   predicted_points: number;
   confidence: number;
-  reasoning: string;
-  projected_stats: Record<string, any> | null;
+  // Only rendered when requested with include_reasoning (always for a single player)
+  reasoning: string | null;
+  projected_stats: Record<string, number> | null;
   breakout_score: number;
   bust_risk: number;
   created_at: string;
@@ -27,14 +28,29 @@ export interface PredictionSummary {
   bust_risks: number;
 }
 
+export interface Job {
+  id: string;
+  job_type: string;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  total: number;
+  processed: number;
+  progress: number;
+  result: Record<string, any> | null;
+  error: string | null;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+}
+
 export interface PositionRanking {
   rank: number;
+  tier: number;
   player_name: string;
   team: string;
   predicted_points: number;
   confidence: number;
   breakout_score: number;
-  reasoning: string;
+  reasoning: string | null;
 }
 
 export function usePredictions(options?: {
@@ -42,6 +58,10 @@ export function usePredictions(options?: {
   position?: string;
   min_confidence?: number;
   min_breakout_score?: number;
+  sort_by?: string;
+  include_reasoning?: boolean;
+  // Built-in profile ID (standard, half_ppr, ppr, six_point_passing_td) or a custom profile's id
+  scoring_profile?: string;
   limit?: number;
 }) {
   const [data, setData] = useState<PlayerPrediction[]>([]);
@@ -58,9 +78,13 @@ export function usePredictions(options?: {
         if (options?.position) params.append('position', options.position);
         if (options?.min_confidence !== undefined) params.append('min_confidence', options.min_confidence.toString());
         if (options?.min_breakout_score !== undefined) params.append('min_breakout_score', options.min_breakout_score.toString());
+        if (options?.sort_by) params.append('sort_by', options.sort_by);
+        if (options?.include_reasoning) params.append('include_reasoning', 'true');
+        if (options?.scoring_profile) params.append('scoring_profile', options.scoring_profile);
         if (options?.limit) params.append('limit', options.limit.toString());
 
-        const response = await axios.get(`${API_URL}/api/predictions?${params}`);
+        // Trailing slash matches the route, saving a redirect round trip
+        const response = await axios.get(`${API_URL}/api/predictions/?${params}`);
         setData(response.data);
         setError(null);
       } catch (err) {
@@ -71,7 +95,7 @@ export function usePredictions(options?: {
     };
 
     fetchPredictions();
-  }, [options?.season, options?.position, options?.min_confidence, options?.min_breakout_score, options?.limit]);
+  }, [options?.season, options?.position, options?.min_confidence, options?.min_breakout_score, options?.sort_by, options?.include_reasoning, options?.scoring_profile, options?.limit]);
 
   return { data, loading, error, refetch: () => setLoading(true) };
 }
@@ -108,6 +132,41 @@ export function usePlayerPrediction(playerId: string, season: number = 2025) {
   return { prediction, loading, error };
 }
 
+// Predictions for a page of players in one request, keyed by player id
+export function usePredictionsBatch(playerIds: string[], season: number = 2025) {
+  const [predictions, setPredictions] = useState<Record<string, PlayerPrediction>>({});
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<string | null>(null);
+  const ids = playerIds.join(',');
+
+  useEffect(() => {
+    if (!ids) {
+      setPredictions({});
+      setLoading(false);
+      return;
+    }
+
+    const fetchPredictions = async () => {
+      try {
+        setLoading(true);
+        const response = await axios.get<PlayerPrediction[]>(
+          `${API_URL}/api/predictions/batch?player_ids=${encodeURIComponent(ids)}&season=${season}`
+        );
+        setPredictions(Object.fromEntries(response.data.map(prediction => [prediction.player_id, prediction])));
+        setError(null);
+      } catch (err) {
+        setError(err instanceof Error ? err.message : 'Failed to fetch predictions');
+      } finally {
+        setLoading(false);
+      }
+    };
+
+    fetchPredictions();
+  }, [ids, season]);
+
+  return { predictions, loading, error };
+}
+
 export function useBreakoutCandidates(season: number = 2025, minScore: number = 0.6, limit: number = 20) {
   const [candidates, setCandidates] = useState<PlayerPrediction[]>([]);
   const [loading, setLoading] = useState(true);
@@ -117,7 +176,7 @@ export function useBreakoutCandidates(season: number = 2025, minScore: number =
     const fetchCandidates = async () => {
       try {
         setLoading(true);
-        const response = await axios.get(`${API_URL}/api/predictions/breakout-candidates?season=${season}&min_score=${minScore}&limit=${limit}`);
+        const response = await axios.get(`${API_URL}/api/predictions/breakout-candidates?season=${season}&min_score=${minScore}&limit=${limit}&include_reasoning=true`);
         setCandidates(response.data);
         setError(null);
       } catch (err) {
@@ -158,7 +217,7 @@ export function usePredictionSummary(season: number = 2025) {
   return { summary, loading, error };
 }
 
-export function usePositionRankings(position: string, season: number = 2025) {
+export function usePositionRankings(position: string, season: number = 2025, scoringProfile: string = 'standard') {
   const [rankings, setRankings] = useState<PositionRanking[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -169,7 +228,7 @@ export function usePositionRankings(position: string, season: number = 2025) {
     const fetchRankings = async () => {
       try {
         setLoading(true);
-        const response = await axios.get(`${API_URL}/api/predictions/position-rankings/${position}?season=${season}`);
+        const response = await axios.get(`${API_URL}/api/predictions/position-rankings/${position}?season=${season}&scoring_profile=${scoringProfile}`);
         setRankings(response.data.rankings);
         setError(null);
       } catch (err) {
@@ -180,7 +239,7 @@ export function usePositionRankings(position: string, season: number = 2025) {
     };
 
     fetchRankings();
-  }, [position, season]);
+  }, [position, season, scoringProfile]);
 
   return { rankings, loading, error };
 }
@@ -195,10 +254,23 @@ export async function generatePlayerPrediction(playerId: string, season: number
   }
 }
 
+// Poll a background job until it completes or fails
+export async function waitForJob(jobId: string, intervalMs: number = 1000): Promise<Job> {
+  while (true) {
+    const response = await axios.get<Job>(`${API_URL}/api/jobs/${jobId}`);
+    const job = response.data;
+
+    if (job.status === 'completed') return job;
+    if (job.status === 'failed') throw new Error(job.error || 'Job failed');
+
+    await new Promise(resolve => setTimeout(resolve, intervalMs));
+  }
+}
+
 export async function generateAllPredictions(season: number = 2025) {
   try {
     const response = await axios.post(`${API_URL}/api/predictions/generate-all?season=${season}`);
-    return response.data;
+    return await waitForJob(response.data.job_id);
   } catch (error) {
     throw new Error(error instanceof Error ? error.message : 'Failed to generate predictions');
   }